@@ -1,7 +1,7 @@
 import os
 
 
-def Generate(Directory: str, FileExtension = "pyi") -> str:
+def Generate(Directory: str, FileExtension = "pyi", bWriteTimingReport = False) -> str:
     """ 
     Generate a stub file for the pyfbsdk module. \\
     This may take a while since the online MoBu sdk documentation will have to be parsed.
@@ -9,6 +9,7 @@ def Generate(Directory: str, FileExtension = "pyi") -> str:
     ## Parameters:
         - directory: The absolute path to the directory where the pyfbsdk stub file should be created
         - fileExtension: The file extension
+        - bWriteTimingReport: Print the time spent in each step of the generation, and write it to a JSON file next to the stub file
 
     ## Returns:
     The filepath to the generated file 
@@ -23,4 +24,88 @@ def Generate(Directory: str, FileExtension = "pyi") -> str:
 
     Filepath = os.path.join(Directory, f"pyfbsdk.{FileExtension}")
 
-    return GeneratePyfbsdkStubFile(Filepath)
+    return GeneratePyfbsdkStubFile(Filepath, bWriteTimingReport)
+
+
+def ExportSnapshot(Filepath: str) -> str:
+    """
+    Export a snapshot of the pyfbsdk module, that can be used to generate the stub file outside of MotionBuilder. \\
+    This is fast compared to `Generate`, since no documentation has to be parsed.
+
+    ## Parameters:
+        - Filepath: The absolute filepath of the snapshot, e.g. `C:/pyfbsdk_2025.json.gz`
+
+    ## Returns:
+    The filepath to the snapshot
+    """
+    try:
+        import pyfbsdk
+    except ModuleNotFoundError as e:
+        raise ImportError(f"{ExportSnapshot.__name__} can only be called upon from within MotionBuilder.") from e
+
+    from .snapshot import ExportSnapshot as _ExportSnapshot
+    from .stub_generator import GetMotionBuilderVersion
+
+    return _ExportSnapshot(pyfbsdk, Filepath, GetMotionBuilderVersion())
+
+
+def GenerateFromSnapshot(SnapshotFilepath: str, Directory: str, FileExtension = "pyi", bWriteTimingReport = False) -> str:
+    """
+    Generate a stub file for the pyfbsdk module from a snapshot created with `ExportSnapshot`. \\
+    Can be called upon from any Python interpreter, MotionBuilder is not required.
+
+    ## Parameters:
+        - SnapshotFilepath: The absolute filepath of the snapshot
+        - directory: The absolute path to the directory where the pyfbsdk stub file should be created
+        - fileExtension: The file extension
+        - bWriteTimingReport: Print the time spent in each step of the generation, and write it to a JSON file next to the stub file
+
+    ## Returns:
+    The filepath to the generated file
+    """
+    # Load the snapshot before importing the generator, since some plugins imports the module by name
+    from .snapshot import LoadSnapshot
+    Module, Version = LoadSnapshot(SnapshotFilepath)
+
+    from .stub_generator import GenerateModuleStub
+
+    Filepath = os.path.join(Directory, f"{Module.__name__}.{FileExtension}")
+
+    return GenerateModuleStub(Module, Filepath, bWriteTimingReport, Version)
+
+
+def ExportDocumentationBundle(Filepath: str, Version: int) -> str:
+    """
+    Download the online documentation for a MotionBuilder version into a single bundle file. \\
+    Use the bundle with `UseDocumentationBundle` to generate stub files without internet access.
+    Can be called upon from any Python interpreter, MotionBuilder is not required.
+
+    ## Parameters:
+        - Filepath: The absolute filepath of the bundle, e.g. `C:/pyfbsdk_documentation_2025.zip`
+        - Version: The MotionBuilder version, e.g. 2025
+
+    ## Returns:
+    The filepath to the bundle
+    """
+    from .plugins.online_documentation.documentation_scraper.table_of_contents import ExportDocumentationBundle as _ExportDocumentationBundle
+
+    return _ExportDocumentationBundle(Filepath, Version)
+
+
+def UseDocumentationBundle(Filepath: str, bOffline = True):
+    """
+    Read the online documentation from a bundle created with `ExportDocumentationBundle` when generating stub files. \\
+    The settings are stored in environment variables, so they also apply to any subprocesses.
+
+    ## Parameters:
+        - Filepath: The absolute filepath of the bundle. Calling this multiple times adds more bundles, e.g. for other versions.
+        - bOffline: Never download anything, documentation that is missing from the bundle raises an error instead.
+    """
+    from .plugins.online_documentation.documentation_scraper import documentation_cache, http_client
+
+    Filepaths = documentation_cache.GetBundleFilepaths()
+    if Filepath not in Filepaths:
+        Filepaths.append(Filepath)
+    os.environ[documentation_cache.BUNDLE_ENV_VARIABLE] = os.pathsep.join(Filepaths)
+
+    os.environ[http_client.OFFLINE_ENV_VARIABLE] = str(bOffline)
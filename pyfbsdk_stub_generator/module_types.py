@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import typing
+import io
+
 ALWAYS_CREATE_ELLIPSIS = True
 TAB_CHARACTER = "    "
 
@@ -9,6 +12,9 @@ def Indent(Text: str):
 
 
 class StubBase():
+    # Slots instead of a __dict__, since a lot of stubs are created (one for every parameter of every function)
+    __slots__ = ("Ref", "Name", "DocString")
+
     def __init__(self, Ref, Name = "") -> None:
         self.Ref = Ref
         self.Name: str = Name
@@ -23,6 +29,12 @@ class StubBase():
         """
         raise NotImplementedError("GetAsString() has not yet been implemented")
 
+    def Render(self, Writer: typing.TextIO):
+        """
+        Write instance as python code to the writer, e.g. an open file
+        """
+        Writer.write(self.GetAsString())
+
     def GetDocString(self):
         if self.DocString:
             return f'""\"{self.DocString.strip()}"""'
@@ -36,6 +48,8 @@ class StubBase():
 
 
 class StubFunction(StubBase):
+    __slots__ = ("_Params", "_ReturnType", "bIsMethod", "bIsStatic", "bIsOverload")
+
     def __init__(self, Ref, Name = "", Parameters: list[StubParameter] | None = None, ReturnType: str | None = None):
         super().__init__(Ref, Name = Name)
         self._Params: list[StubParameter] = Parameters if Parameters else []
@@ -120,6 +134,8 @@ class StubFunction(StubBase):
 
 
 class StubClass(StubBase):
+    __slots__ = ("Parents", "StubProperties", "StubEnums", "StubFunctions", "_FunctionMap", "_PropertyMap")
+
     def __init__(self, Ref, Name = ""):
         super().__init__(Ref, Name = Name)
         self.Parents = []
@@ -127,16 +143,19 @@ class StubClass(StubBase):
         self.StubEnums: list[StubClass] = []
         self.StubFunctions: list[list[StubFunction]] = []
 
+        # Name lookups, kept up to date by the Add* methods. If multiple members share a name, the first one is used.
+        # Note: The member lists should only be modified through the Add* methods to keep these in sync.
+        self._FunctionMap: dict[str, list[StubFunction]] = {}
+        self._PropertyMap: dict[str, StubProperty] = {}
+
     def GetFunctionsByName(self, Name: str):
-        for FunctionGroup in self.StubFunctions:
-            if FunctionGroup[0].Name == Name:
-                return FunctionGroup
-        return []
+        return self._FunctionMap.get(Name, [])
 
     def GetPropertyByName(self, Name: str):
-        for x in self.StubProperties:
-            if x.Name == Name:
-                return x
+        return self._PropertyMap.get(Name)
+
+    def HasFunction(self, Name: str) -> bool:
+        return Name in self._FunctionMap
 
     def AddEnum(self, Enum: StubClass):
         self.StubEnums.append(Enum)
@@ -145,6 +164,8 @@ class StubClass(StubBase):
         for Function in Functions:
             Function.bIsMethod = True  # Make function a method
         self.StubFunctions.append(Functions)
+        if Functions:
+            self._FunctionMap.setdefault(Functions[0].Name, Functions)
 
     def GetFunctionsFlat(self) -> list[StubFunction]:
         """ Get a flat list of functions """
@@ -152,6 +173,7 @@ class StubClass(StubBase):
 
     def AddProperty(self, Property: StubProperty):
         self.StubProperties.append(Property)
+        self._PropertyMap.setdefault(Property.Name, Property)
 
     def AddParent(self, Parent: str):
         self.Parents.append(Parent)
@@ -166,27 +188,37 @@ class StubClass(StubBase):
             FunctionRequirements += Function.GetRequirements()
         return self.Parents + FunctionRequirements
 
-    def GetAsString(self):
+    def Render(self, Writer: typing.TextIO):
         ParentClassesAsString = ','.join(self.Parents)
 
-        ClassAsString = f"class {self.Name}({ParentClassesAsString}):\n"
+        Writer.write(f"class {self.Name}({ParentClassesAsString}):\n")
 
-        if self.GetDocString():
-            ClassAsString += f"{Indent(self.GetDocString())}\n"
+        DocString = self.GetDocString()
+        if DocString:
+            Writer.write(f"{Indent(DocString)}\n")
 
         ClassMembers = self.StubEnums + self.StubProperties + self.GetFunctionsFlat()
-        for StubObject in ClassMembers:
-            ClassAsString += f"{Indent(StubObject.GetAsString())}\n"
 
         # If class doesn't have any members, add a '...'
-
         if not ClassMembers:
-            ClassAsString += Indent("...")
+            Writer.write(Indent("..."))
+            return
 
-        return ClassAsString.strip()
+        for StubObject in ClassMembers[:-1]:
+            Writer.write(f"{Indent(StubObject.GetAsString())}\n")
+
+        # The class doesn't end with a new line, or any trailing whitespace from the last member
+        Writer.write(Indent(ClassMembers[-1].GetAsString()).rstrip())
+
+    def GetAsString(self):
+        Writer = io.StringIO()
+        self.Render(Writer)
+        return Writer.getvalue()
 
 
 class StubProperty(StubBase):
+    __slots__ = ("_Type", "SetterType")
+
     def __init__(self, Ref, Name = ""):
         super().__init__(Ref, Name = Name)
         self._Type = None
@@ -231,6 +263,8 @@ class StubProperty(StubBase):
 
 
 class StubParameter(StubBase):
+    __slots__ = ("DefaultValue", "_Type")
+
     def __init__(self, Ref, Name = "", Type = "", DefaultValue = None):
         super().__init__(Ref, Name = Name)
         self.DefaultValue = DefaultValue
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 import inspect
+import weakref
 import typing
 import types
 
@@ -8,10 +10,12 @@ from types import ModuleType
 from importlib import reload
 
 from . import module_types
+from . import signature_parser
 from .module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 
 reload(module_types)
+reload(signature_parser)
 
 ENUMERATION_NAME = "Enumeration"
 ALLOWED_BUILTIN_OVERRIDES = {"__gt__", "__lt__", "__ge__", "__le__"}
@@ -51,22 +55,103 @@ def IsMethodStatic(Class, MethodName: str):
     return isinstance(inspect.getattr_static(Class, MethodName), staticmethod)
 
 
+class ModuleInventory():
+    """
+    All members of a module that the generator uses, classified in a single pass over the module.
+    Use `GetModuleInventory` to get a shared instance instead of creating a new one.
+    """
+    def __init__(self, Module: ModuleType):
+        self.ModuleName = Module.__name__
+        self.Functions = []
+        self.Classes = []
+        self.Enums = []
+
+        for _, Member in inspect.getmembers(Module):
+            Type = GetObjectType(Member)
+            if Type == FObjectType.Function:
+                if not IsPrivate(Member):
+                    self.Functions.append(Member)
+            elif Type == FObjectType.Class:
+                self.Classes.append(Member)
+            elif Type == FObjectType.Enum:
+                self.Enums.append(Member)
+
+        self.ClassNames = [x.__name__ for x in self.Classes + self.Enums]
+        self.ClassNameSet = frozenset(self.ClassNames)
+        self._NonEnumClassNames = frozenset(x.__name__ for x in self.Classes)
+
+    def HasClass(self, Name: str, bIncludeEnums = True) -> bool:
+        """
+        Check if the module has a class with the given name
+
+        ### Parameters:
+            - Name: The class name
+            - bIncludeEnums: Also check the enums
+        """
+        if bIncludeEnums:
+            return Name in self.ClassNameSet
+        return Name in self._NonEnumClassNames
+
+
+_ModuleInventories: weakref.WeakKeyDictionary[ModuleType, ModuleInventory] = weakref.WeakKeyDictionary()
+_ModuleInventoriesLock = threading.Lock()
+
+
+def GetModuleInventory(Module: ModuleType, bRefresh = False) -> ModuleInventory:
+    """
+    Get the inventory of a module, it's only created the first time it's requested for each module.
+
+    ### Parameters:
+        - Module: The module, e.g. pyfbsdk
+        - bRefresh: Re-create the inventory, e.g. if the module's content has been modified
+    """
+    with _ModuleInventoriesLock:
+        Inventory = _ModuleInventories.get(Module)
+        if Inventory is None or bRefresh:
+            Inventory = _ModuleInventories[Module] = ModuleInventory(Module)
+        return Inventory
+
+
 def GetModuleContent(Module: ModuleType):
     """ 
     Get all members in the pyfbsdk module
     returns: a tuple with (Functions, Classes, Enums)
     """
-    Functions = [x[1] for x in inspect.getmembers(Module) if GetObjectType(x[1]) == FObjectType.Function and not IsPrivate(x[1])]
-    Classes = [x[1] for x in inspect.getmembers(Module) if GetObjectType(x[1]) == FObjectType.Class]
-    Enums = [x[1] for x in inspect.getmembers(Module) if GetObjectType(x[1]) == FObjectType.Enum]
-
-    return (Functions, Classes, Enums)
+    Inventory = GetModuleInventory(Module)
+    return (list(Inventory.Functions), list(Inventory.Classes), list(Inventory.Enums))
 
 
 def GetClassParents(Class):
     return Class.__bases__
 
 
+# Weakly keyed, so classes of modules that are no longer used (e.g. loaded from a snapshot) aren't kept alive
+_ClassMemberNames: weakref.WeakKeyDictionary[type, frozenset[str]] = weakref.WeakKeyDictionary()
+
+
+def GetClassMemberNames(Class) -> frozenset[str]:
+    """
+    Get the names of all members of a class, including inherited ones (same names as `dir(Class)`).
+    The result is cached, so each class in a hierarchy is only walked once.
+    """
+    MemberNames = _ClassMemberNames.get(Class)
+    if MemberNames is None:
+        MemberNames = frozenset(vars(Class)).union(*(GetClassMemberNames(Base) for Base in GetClassParents(Class)))
+        _ClassMemberNames[Class] = MemberNames
+    return MemberNames
+
+
+def _GetClassMember(Class, Name: str):
+    """ Get a class member the same way as `inspect.getmembers`, raises AttributeError if it can't be found """
+    try:
+        return getattr(Class, Name)
+    except AttributeError:
+        for Base in inspect.getmro(Class):
+            if Name in vars(Base):
+                return vars(Base)[Name]
+        raise
+
+
 def GetUniqueClassMembers(Class, Ignore = (), AllowedOverrides = ()):
     """ 
     Args:
@@ -76,24 +161,32 @@ def GetUniqueClassMembers(Class, Ignore = (), AllowedOverrides = ()):
 
     Returns: tuple("Name", Reference)
     """
-    Members = inspect.getmembers(Class)
     ParentClass = GetClassParents(Class)[0]
+    ParentMemberNames = GetClassMemberNames(ParentClass)
 
     UniqueMemebers = []
-    for Name, Ref in Members:
+    for Name in sorted(GetClassMemberNames(Class)):
         if Name in Ignore:
             continue
 
-        if hasattr(ParentClass, Name):
-            if ParentClass.__name__ == "instance":
-                if isinstance(Ref, (types.BuiltinFunctionType, types.BuiltinMethodType)) and Name in ALLOWED_BUILTIN_OVERRIDES:
+        # Only names that doesn't exist in the parent's members needs to be looked up, e.g. attributes from the metaclass
+        if Name in ParentMemberNames or hasattr(ParentClass, Name):
+            if ParentClass.__name__ == "instance" and Name in ALLOWED_BUILTIN_OVERRIDES:
+                try:
+                    Ref = _GetClassMember(Class, Name)
+                except AttributeError:
+                    continue
+                if isinstance(Ref, (types.BuiltinFunctionType, types.BuiltinMethodType)):
                     UniqueMemebers.append((Name, Ref))
                     continue
 
             if Name not in AllowedOverrides:
                 continue
 
-        UniqueMemebers.append((Name, Ref))
+        try:
+            UniqueMemebers.append((Name, _GetClassMember(Class, Name)))
+        except AttributeError:
+            continue
 
     return UniqueMemebers
 
@@ -119,51 +212,18 @@ def GetFunctionInfoFromDocString(Function: typing.Callable) -> list[tuple[list[S
 
     Returns: a list of tuple([Parameters], ReturnType)
     """
-    def _GenerateParams(ParamsString, DefaultValue = None) -> list[StubParameter]:
-        """ 
-        Parse a param string that looks something like this:
-        "(FBVector4d)arg1, (FBVector4d)arg2, (FBVector4d)arg3"
-        and generate StubParameter instances from it
-        """
-        Params = []
-        for Param in ParamsString.split(","):
-            # Param will now look something like this: '(str)arg1'
-            ParamType, _, ParamName = Param.strip().partition(")")
-            ParameterInstance = StubParameter(Function, ParamName, ParamType[1:], DefaultValue = DefaultValue)
-            Params.append(ParameterInstance)
-        return Params
-
     if not Function.__doc__:  # No docstring
         return []
 
     FunctionParamters = []
-    # Read the docstring and split it up if there are multiple function overrides
-    FunctionsDocs = [x for x in Function.__doc__.split("\n") if x]
-    for Doc in FunctionsDocs:
-        # Make sure `Doc` now follows this format: "FunctionName( (str)arg1 [, (object)arg2]) -> object"
-        if not Doc.strip().startswith(Function.__name__) or not all(x in Doc for x in ["->", "(", ")"]):
-            continue
-
-        # 'Doc' will now look something like this:
-        # ShowToolByName( (str)arg1 [, (object)arg2]) -> object
-        Doc = Doc.partition("(")[2]  # Remove function name
-        Params, _, ReturnType = Doc.rpartition("->")
-        
-        ReturnType = ReturnType.strip(" :")
-
-        # Split params into required & optional
-        Params = Params.rpartition(")")[0]
-        RequiredParams, _, OptionalParams = Params.partition("[")
-        OptionalParams = OptionalParams.replace("[", "").replace("]", "").lstrip(',')
-
-        Params = []
-        if RequiredParams.strip():
-            Params += _GenerateParams(RequiredParams)
-        if OptionalParams.strip():
-            Params += _GenerateParams(OptionalParams, DefaultValue = "None")
-
+    # The parsed signatures are shared between functions with the same docstring, so new parameters are created from them
+    for Signature in signature_parser.ParseDocString(Function.__name__, Function.__doc__):
+        Params = [
+            StubParameter(Function, Parameter.Name, Parameter.Type, DefaultValue = "None" if Parameter.bIsOptional else None)
+            for Parameter in Signature.Parameters
+        ]
         FunctionParamters.append(
-            (Params, ReturnType.strip())
+            (Params, Signature.ReturnType)
         )
 
     return FunctionParamters
@@ -277,15 +337,13 @@ def GenerateFunctionInstances(Function) -> list[StubFunction]:
 # -------------------------------------------------------------
 
 def GenerateModuleSubs(Module: ModuleType):
-    Functions, Classes, Enums = GetModuleContent(Module)
-
-    AllClassNames = [x.__name__ for x in Classes + Enums]
+    Inventory = GetModuleInventory(Module)
 
-    EnumStubs = [GenerateEnumInstance(Enum) for Enum in Enums]
-    ClassStubs = [GenerateClassInstance(Class, AllClassNames) for Class in Classes]
+    EnumStubs = [GenerateEnumInstance(Enum) for Enum in Inventory.Enums]
+    ClassStubs = [GenerateClassInstance(Class, Inventory.ClassNames) for Class in Inventory.Classes]
 
     FunctionStubs: list[list[StubFunction]] = []
-    for Function in Functions:
+    for Function in Inventory.Functions:
         FunctionStubs.append(GenerateFunctionInstances(Function))
 
     return EnumStubs, ClassStubs, FunctionStubs
@@ -0,0 +1,176 @@
+"""
+Runs the plugins' patch phases in parallel where possible.
+
+Each plugin patches the stubs in one phase per stub kind (enums, classes & functions).
+A phase has to wait for all phases before it (in the serial Priority order) that it conflicts with,
+i.e. phases that write to something it reads/writes, or that read from something it writes.
+This way the end result is the same as running all plugins one after another.
+"""
+from __future__ import annotations
+
+import threading
+import typing
+import time
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .plugins import PluginBaseClass, EStubKind
+from .timing import TimingReport
+
+
+class PluginPhase():
+    def __init__(self, PluginType: type[PluginBaseClass], Kind: str, Order: int):
+        self.PluginType = PluginType
+        self.Kind = Kind
+        self.Order = Order  # Index in the serial execution order
+
+        # A phase always reads the kind of stubs it patches, but only writes to it if the plugin says so
+        self.Reads = frozenset(PluginType.Reads) | {Kind}
+        self.Writes = frozenset(PluginType.Writes) & {Kind}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.PluginType.__name__}.{self.Kind}>"
+
+    def ConflictsWith(self, Other: PluginPhase) -> bool:
+        """ Check if the phases touch the same data, and must run in the same order as they would serially """
+        return bool(self.Writes & (Other.Reads | Other.Writes) or self.Reads & Other.Writes)
+
+
+def BuildPhaseGraph(PluginTypes: typing.Sequence[type[PluginBaseClass]]) -> tuple[list[PluginPhase], dict[PluginPhase, set[PluginPhase]]]:
+    """
+    Build a dependency graph of all plugin phases
+
+    ### Parameters:
+        - PluginTypes: The plugins, sorted in the order they would run serially
+
+    ### Returns:
+    A tuple(Phases, Requirements) where Phases are in serial order, and Requirements maps each phase to the phases that must be done before it can start.
+    """
+    Phases: list[PluginPhase] = []
+    PluginPhases: dict[type[PluginBaseClass], list[PluginPhase]] = defaultdict(list)
+    for PluginType in PluginTypes:
+        for Kind in EStubKind.PatchOrder:
+            Phase = PluginPhase(PluginType, Kind, len(Phases))
+            Phases.append(Phase)
+            PluginPhases[PluginType].append(Phase)
+
+    Requirements: dict[PluginPhase, set[PluginPhase]] = {Phase: set() for Phase in Phases}
+    for Index, Phase in enumerate(Phases):
+        for PreviousPhase in Phases[:Index]:
+            if PreviousPhase.ConflictsWith(Phase):
+                Requirements[Phase].add(PreviousPhase)
+
+        for Dependency in Phase.PluginType.Dependencies:
+            Requirements[Phase].update(PluginPhases.get(Dependency, ()))
+
+    ValidatePhaseGraph(Phases, Requirements)
+
+    return Phases, Requirements
+
+
+def ValidatePhaseGraph(Phases: list[PluginPhase], Requirements: dict[PluginPhase, set[PluginPhase]]):
+    """ Raise a ValueError if the plugin dependencies contains a cycle """
+    Visited: set[PluginPhase] = set()
+    Visiting: set[PluginPhase] = set()
+
+    def _Visit(Phase: PluginPhase, Path: list[PluginPhase]):
+        if Phase in Visited:
+            return
+        if Phase in Visiting:
+            Cycle = Path[Path.index(Phase):] + [Phase]
+            raise ValueError(f"Plugin dependencies contains a cycle: {' -> '.join(repr(x) for x in Cycle)}")
+
+        Visiting.add(Phase)
+        for Requirement in sorted(Requirements[Phase], key = lambda x: x.Order):
+            _Visit(Requirement, Path + [Phase])
+        Visiting.discard(Phase)
+        Visited.add(Phase)
+
+    for Phase in Phases:
+        _Visit(Phase, [])
+
+
+def CreatePlugin(PluginType: type[PluginBaseClass], PluginArgs: tuple, Report: TimingReport | None = None) -> PluginBaseClass:
+    """ Create a plugin instance, and make it record it's timings in the report """
+    StartTime = time.perf_counter()
+    Plugin = PluginType(*PluginArgs)
+    if Report:
+        Plugin.Timing = Report.GetPluginTiming(PluginType.__name__)
+        Plugin.Timing.AddPhaseTime("init", time.perf_counter() - StartTime)
+    return Plugin
+
+
+def RecordStatistics(Plugin: PluginBaseClass):
+    """ Add the plugin's statistics to it's timing, if it's being timed """
+    if Plugin.Timing:
+        Plugin.Timing.Statistics = Plugin.GetStatistics()
+
+
+def RunPlugins(PluginTypes: typing.Sequence[type[PluginBaseClass]], PluginArgs: tuple, MaxWorkers: int = 1, Report: TimingReport | None = None):
+    """
+    Create & run all plugins, running independent phases at the same time.
+
+    ### Parameters:
+        - PluginTypes: The plugins, sorted in the order they would run serially
+        - PluginArgs: Arguments passed to each plugin's constructor
+        - MaxWorkers: Max number of phases running at the same time, 1 or lower runs the plugins one after another
+        - Report: If provided, the time spent in each plugin is recorded in it
+    """
+    if MaxWorkers <= 1:
+        for PluginType in PluginTypes:
+            Plugin = CreatePlugin(PluginType, PluginArgs, Report)
+            Plugin.Run()
+            Plugin.Finish()
+            if Report:
+                RecordStatistics(Plugin)
+        return
+
+    Phases, Requirements = BuildPhaseGraph(PluginTypes)
+
+    # Plugins are created right before their first phase starts
+    Plugins: dict[type[PluginBaseClass], PluginBaseClass] = {}
+    PluginLocks = {PluginType: threading.Lock() for PluginType in PluginTypes}
+
+    def _RunPhase(Phase: PluginPhase):
+        with PluginLocks[Phase.PluginType]:
+            if Phase.PluginType not in Plugins:
+                Plugins[Phase.PluginType] = CreatePlugin(Phase.PluginType, PluginArgs, Report)
+        Plugins[Phase.PluginType].RunPhase(Phase.Kind)
+
+    RemainingRequirements = {Phase: len(Requirements[Phase]) for Phase in Phases}
+    Dependents: dict[PluginPhase, list[PluginPhase]] = defaultdict(list)
+    for Phase in Phases:
+        for Requirement in Requirements[Phase]:
+            Dependents[Requirement].append(Phase)
+
+    Errors: list[tuple[PluginPhase, BaseException]] = []
+    with ThreadPoolExecutor(max_workers = MaxWorkers, thread_name_prefix = "PluginPhase") as Executor:
+        Running = {Executor.submit(_RunPhase, Phase): Phase for Phase in Phases if RemainingRequirements[Phase] == 0}
+        while Running:
+            Done, _ = wait(Running, return_when = FIRST_COMPLETED)
+            for Future in Done:
+                Phase = Running.pop(Future)
+                Error = Future.exception()
+                if Error:
+                    Errors.append((Phase, Error))
+                    continue
+
+                # Don't start any new phases once something has failed, only wait for the running ones to finish
+                if Errors:
+                    continue
+
+                for Dependent in sorted(Dependents[Phase], key = lambda x: x.Order):
+                    RemainingRequirements[Dependent] -= 1
+                    if RemainingRequirements[Dependent] == 0:
+                        Running[Executor.submit(_RunPhase, Dependent)] = Dependent
+
+    if Errors:
+        # Raise the error from the phase that would have run first serially
+        Errors.sort(key = lambda x: x[0].Order)
+        raise Errors[0][1]
+
+    for Plugin in Plugins.values():
+        Plugin.Finish()
+        if Report:
+            RecordStatistics(Plugin)
@@ -1,6 +1,6 @@
 from importlib import reload
 
-from .plugin import PluginBaseClass
+from .plugin import PluginBaseClass, EStubKind
 
 
 def GetDefaultPlugins():
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from pyfbsdk_stub_generator.module_types import StubClass, StubFunction
 
-from ..plugin import PluginBaseClass
+from ..plugin import PluginBaseClass, EStubKind
 from ...module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 # Dunder methods that we want to assume they return self
@@ -24,6 +24,8 @@ KNOWN_RETURN_TYPES = {
 class PluginDunderMethods(PluginBaseClass):
     Threading = False
     Priority = 200
+    Reads = frozenset()
+    Writes = frozenset((EStubKind.Classes,))
 
     def PatchClass(self, Class: StubClass):
         for FunctionGroup in Class.StubFunctions:
@@ -50,7 +52,7 @@ class PluginDunderMethods(PluginBaseClass):
             # class is not iterable & not compatible with the typing.Iterable protocol.
             if FunctionGroup[0].Name == "__getitem__":
                 # Make sure we don't add __iter__ twice:
-                if not any(FunctionGroup[0].Name == "__iter__" for FunctionGroup in Class.StubFunctions if FunctionGroup):
+                if not Class.HasFunction("__iter__"):
                     ReturnType = f"Iterator[{FunctionGroup[0].ReturnType}]"
                     Function = StubFunction(None, "__iter__", [StubParameter(None, "self")], ReturnType)
                     Class.AddFunctions([Function])
@@ -3,15 +3,15 @@ This plugin patches the FBProperty classes to make sure they have the correct ty
 """
 from __future__ import annotations
 
-import pyfbsdk
-
-from ..plugin import PluginBaseClass
+from ..plugin import PluginBaseClass, EStubKind
 from ...module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 
 class PluginFbProperty(PluginBaseClass):
     Threading = False
     Priority = 200
+    Reads = frozenset()  # Only looks up class names
+    Writes = frozenset((EStubKind.Classes,))
 
     ConvertTypeDict = {
         "Bool": "bool",
@@ -23,9 +23,9 @@ class PluginFbProperty(PluginBaseClass):
         "Double": "float"
     }
 
-    def GetDataType(self, Class: StubClass):
+    def GetDataType(self, ClassName: str):
         # Figure out the data type based on the class name
-        Type = Class.Name
+        Type = ClassName
         for x in ("FBProperty", "Animatable", "List"):
             Type = Type.replace(x, "")
 
@@ -37,13 +37,13 @@ class PluginFbProperty(PluginBaseClass):
             return self.ConvertTypeDict[Type]
 
         Type = f"FB{Type}"
-        if Type in self.ClassMap:
+        if self.Inventory.HasClass(Type, bIncludeEnums = False):
             return Type
 
     def PatchClass(self, Class: StubClass):
         # FBProperty classes
         if Class.Name.startswith("FBProperty"):
-            Type = self.GetDataType(Class)
+            Type = self.GetDataType(Class.Name)
             if Type is None:
                 return
 
@@ -67,8 +67,7 @@ class PluginFbProperty(PluginBaseClass):
             # Animatable properties
             if Property.Type.startswith("FBPropertyAnimatable"):
                 # Make setter functions that accept the correct type
-                TypeClass = self.ClassMap.get(Property.Type)
-                if TypeClass:
-                    SetterType = self.GetDataType(TypeClass)
+                if self.Inventory.HasClass(Property.Type, bIncludeEnums = False):
+                    SetterType = self.GetDataType(Property.Type)
                     if SetterType:
                         Property.SetterType = f"{Property.Type}|{SetterType}"
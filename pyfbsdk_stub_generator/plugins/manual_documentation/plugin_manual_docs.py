@@ -6,7 +6,7 @@ import inspect
 from typing import TypeVar, Generator
 
 from .doc_bases import FunctionBase, ClassBase, PropertyBase
-from ..plugin import PluginBaseClass
+from ..plugin import PluginBaseClass, EStubKind
 from ...module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 T = TypeVar('T')
@@ -15,6 +15,8 @@ T = TypeVar('T')
 class PluginManualDocumentation(PluginBaseClass):
     Threading = False
     Priority = 150
+    Reads = frozenset()
+    Writes = frozenset((EStubKind.Classes, EStubKind.Functions))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
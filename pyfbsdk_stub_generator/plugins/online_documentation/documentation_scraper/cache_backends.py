@@ -0,0 +1,240 @@
+"""
+Storage backends for the documentation disk cache, see `documentation_cache`.
+
+Entries are text values stored by a category (e.g. downloaded pages or parsed pages) and a key (the url).
+    - `FileCacheBackend`: One file per entry in the cache directory.
+    - `SqliteCacheBackend`: All entries in a single SQLite database file. Multiple threads & processes can read at the same time,
+                            writes are atomic and multiple entries can be read/written with a single query/transaction.
+"""
+from __future__ import annotations
+
+import threading
+import re
+import os
+
+from typing import Iterable
+
+try:
+    import sqlite3  # Optional, some embedded Python distributions are built without it
+except ImportError:
+    sqlite3 = None
+
+
+class ECacheCategory:
+    Pages = "pages"  # Downloaded pages & table of contents
+    ParsedPages = "parsed"  # Serialized `DocumentationParsedPage`s
+
+
+class ECacheBackend:
+    Files = "files"
+    Sqlite = "sqlite"
+
+
+class CacheBackend():
+    """ Base class for the cache backends """
+    Name = ""
+
+    def Get(self, Category: str, Key: str) -> str | None:
+        """
+        ### Returns:
+        The value, or None if the key isn't cached
+        """
+        raise NotImplementedError()
+
+    def GetMany(self, Category: str, Keys: Iterable[str]) -> dict[str, str]:
+        """
+        ### Returns:
+        Map of the keys that are cached and their values
+        """
+        Values = {}
+        for Key in Keys:
+            Value = self.Get(Category, Key)
+            if Value is not None:
+                Values[Key] = Value
+        return Values
+
+    def Has(self, Category: str, Key: str) -> bool:
+        return self.Get(Category, Key) is not None
+
+    def Set(self, Category: str, Key: str, Value: str):
+        raise NotImplementedError()
+
+    def SetMany(self, Category: str, Values: dict[str, str]):
+        for Key, Value in Values.items():
+            self.Set(Category, Key, Value)
+
+    def GetKeys(self, Category: str) -> list[str]:
+        """ Get all cached keys in the category """
+        raise NotImplementedError()
+
+    def Close(self):
+        """ Release any open files, the backend can still be used after this """
+        pass
+
+
+# -------------------------------------------------------------
+#                           Files
+# -------------------------------------------------------------
+
+FILENAME_PATTERN = re.compile(r"[^a-zA-Z0-9]")
+KEY_FILENAME_PATTERN = re.compile(r"[a-zA-Z0-9_]+")
+
+
+def KeyToFilename(Key: str) -> str:
+    return FILENAME_PATTERN.sub("_", Key)
+
+
+class FileCacheBackend(CacheBackend):
+    """
+    Stores each entry in its own file, e.g. `https___help_autodesk_com_..._html` & `https___help_autodesk_com_..._html.parsed.json`.
+    Keys are stored with all special characters replaced, so `GetKeys` returns the keys in their file name form.
+    Those can still be used to get the values.
+    """
+    Name = ECacheBackend.Files
+
+    def __init__(self, Directory: str):
+        self.Directory = Directory
+
+    def GetFilepath(self, Category: str, Key: str) -> str:
+        return os.path.join(self.Directory, KeyToFilename(Key) + self._GetSuffix(Category))
+
+    @staticmethod
+    def _GetSuffix(Category: str) -> str:
+        if Category == ECacheCategory.Pages:
+            return ""
+        return f".{Category}.json"
+
+    def Get(self, Category: str, Key: str) -> str | None:
+        try:
+            with open(self.GetFilepath(Category, Key), "r", encoding="utf-8") as File:
+                return File.read()
+        except FileNotFoundError:
+            return None
+
+    def Has(self, Category: str, Key: str) -> bool:
+        return os.path.exists(self.GetFilepath(Category, Key))
+
+    def Set(self, Category: str, Key: str, Value: str):
+        # Pages may be cached from multiple threads at the same time
+        os.makedirs(self.Directory, exist_ok=True)
+
+        # Write to a temporary file first, so other threads/processes never read a half written file
+        Filepath = self.GetFilepath(Category, Key)
+        TempFilepath = f"{Filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(TempFilepath, "w", encoding="utf-8") as File:
+            File.write(Value)
+        os.replace(TempFilepath, Filepath)
+
+    def GetKeys(self, Category: str) -> list[str]:
+        if not os.path.isdir(self.Directory):
+            return []
+
+        Suffix = self._GetSuffix(Category)
+        Keys = []
+        for Filename in os.listdir(self.Directory):
+            if Suffix and not Filename.endswith(Suffix):
+                continue
+            Key = Filename[:len(Filename) - len(Suffix)]
+            if KEY_FILENAME_PATTERN.fullmatch(Key):
+                Keys.append(Key)
+        return sorted(Keys)
+
+
+# -------------------------------------------------------------
+#                           SQLite
+# -------------------------------------------------------------
+
+SQLITE_SCHEMA_VERSION = 1
+SQLITE_TIMEOUT = 30  # Seconds to wait for another process to finish writing
+SQLITE_MAX_VARIABLES = 500  # Max number of keys in a single query, SQLite's limit can be as low as 999
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Stores all entries in a single SQLite database.
+    The database uses write-ahead logging, so readers never wait for a writer (and the other way around).
+    Each thread gets its own connection.
+    """
+    Name = ECacheBackend.Sqlite
+
+    def __init__(self, Filepath: str):
+        if sqlite3 is None:
+            raise ImportError("The sqlite3 module is not available")
+
+        self.Filepath = Filepath
+        self._Local = threading.local()
+        self._Connections: list[sqlite3.Connection] = []
+        self._Lock = threading.Lock()
+
+    def _GetConnection(self) -> sqlite3.Connection:
+        Connection = getattr(self._Local, "Connection", None)
+        if Connection is None:
+            Connection = self._Connect()
+            self._Local.Connection = Connection
+            with self._Lock:
+                self._Connections.append(Connection)
+        return Connection
+
+    def _Connect(self) -> sqlite3.Connection:
+        Directory = os.path.dirname(self.Filepath)
+        if Directory:
+            os.makedirs(Directory, exist_ok=True)
+
+        # Autocommit mode, transactions are started explicitly in `SetMany`.
+        # `Close` may be called from another thread, once the connection is no longer used.
+        Connection = sqlite3.connect(self.Filepath, timeout=SQLITE_TIMEOUT, isolation_level=None, check_same_thread=False)
+        Connection.execute("PRAGMA journal_mode=WAL")
+        Connection.execute("PRAGMA synchronous=NORMAL")
+
+        SchemaVersion = Connection.execute("PRAGMA user_version").fetchone()[0]
+        if SchemaVersion != SQLITE_SCHEMA_VERSION:
+            with Connection:
+                Connection.execute("BEGIN IMMEDIATE")
+                # Check again, another process may have created the tables while waiting for the lock
+                if Connection.execute("PRAGMA user_version").fetchone()[0] != SQLITE_SCHEMA_VERSION:
+                    Connection.execute("DROP TABLE IF EXISTS Entries")
+                    Connection.execute("CREATE TABLE Entries (Category TEXT NOT NULL, Key TEXT NOT NULL, Value TEXT NOT NULL, PRIMARY KEY (Category, Key))")
+                    Connection.execute(f"PRAGMA user_version={SQLITE_SCHEMA_VERSION}")
+
+        return Connection
+
+    def Get(self, Category: str, Key: str) -> str | None:
+        Row = self._GetConnection().execute("SELECT Value FROM Entries WHERE Category=? AND Key=?", (Category, Key)).fetchone()
+        return Row[0] if Row else None
+
+    def GetMany(self, Category: str, Keys: Iterable[str]) -> dict[str, str]:
+        Keys = list(dict.fromkeys(Keys))
+        Connection = self._GetConnection()
+        Values = {}
+        for Index in range(0, len(Keys), SQLITE_MAX_VARIABLES):
+            Chunk = Keys[Index:Index + SQLITE_MAX_VARIABLES]
+            Placeholders = ",".join("?" * len(Chunk))
+            Query = f"SELECT Key, Value FROM Entries WHERE Category=? AND Key IN ({Placeholders})"
+            Values.update(Connection.execute(Query, (Category, *Chunk)).fetchall())
+        return Values
+
+    def Has(self, Category: str, Key: str) -> bool:
+        return self._GetConnection().execute("SELECT 1 FROM Entries WHERE Category=? AND Key=?", (Category, Key)).fetchone() is not None
+
+    def Set(self, Category: str, Key: str, Value: str):
+        self._GetConnection().execute("INSERT OR REPLACE INTO Entries VALUES (?, ?, ?)", (Category, Key, Value))
+
+    def SetMany(self, Category: str, Values: dict[str, str]):
+        if not Values:
+            return
+
+        # All values are written in a single transaction, either all or none of them are stored
+        Connection = self._GetConnection()
+        with Connection:
+            Connection.execute("BEGIN IMMEDIATE")
+            Connection.executemany("INSERT OR REPLACE INTO Entries VALUES (?, ?, ?)", ((Category, Key, Value) for Key, Value in Values.items()))
+
+    def GetKeys(self, Category: str) -> list[str]:
+        return [Row[0] for Row in self._GetConnection().execute("SELECT Key FROM Entries WHERE Category=? ORDER BY Key", (Category,))]
+
+    def Close(self):
+        with self._Lock:
+            for Connection in self._Connections:
+                Connection.close()
+            self._Connections.clear()
+            self._Local = threading.local()
@@ -0,0 +1,127 @@
+"""
+Documentation bundles, a single archive file with the table of contents & pages of the online documentation.
+
+Bundles are used to generate the stub files without internet access, e.g. on build machines.
+A bundle is a zip archive containing a `manifest.json` file (format version, MotionBuilder version & namespaces),
+and one file per downloaded url. The archive is written in a deterministic order with fixed timestamps,
+so exporting the same documentation twice gives an identical file.
+"""
+from __future__ import annotations
+
+import threading
+import hashlib
+import zipfile
+import json
+import os
+
+BUNDLE_FORMAT_VERSION = 1
+
+MANIFEST_FILENAME = "manifest.json"
+CONTENT_DIRNAME = "content"
+
+# Timestamp for all files in the archive, the earliest date supported by the zip format
+ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def GetArchiveName(Url: str) -> str:
+    """ Get the name of the file in the archive that holds the content of the url """
+    return f"{CONTENT_DIRNAME}/{hashlib.sha1(Url.encode('utf-8')).hexdigest()}"
+
+
+class DocumentationBundle():
+    def __init__(self, Filepath: str):
+        """
+        Open a bundle created with `WriteBundle`
+
+        ### Parameters:
+            - Filepath: The bundle filepath
+        """
+        self.Filepath = Filepath
+        self._Archive = zipfile.ZipFile(Filepath, "r")
+        self._Lock = threading.Lock()
+
+        try:
+            Manifest = json.loads(self._Archive.read(MANIFEST_FILENAME).decode("utf-8"))
+        except (KeyError, ValueError) as e:
+            self._Archive.close()
+            raise ValueError(f"'{Filepath}' is not a documentation bundle") from e
+
+        if Manifest.get("FormatVersion") != BUNDLE_FORMAT_VERSION:
+            self._Archive.close()
+            raise ValueError(f"Unsupported documentation bundle format version {Manifest.get('FormatVersion')} in '{Filepath}', expected {BUNDLE_FORMAT_VERSION}")
+
+        self.Version: int = Manifest["Version"]
+        self.Namespaces: list[str] = Manifest["Namespaces"]
+        self._Files: dict[str, str] = Manifest["Files"]  # Url -> Name of the file in the archive
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<{self.Version}, {len(self._Files)} urls>"
+
+    def GetUrls(self) -> list[str]:
+        return list(self._Files)
+
+    def HasUrl(self, Url: str) -> bool:
+        return Url in self._Files
+
+    def Get(self, Url: str) -> str | None:
+        """
+        Get the content of a url
+
+        ### Returns:
+        The content, or None if the url is not in the bundle
+        """
+        ArchiveName = self._Files.get(Url)
+        if ArchiveName is None:
+            return None
+
+        with self._Lock:
+            return self._Archive.read(ArchiveName).decode("utf-8")
+
+    def Close(self):
+        self._Archive.close()
+
+
+def WriteBundle(Filepath: str, Version: int, Namespaces: list[str], Contents: dict[str, str]) -> str:
+    """
+    Write a documentation bundle
+
+    ### Parameters:
+        - Filepath: The bundle filepath, any existing file is replaced
+        - Version: The MotionBuilder version of the documentation
+        - Namespaces: The documentation namespaces in the bundle, e.g. ['pyfbsdk']
+        - Contents: Map of urls and their content
+
+    ### Returns:
+    The filepath
+    """
+    Urls = sorted(Contents)
+    Manifest = {
+        "FormatVersion": BUNDLE_FORMAT_VERSION,
+        "Version": Version,
+        "Namespaces": list(Namespaces),
+        "Files": {Url: GetArchiveName(Url) for Url in Urls}
+    }
+
+    Directory = os.path.dirname(Filepath)
+    if Directory:
+        os.makedirs(Directory, exist_ok = True)
+
+    # Write to a temporary file first, so the bundle is never left half written
+    TempFilepath = f"{Filepath}.{os.getpid()}.tmp"
+    try:
+        with zipfile.ZipFile(TempFilepath, "w", compression = zipfile.ZIP_DEFLATED) as Archive:
+            _WriteFile(Archive, MANIFEST_FILENAME, json.dumps(Manifest, indent = 1))
+            for Url in Urls:
+                _WriteFile(Archive, GetArchiveName(Url), Contents[Url])
+        os.replace(TempFilepath, Filepath)
+    finally:
+        if os.path.exists(TempFilepath):
+            os.remove(TempFilepath)
+
+    return Filepath
+
+
+def _WriteFile(Archive: zipfile.ZipFile, Name: str, Content: str):
+    Info = zipfile.ZipInfo(Name, date_time = ARCHIVE_DATE_TIME)
+    Info.compress_type = zipfile.ZIP_DEFLATED
+    Archive.writestr(Info, Content.encode("utf-8"))
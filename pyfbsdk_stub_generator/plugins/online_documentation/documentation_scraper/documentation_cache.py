@@ -1,54 +1,319 @@
 
+from __future__ import annotations
+
+import functools
+import threading
 import tempfile
-import re
+import hashlib
+import json
 import os
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
 import requests
 
+from . import http_client
+from . import documentation_bundle as bundle
+from . import cache_backends as backends
+
 CACHE_DIRNAME = "pyfbsdk_stub_generator_documentation_cache"
+CACHE_DATABASE_FILENAME = "cache.sqlite3"
+MARKDOWN_CACHE_FILENAME = "markdown_cache.json"
+
+# Environment variable that can be set to choose the cache backend, see `cache_backends.ECacheBackend`
+CACHE_BACKEND_ENV_VARIABLE = "PYFBSDK_CACHE_BACKEND"
+
+# Environment variable with the documentation bundles to read from, multiple filepaths are separated by `os.pathsep`
+BUNDLE_ENV_VARIABLE = "PYFBSDK_DOCUMENTATION_BUNDLE"
+
+# Open backends by tuple(BackendName, CacheDir), kept if the module is reloaded so they can still be closed by `CloseBackends`
+if "_Backends" not in globals():
+    _Backends: dict[tuple[str, str], backends.CacheBackend] = {}
+    _BackendsLock = threading.Lock()
+
+# Open documentation bundles by filepath as tuple(ModifiedTime, Bundle), and the bundles resolved from the environment variable's value.
+# Kept if the module is reloaded, so the open files are still closed when they're replaced or no longer used.
+if "_OpenBundles" not in globals():
+    _OpenBundles: dict[str, tuple[float, bundle.DocumentationBundle]] = {}
+    _ResolvedBundles: tuple[str, list[bundle.DocumentationBundle]] | None = None
+    _BundlesLock = threading.Lock()
 
 
 def GetCacheDir():
     return os.path.join(tempfile.gettempdir(), CACHE_DIRNAME)
 
 
-def UrlToFilepath(Url: str):
-    return re.sub(r"[^a-zA-Z0-9]", "_", Url)
+def GetBackendName() -> str:
+    """
+    Get which cache backend to use, see `cache_backends.ECacheBackend`.
+    Can be set with the `PYFBSDK_CACHE_BACKEND` environment variable, SQLite is used by default if it's available.
+    """
+    return _ValidateBackendName(os.environ.get(CACHE_BACKEND_ENV_VARIABLE))
+
+
+@functools.lru_cache(maxsize=None)
+def _ValidateBackendName(Name: str | None) -> str:
+    """ Get the backend to use for the name set in the environment variable, cached so any warnings are only printed once """
+    DefaultName = backends.ECacheBackend.Sqlite if backends.sqlite3 else backends.ECacheBackend.Files
+    if not Name:
+        return DefaultName
 
+    Name = Name.lower()
+    if Name not in (backends.ECacheBackend.Files, backends.ECacheBackend.Sqlite):
+        print(f"Warning: Unknown cache backend '{Name}' in {CACHE_BACKEND_ENV_VARIABLE}, using '{DefaultName}' instead.")
+        return DefaultName
 
-def GetCachedFilepath(Url: str):
-    return os.path.join(GetCacheDir(), UrlToFilepath(Url))
+    if Name == backends.ECacheBackend.Sqlite and backends.sqlite3 is None:
+        print(f"Warning: The sqlite3 module is not available, using the '{backends.ECacheBackend.Files}' cache backend instead.")
+        return backends.ECacheBackend.Files
+
+    return Name
+
+
+def CreateBackend(Name: str, CacheDir: str) -> backends.CacheBackend:
+    if Name == backends.ECacheBackend.Sqlite:
+        return backends.SqliteCacheBackend(os.path.join(CacheDir, CACHE_DATABASE_FILENAME))
+    return backends.FileCacheBackend(CacheDir)
+
+
+def GetBackend() -> backends.CacheBackend:
+    """ Get the cache backend shared by all threads, see `GetBackendName` """
+    Key = (GetBackendName(), GetCacheDir())
+    with _BackendsLock:
+        if Key not in _Backends:
+            _Backends[Key] = CreateBackend(*Key)
+        return _Backends[Key]
+
+
+def CloseBackends():
+    """ Close all open cache backends, e.g. to be able to delete the cache files """
+    with _BackendsLock:
+        for Backend in _Backends.values():
+            Backend.Close()
+        _Backends.clear()
 
 
 def IsUrlCached(Url: str):
-    return os.path.exists(GetCachedFilepath(Url))
+    return GetBackend().Has(backends.ECacheCategory.Pages, Url)
+
+
+def GetCachedContent(Url: str) -> str | None:
+    """ Get the content of the url from the disk cache, or None if it's not cached """
+    return GetBackend().Get(backends.ECacheCategory.Pages, Url)
 
 
 def CacheUrl(Url: str, Content: str):
-    CacheDir = GetCacheDir()
-    if not os.path.exists(CacheDir):
-        os.makedirs(CacheDir)
+    GetBackend().Set(backends.ECacheCategory.Pages, Url, Content)
+
 
-    Filepath = GetCachedFilepath(Url)
-    with open(Filepath, "w", encoding="utf-8") as File:
-        File.write(Content)
+def Download(Url: str) -> str:
+    try:
+        return http_client.Get(Url)
+    except requests.exceptions.RequestException as e:
+        print(f"Failed to download {Url}")
+        raise e
 
 
 def CachedGetRequest(Url: str):
-    if IsUrlCached(Url):
-        with open(GetCachedFilepath(Url), "r", encoding="utf-8") as File:
-            return File.read()
-    else:
+    Content = GetCachedContent(Url)
+    if Content is None:
+        Content = Download(Url)
+        CacheUrl(Url, Content)
+    return Content
+
+
+def GetBundleFilepaths() -> list[str]:
+    """ Get the filepaths of the documentation bundles to read from, see `BUNDLE_ENV_VARIABLE` """
+    return [Filepath for Filepath in os.environ.get(BUNDLE_ENV_VARIABLE, "").split(os.pathsep) if Filepath]
+
+
+def GetBundles() -> list[bundle.DocumentationBundle]:
+    """
+    Get the documentation bundles to read from.
+    The bundles are only resolved the first time, or if `BUNDLE_ENV_VARIABLE` has changed, see `RefreshBundles`.
+    """
+    Resolved = _ResolvedBundles
+    if Resolved is not None and Resolved[0] == os.environ.get(BUNDLE_ENV_VARIABLE, ""):
+        return Resolved[1]
+    return RefreshBundles()
+
+
+def RefreshBundles() -> list[bundle.DocumentationBundle]:
+    """
+    Resolve the bundles in `BUNDLE_ENV_VARIABLE` again, called at the start of each run.
+    Each file is only opened once, unless it has been modified since it was opened. In that case the old file is closed and it's re-opened.
+    Bundles that are no longer used are closed.
+    """
+    global _ResolvedBundles  # pylint: disable=global-statement
+    with _BundlesLock:
+        EnvValue = os.environ.get(BUNDLE_ENV_VARIABLE, "")
+
+        Bundles = []
+        for Filepath in GetBundleFilepaths():
+            Filepath = os.path.abspath(Filepath)
+            if not os.path.isfile(Filepath):
+                raise FileNotFoundError(f"Documentation bundle '{Filepath}' does not exist")
+
+            ModifiedTime = os.path.getmtime(Filepath)
+            OpenBundle = _OpenBundles.get(Filepath)
+            if OpenBundle is None or OpenBundle[0] != ModifiedTime:
+                NewBundle = bundle.DocumentationBundle(Filepath)
+                if OpenBundle:
+                    OpenBundle[1].Close()
+                OpenBundle = _OpenBundles[Filepath] = (ModifiedTime, NewBundle)
+            Bundles.append(OpenBundle[1])
+
+        for Filepath in [x for x in _OpenBundles if x not in {Bundle.Filepath for Bundle in Bundles}]:
+            _OpenBundles.pop(Filepath)[1].Close()
+
+        _ResolvedBundles = (EnvValue, Bundles)
+        return Bundles
+
+
+def GetBundledContent(Url: str) -> str | None:
+    """ Get the content of the url from the documentation bundles, or None if it's not in any of them """
+    for Bundle in GetBundles():
+        Content = Bundle.Get(Url)
+        if Content is not None:
+            return Content
+    return None
+
+
+def GetUrlContent(Url: str, bUseCache: bool = False) -> str:
+    """
+    Get the content of a url, from the first of these that has it:
+        1. The documentation bundles, see `BUNDLE_ENV_VARIABLE`
+        2. The disk cache, if `bUseCache` is True. Downloaded content is added to the cache.
+        3. The online documentation, unless offline mode is enabled (see `http_client.IsOffline`)
+    """
+    Content = GetBundledContent(Url)
+    if Content is not None:
+        return Content
+
+    if bUseCache:
+        return CachedGetRequest(Url)
+
+    return http_client.Get(Url)
+
+
+def GetUrlContents(Urls: Iterable[str], bUseCache: bool = False, MaxWorkers: int = 16) -> dict[str, str]:
+    """
+    Get the content of multiple urls, from the same places as `GetUrlContent`.
+    Cached content is read in bulk, anything else is downloaded concurrently.
+
+    ### Parameters:
+        - Urls: The urls
+        - bUseCache: Read from & write to the disk cache
+        - MaxWorkers: Max number of urls to download at the same time
+
+    ### Returns:
+    Map of the urls and their content, in the same order as `Urls`
+    """
+    Urls = list(dict.fromkeys(Urls))
+    Contents: dict[str, str] = {}
+
+    Bundles = GetBundles()
+    for Url in Urls:
+        for Bundle in Bundles:
+            Content = Bundle.Get(Url)
+            if Content is not None:
+                Contents[Url] = Content
+                break
+
+    MissingUrls = [Url for Url in Urls if Url not in Contents]
+    if bUseCache and MissingUrls:
+        Contents.update(GetBackend().GetMany(backends.ECacheCategory.Pages, MissingUrls))
+        MissingUrls = [Url for Url in MissingUrls if Url not in Contents]
+
+    if MissingUrls:
+        # Each page is cached as soon as it's downloaded, so nothing is lost if another download fails
+        DownloadFunction = CachedGetRequest if bUseCache else http_client.Get
+        with ThreadPoolExecutor(max_workers=max(1, MaxWorkers)) as Executor:
+            Contents.update(zip(MissingUrls, Executor.map(DownloadFunction, MissingUrls)))
+
+    return {Url: Contents[Url] for Url in Urls}
+
+
+def GetContentHash(Content: str):
+    return hashlib.sha1(Content.encode("utf-8")).hexdigest()
+
+
+def GetCachedParsedPage(Url: str, ContentHash: str, ParserVersion: str) -> dict | None:
+    """
+    Get the serialized parsed page for the url.
+
+    ### Parameters:
+        - Url: The url of the page
+        - ContentHash: Hash of the HTML content the page was parsed from
+        - ParserVersion: Version of the parser used to parse the page
+
+    ### Returns:
+    The serialized page, or None if it's not cached or if the cached page was created from different content/parser.
+    """
+    return GetCachedParsedPages({Url: ContentHash}, ParserVersion).get(Url)
+
+
+def GetCachedParsedPages(ContentHashes: dict[str, str], ParserVersion: str) -> dict[str, dict]:
+    """
+    Get the serialized parsed pages for multiple urls, see `GetCachedParsedPage`
+
+    ### Parameters:
+        - ContentHashes: Map of the page urls and the hash of the HTML content
+        - ParserVersion: Version of the parser used to parse the pages
+
+    ### Returns:
+    Map of the urls and their serialized page, pages that are not cached (or outdated) are not included
+    """
+    Pages = {}
+    for Url, Data in GetBackend().GetMany(backends.ECacheCategory.ParsedPages, ContentHashes).items():
         try:
-            Response = requests.get(Url, timeout=10)
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to download {Url}")
-            raise e
-        CacheUrl(Url, Response.text)
-        return Response.text
+            CachedData = json.loads(Data)
+        except ValueError:
+            continue
+
+        if CachedData.get("ContentHash") == ContentHashes[Url] and CachedData.get("ParserVersion") == ParserVersion:
+            Pages[Url] = CachedData.get("Page")
+
+    return Pages
+
+
+def CacheParsedPage(Url: str, ContentHash: str, ParserVersion: str, Page: dict):
+    CacheParsedPages({Url: (ContentHash, Page)}, ParserVersion)
+
+
+def CacheParsedPages(Pages: dict[str, tuple[str, dict]], ParserVersion: str):
+    """
+    Store multiple serialized parsed pages, in a single transaction if the backend supports it
+
+    ### Parameters:
+        - Pages: Map of the page urls and tuple(ContentHash, SerializedPage)
+        - ParserVersion: Version of the parser used to parse the pages
+    """
+    Values = {}
+    for Url, (ContentHash, Page) in Pages.items():
+        CachedData = {
+            "ContentHash": ContentHash,
+            "ParserVersion": ParserVersion,
+            "Page": Page
+        }
+        Values[Url] = json.dumps(CachedData, separators=(",", ":"))
+
+    GetBackend().SetMany(backends.ECacheCategory.ParsedPages, Values)
+
+
+def GetCachedUrls() -> list[str]:
+    """ Get the urls of all cached pages, the file backend returns them in their file name form (see `cache_backends.FileCacheBackend`) """
+    return GetBackend().GetKeys(backends.ECacheCategory.Pages)
+
+
+def GetMarkdownCacheFilepath():
+    return os.path.join(GetCacheDir(), MARKDOWN_CACHE_FILENAME)
 
 
 def ClearCache():
+    CloseBackends()
+
     CacheDir = GetCacheDir()
     if os.path.exists(CacheDir):
         for File in os.listdir(CacheDir):
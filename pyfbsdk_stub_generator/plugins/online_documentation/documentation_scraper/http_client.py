@@ -0,0 +1,96 @@
+"""
+Shared HTTP client used for all requests made by the documentation scraper.
+Re-uses connections to the documentation server & retries requests that fails because of temporary errors.
+"""
+from __future__ import annotations
+
+import threading
+import os
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_SIZE = 16  # Max number of connections kept alive to the same host
+TIMEOUT = 10
+RETRIES = 5
+BACKOFF_FACTOR = 0.5  # Wait 0.5s, 1s, 2s, 4s... between retries
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Set this environment variable to "True" to never send any requests, see `IsOffline`
+OFFLINE_ENV_VARIABLE = "PYFBSDK_OFFLINE"
+
+_Session: requests.Session | None = None
+_SessionLock = threading.Lock()
+
+
+class OfflineError(Exception):
+    """ Raised when a request would have been sent in offline mode """
+    ...
+
+
+def IsOffline() -> bool:
+    """
+    Check if offline mode is enabled. In offline mode all content must come from a documentation bundle or the disk cache,
+    requesting anything else raises an `OfflineError` right away instead of waiting for the request to time out.
+    """
+    return os.environ.get(OFFLINE_ENV_VARIABLE) == "True"
+
+
+def CreateSession(PoolSize: int = POOL_SIZE) -> requests.Session:
+    """
+    Create a new session with a sized connection pool and retries on temporary errors.
+
+    ### Parameters:
+        - PoolSize: Max number of connections to keep alive per host
+    """
+    RetryStrategy = Retry(
+        total = RETRIES,
+        backoff_factor = BACKOFF_FACTOR,
+        status_forcelist = RETRY_STATUS_CODES,
+        allowed_methods = ("GET",)
+    )
+    Adapter = HTTPAdapter(pool_connections = PoolSize, pool_maxsize = PoolSize, max_retries = RetryStrategy)
+
+    Session = requests.Session()
+    Session.mount("https://", Adapter)
+    Session.mount("http://", Adapter)
+    Session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+
+    return Session
+
+
+def GetSession() -> requests.Session:
+    """ Get the session shared by all threads """
+    global _Session  # pylint: disable=global-statement
+    if _Session is None:
+        with _SessionLock:
+            if _Session is None:
+                _Session = CreateSession()
+    return _Session
+
+
+def CloseSession():
+    """ Close the shared session and all of it's connections """
+    global _Session  # pylint: disable=global-statement
+    with _SessionLock:
+        if _Session is not None:
+            _Session.close()
+            _Session = None
+
+
+def Get(Url: str) -> str:
+    """
+    Send a GET request through the shared session
+
+    ### Returns:
+    The response content as text
+    """
+    if IsOffline():
+        raise OfflineError(f"Can't download '{Url}' in offline mode ({OFFLINE_ENV_VARIABLE}), it's not in the documentation bundle or cache")
+
+    return GetSession().get(Url, timeout = TIMEOUT).text
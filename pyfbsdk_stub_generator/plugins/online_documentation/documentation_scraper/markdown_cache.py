@@ -0,0 +1,138 @@
+"""
+Cache for docstrings converted from HTML to markdown.
+
+A lot of HTML fragments are repeated in the documentation (inherited members, "Constructor." etc.),
+so the converted docstrings are cached by a hash of the HTML & the converter settings.
+Fragments without links don't depend on the documentation's base url, so they're also shared between MotionBuilder versions.
+The cache can also be saved to disk, to be re-used by the next run. Only the entries used by the current run are saved.
+"""
+from __future__ import annotations
+
+import threading
+import hashlib
+import json
+import os
+
+
+class MarkdownCache():
+    def __init__(self):
+        self.Hits = 0
+        self.Misses = 0
+
+        self._Entries: dict[str, str] = {}
+        self._UsedKeys: set[str] = set()  # Keys that have been used since the cache was created/cleared
+        self._SavedKeys: set[str] = set()  # Keys in the file that was last loaded/saved
+        self._bModified = False
+        self._Lock = threading.Lock()
+
+    @staticmethod
+    def GetKey(HtmlFragment: str, *Settings: str) -> str:
+        """
+        Get the cache key for a HTML fragment
+
+        ### Parameters:
+            - HtmlFragment: The HTML that is converted
+            - Settings: Anything else that affects the result, e.g. the base url & converter options
+        """
+        Hash = hashlib.sha1()
+        for Value in Settings:
+            Hash.update(Value.encode("utf-8"))
+            Hash.update(b"\0")
+        Hash.update(HtmlFragment.encode("utf-8"))
+        return Hash.hexdigest()
+
+    def Get(self, Key: str) -> str | None:
+        with self._Lock:
+            DocString = self._Entries.get(Key)
+            if DocString is None:
+                self.Misses += 1
+            else:
+                self.Hits += 1
+                self._UsedKeys.add(Key)
+            return DocString
+
+    def Set(self, Key: str, DocString: str):
+        with self._Lock:
+            self._Entries[Key] = DocString
+            self._UsedKeys.add(Key)
+            self._bModified = True
+
+    def Clear(self):
+        with self._Lock:
+            self._Entries.clear()
+            self._UsedKeys.clear()
+            self._SavedKeys.clear()
+            self._bModified = False
+        self.ResetStatistics()
+
+    def ResetStatistics(self):
+        with self._Lock:
+            self.Hits = 0
+            self.Misses = 0
+
+    def GetStatistics(self) -> dict:
+        with self._Lock:
+            Total = self.Hits + self.Misses
+            return {
+                "Hits": self.Hits,
+                "Misses": self.Misses,
+                "HitRate": self.Hits / Total if Total else 0.0,
+                "Entries": len(self._Entries)
+            }
+
+    def Load(self, Filepath: str, Version: str) -> bool:
+        """
+        Add the entries from a cache file saved with `Save`
+
+        ### Parameters:
+            - Filepath: The cache file
+            - Version: The converter version, the file is ignored if it was saved by another version
+
+        ### Returns:
+        True if the file was loaded
+        """
+        if not os.path.isfile(Filepath):
+            return False
+
+        try:
+            with open(Filepath, "r", encoding="utf-8") as File:
+                Data = json.load(File)
+        except ValueError:
+            return False
+
+        if Data.get("Version") != Version:
+            return False
+
+        with self._Lock:
+            for Key, DocString in Data.get("Entries", {}).items():
+                self._Entries.setdefault(Key, DocString)
+            self._SavedKeys.update(Data.get("Entries", {}))
+        return True
+
+    def Save(self, Filepath: str, Version: str):
+        """
+        Write the entries that have been used to disk, if anything has changed since it was last saved/loaded.
+        Entries that were loaded but never used are left out, so the file doesn't keep growing between runs.
+        """
+        with self._Lock:
+            if not self._bModified and self._UsedKeys == self._SavedKeys:
+                return
+            Data = {"Version": Version, "Entries": {Key: self._Entries[Key] for Key in sorted(self._UsedKeys)}}
+            self._SavedKeys = set(self._UsedKeys)
+            self._bModified = False
+
+        os.makedirs(os.path.dirname(Filepath), exist_ok = True)
+
+        # Write to a temporary file first, so the cache file is never left half written
+        TempFilepath = f"{Filepath}.{os.getpid()}.tmp"
+        with open(TempFilepath, "w", encoding="utf-8") as File:
+            json.dump(Data, File, separators=(",", ":"))
+        os.replace(TempFilepath, Filepath)
+
+
+_MarkdownCache = MarkdownCache()
+
+
+def GetMarkdownCache() -> MarkdownCache:
+    """ Get the cache shared by all docstring converters in this process """
+    return _MarkdownCache
@@ -0,0 +1,164 @@
+"""
+Parser for the Doxygen navtree javascript files, e.g. `namespacepyfbsdk.js`.
+
+These files only contain a single variable holding a (nested) array literal, something like this:
+```
+var namespacepyfbsdk =
+[
+    [ "FBAddRegionParam", "namespacepyfbsdk.html#a6dc4b2b0e8a1e7b9b1f0f0b6c1a9d2f1", null ],
+    [ "FBAnimationNode", "classpyfbsdk_1_1_f_b_animation_node.html", "classpyfbsdk_1_1_f_b_animation_node" ],
+];
+```
+So instead of running the script through a JavaScript interpreter, the array literal is parsed directly.
+"""
+from __future__ import annotations
+
+import re
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<Skip>\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<String>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |(?P<Number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<Word>[A-Za-z_$][\w$]*)
+    |(?P<Symbol>[\[\],=;])
+""", re.VERBOSE | re.DOTALL)
+
+ESCAPE_PATTERN = re.compile(r"\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+
+ESCAPE_CHARACTERS = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+    "0": "\0",
+}
+
+KEYWORD_VALUES = {
+    "null": None,
+    "undefined": None,
+    "true": True,
+    "false": False,
+}
+
+
+class NavTreeParseError(ValueError):
+    ...
+
+
+def _UnescapeString(Text: str) -> str:
+    def _Replace(Match: re.Match) -> str:
+        Escape = Match.group(1)
+        if len(Escape) > 1:
+            return chr(int(Escape[1:], 16))
+        return ESCAPE_CHARACTERS.get(Escape, Escape)
+
+    return ESCAPE_PATTERN.sub(_Replace, Text)
+
+
+def Tokenize(Script: str) -> list[tuple[str, str]]:
+    """
+    Split the script up into tokens
+
+    ### Returns:
+    A list of tuple(TokenType, Text)
+    """
+    Tokens = []
+    Position = 0
+    while Position < len(Script):
+        Match = TOKEN_PATTERN.match(Script, Position)
+        if not Match:
+            raise NavTreeParseError(f"Unexpected character {Script[Position]!r} at position {Position}")
+
+        Position = Match.end()
+        if Match.lastgroup != "Skip":
+            Tokens.append((Match.lastgroup, Match.group()))
+
+    return Tokens
+
+
+class _Parser():
+    def __init__(self, Tokens: list[tuple[str, str]]):
+        self.Tokens = Tokens
+        self.Index = 0
+
+    def Peek(self) -> tuple[str, str] | None:
+        if self.Index < len(self.Tokens):
+            return self.Tokens[self.Index]
+        return None
+
+    def Next(self) -> tuple[str, str]:
+        Token = self.Peek()
+        if Token is None:
+            raise NavTreeParseError("Unexpected end of script")
+        self.Index += 1
+        return Token
+
+    def Expect(self, Text: str):
+        _, TokenText = self.Next()
+        if TokenText != Text:
+            raise NavTreeParseError(f"Expected {Text!r} but got {TokenText!r}")
+
+    def ParseValue(self):
+        TokenType, Text = self.Next()
+        if Text == "[":
+            return self.ParseArray()
+        if TokenType == "String":
+            return _UnescapeString(Text[1:-1])
+        if TokenType == "Number":
+            return float(Text) if any(x in Text for x in ".eE") else int(Text)
+        if TokenType == "Word" and Text in KEYWORD_VALUES:
+            return KEYWORD_VALUES[Text]
+        raise NavTreeParseError(f"Unexpected token {Text!r}")
+
+    def ParseArray(self) -> list:
+        Items = []
+        while True:
+            Token = self.Peek()
+            if Token and Token[1] == "]":
+                self.Next()
+                return Items
+
+            Items.append(self.ParseValue())
+
+            # Items must be followed by either a comma or the end of the array, trailing commas are allowed
+            _, Text = self.Next()
+            if Text == "]":
+                return Items
+            if Text != ",":
+                raise NavTreeParseError(f"Expected ',' or ']' but got {Text!r}")
+
+
+def ParseNavTree(Script: str) -> list:
+    """
+    Parse a Doxygen navtree script and return the array it declares.
+
+    ### Parameters:
+        - Script: The javascript content, e.g. `var namespacepyfbsdk = [ ... ];`
+
+    ### Raises:
+        - NavTreeParseError: If the script doesn't follow the expected format
+    """
+    Parser = _Parser(Tokenize(Script))
+
+    # Skip the variable declaration, e.g. 'var namespacepyfbsdk ='
+    Token = Parser.Peek()
+    if Token and Token[1] == "var":
+        Parser.Next()
+        TokenType, _ = Parser.Next()
+        if TokenType != "Word":
+            raise NavTreeParseError("Expected a variable name after 'var'")
+        Parser.Expect("=")
+
+    Parser.Expect("[")
+    Value = Parser.ParseArray()
+
+    # Only an optional semicolon is allowed after the array
+    Token = Parser.Peek()
+    if Token and Token[1] == ";":
+        Parser.Next()
+    if Parser.Peek() is not None:
+        raise NavTreeParseError(f"Unexpected token {Parser.Peek()[1]!r} after the array")
+
+    return Value
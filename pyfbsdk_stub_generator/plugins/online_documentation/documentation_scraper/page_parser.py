@@ -1,23 +1,59 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib.util
 import keyword
 import string
+import sys
 import re
+import os
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from importlib   import reload
+from typing import Iterator, Sequence
 
 import markdownify
-from bs4 import BeautifulSoup, Tag, NavigableString
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString, CData, Comment, Doctype
 
 from . import documentation_urls as urls
-from . import documentation_cache as cache
+from . import markdown_cache
 
-reload(cache)
 reload(urls)
+reload(markdown_cache)
 
 PY2_TO_PY3_PRINT_PATTERN = re.compile(r"(?<!\w)print\s+(.*)\s*(?<!\\)(?:\n|$)")
 
+# Bump this if the parsed output changes in a way not caught by the source hash, e.g. by updating a dependency
+PARSER_VERSION = 1
+
+# Environment variable that can be set to force a spesific BeautifulSoup parser, e.g. "html.parser" or "lxml"
+HTML_PARSER_ENV_VARIABLE = "PYFBSDK_HTML_PARSER"
+
+# Environment variable that can be set to choose the docstring converter, see `EDocstringConverter`
+DOCSTRING_CONVERTER_ENV_VARIABLE = "PYFBSDK_DOCSTRING_CONVERTER"
+
+# Matches the start of every line in a string
+LINE_BEGINNING_PATTERN = re.compile(r"^", re.MULTILINE)
+WHITESPACE_PATTERN = re.compile(r"[\t ]+")
+HEADING_PATTERN = re.compile(r"h[1-6]")
+HEADING_LEVEL_PATTERN = re.compile(r"h(\d+)")
+
+# Elements where whitespace-only text between child elements is ignored
+NESTED_ELEMENTS = frozenset(("ol", "ul", "li", "table", "thead", "tbody", "tfoot", "tr", "td", "th"))
+
+# The text types included by `Tag.get_text()`, e.g. comments are not included
+CODE_TEXT_TYPES = (NavigableString, CData)
+
+SAMPLE_URL_PREFIX = "ms-its:MotionBuilder_SDK_Samples.chm::"
+
+
+class EDocstringConverter:
+    Markdownify = "markdownify"  # DocstringMarkdownConverter
+    Doxygen = "doxygen"  # DoxygenDocstringConverter
+
 
 class ClassNames:
     Items = "memitem"
@@ -31,6 +67,13 @@ class ClassNames:
     CodeBlock = "fragment"
 
 
+# Only these elements are used when parsing a page, skip building the tree for everything else
+PAGE_STRAINER = SoupStrainer(
+    ["div", "h2"],
+    class_ = [ClassNames.TextBlockDescription, ClassNames.Items, ClassNames.ItemTitles]
+)
+
+
 @dataclass
 class Parameter:
     Name: str | None
@@ -53,18 +96,40 @@ class DocumentationParsedPage():
         self.DocString = DocString
         self.Members = Members
 
+        # Map of member names and all members with that name, in the same order as in `Members`.
+        # Built here so it's included when the page is pickled (e.g. when parsed in another process).
+        self._MembersByName: dict[str, list[MemberItem]] = {}
+        for Member in Members:
+            self._MembersByName.setdefault(Member.Name, []).append(Member)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}<{self.Name}>"
 
     def GetFirstMemberByName(self, Name: str) -> MemberItem:
-        for Member in self.Members:
-            if Member.Name == Name:
-                return Member
-
-        return None
+        Members = self._MembersByName.get(Name)
+        return Members[0] if Members else None
 
     def GetMembersByName(self, Name: str):
-        return [x for x in self.Members if x.Name == Name]
+        return list(self._MembersByName.get(Name, ()))
+
+    def ToDict(self) -> dict:
+        """ Serialize the page into a compact JSON compatible dict """
+        return {
+            "DocString": self.DocString,
+            "Members": [
+                [Member.Name, Member.Type, Member.DocString, Member.RelativeUrl, [[x.Name, x.Type, x.DefaultValue] for x in Member.Parameters]]
+                for Member in self.Members
+            ]
+        }
+
+    @classmethod
+    def FromDict(cls, Name: str, Data: dict) -> DocumentationParsedPage:
+        """ Create a page from data serialized by `ToDict()` """
+        Members = [
+            MemberItem(MemberName, MemberType, DocString, [Parameter(*x) for x in Parameters], RelativeUrl)
+            for MemberName, MemberType, DocString, RelativeUrl, Parameters in Data["Members"]
+        ]
+        return cls(Name, Data["DocString"], Members)
 
 
 def GetParameterNiceName(VariableName: str) -> str:
@@ -77,6 +142,80 @@ def GetParameterNiceName(VariableName: str) -> str:
     return VariableName
 
 
+def GetParserBackend() -> str:
+    """
+    Get the name of the BeautifulSoup parser to use.
+    lxml is used if it's installed since it's a lot faster, otherwise python's built-in html.parser is used.
+    """
+    Backend = os.environ.get(HTML_PARSER_ENV_VARIABLE)
+    if Backend:
+        return Backend
+
+    if _IsLxmlInstalled():
+        return "lxml"
+
+    return "html.parser"
+
+
+@functools.lru_cache(maxsize=None)
+def _IsLxmlInstalled() -> bool:
+    return importlib.util.find_spec("lxml") is not None
+
+
+def GetDocstringConverterName() -> str:
+    """
+    Get which docstring converter to use, see `EDocstringConverter`.
+    Can be set with the `PYFBSDK_DOCSTRING_CONVERTER` environment variable, the markdownify converter is used by default.
+    """
+    Name = os.environ.get(DOCSTRING_CONVERTER_ENV_VARIABLE)
+    if not Name:
+        return EDocstringConverter.Markdownify
+
+    Name = Name.lower()
+    if Name not in (EDocstringConverter.Markdownify, EDocstringConverter.Doxygen):
+        print(f"Warning: Unknown docstring converter '{Name}' in {DOCSTRING_CONVERTER_ENV_VARIABLE}, using '{EDocstringConverter.Markdownify}' instead.")
+        return EDocstringConverter.Markdownify
+
+    return Name
+
+
+def CreateDocstringConverter(UrlBase: str, Name: str | None = None, bUseCache = True) -> DocstringConverter:
+    """
+    Create a docstring converter
+
+    ### Parameters:
+        - UrlBase: Base for any relative urls
+        - Name: The converter to use, see `EDocstringConverter`. Uses `GetDocstringConverterName()` if None.
+        - bUseCache: Re-use the result for HTML that has already been converted
+    """
+    if Name is None:
+        Name = GetDocstringConverterName()
+
+    if Name == EDocstringConverter.Doxygen:
+        return DoxygenDocstringConverter(UrlBase, bUseCache = bUseCache)
+
+    return DocstringMarkdownConverter(UrlBase, bUseCache = bUseCache)
+
+
+def GetParserVersion() -> str:
+    """ 
+    Get a version stamp for the parser, used to invalidate cached parsed pages.
+    Changes whenever the source code of this module, the parser backend or the docstring converter changes.
+    """
+    return f"{PARSER_VERSION}-{_GetSourceHash()}-{GetParserBackend()}-{GetDocstringConverterName()}"
+
+
+def GetMarkdownCacheVersion() -> str:
+    """ Get a version stamp for the docstring converter, used to invalidate the markdown cache saved on disk """
+    return f"{PARSER_VERSION}-{_GetSourceHash()}"
+
+
+@functools.lru_cache(maxsize=None)
+def _GetSourceHash() -> str:
+    with open(__file__, "rb") as File:
+        return hashlib.sha1(File.read()).hexdigest()[:12]
+
+
 def ParsePage(PageName: str, PageHtmlContent: str, BaseURL: str) -> DocumentationParsedPage:
     """
     Parse the HTML content of a page and return a DocumentationParsedPage object.
@@ -86,8 +225,8 @@ def ParsePage(PageName: str, PageHtmlContent: str, BaseURL: str) -> Documentatio
         - `PageHtmlContent`: The HTML content of the page.
         - `BaseURL`: The base URL to be used to resolve relative URLs.
     """
-    DocStringMdConverter = DocstringMarkdownConverter(BaseURL)
-    Parser = BeautifulSoup(PageHtmlContent, "html.parser")
+    DocStringMdConverter = CreateDocstringConverter(BaseURL)
+    Parser = BeautifulSoup(PageHtmlContent, GetParserBackend(), parse_only = PAGE_STRAINER)
 
     DescriptionHtml = Parser.find("div", class_ = ClassNames.TextBlockDescription)
     Description = DocStringMdConverter.ConvertDocString(DescriptionHtml) if DescriptionHtml else ""
@@ -160,86 +299,186 @@ def ParsePage(PageName: str, PageHtmlContent: str, BaseURL: str) -> Documentatio
     return DocumentationParsedPage(PageName, Description.strip(), MemberItems)
 
 
+def CanParseInSubprocesses() -> bool:
+    """ 
+    Check if pages can be parsed in subprocesses.
+    Inside of MotionBuilder `sys.executable` is MotionBuilder itself, so no new processes should be spawned.
+    Having a `pyfbsdk` module imported is not enough to tell, since it may have been loaded from a snapshot.
+    """
+    return not os.path.basename(sys.executable or "").lower().startswith("motionbuilder")
+
+
+def ParsePages(Pages: Sequence[tuple[str, str, str]], MaxWorkers: int | None = 0) -> list[DocumentationParsedPage]:
+    """
+    Parse multiple pages, optionally spread out over multiple processes.
+
+    ### Parameters:
+        - Pages: A list of tuple(PageName, PageHtmlContent, BaseURL), see `ParsePage`
+        - MaxWorkers: Number of processes to use. 0 or 1 parses all pages in the current process, None uses one process per CPU.
+                      Falls back to the current process if subprocesses can't be used, e.g. inside of MotionBuilder.
+
+    ### Returns:
+    The parsed pages, in the same order as `Pages`
+    """
+    if MaxWorkers is None:
+        MaxWorkers = os.cpu_count() or 1
+
+    MaxWorkers = min(MaxWorkers, len(Pages))
+    if MaxWorkers > 1 and CanParseInSubprocesses():
+        try:
+            with ProcessPoolExecutor(max_workers = MaxWorkers) as Executor:
+                return list(Executor.map(ParsePage, *zip(*Pages), chunksize = max(1, len(Pages) // (MaxWorkers * 4))))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"Warning: Failed to parse pages in subprocesses, parsing them in the current process instead. {e}")
+
+    return [ParsePage(*Page) for Page in Pages]
+
+
 def GetSafeText(Text: str):
     # Remove any non-breaking spaces and strip the text of whitespace and commas
     return Text.replace('\xa0', ' ').strip(string.whitespace + ",").replace("\\", "\\\\")
 
 
-class DocstringMarkdownConverter(markdownify.MarkdownConverter):
-    def __init__(self, UrlBase: str, bParamNiceName = True, **options):
-        super().__init__(**options)
+def ResolveUrl(Href: str, UrlBase: str) -> str:
+    """ Get the full URL for a link in the documentation """
+    # Example URLs are broken in the 2024 docs. Resolve them manually.
+    if Href.startswith(SAMPLE_URL_PREFIX):
+        # From: ms-its:MotionBuilder_SDK_Samples.chm::/Scripts/BasicOperations/FBSystemEvents.html
+        # To: _basic_operations_0c_f_b_system_events_8py-example.html
+        Suffix = "_8py-example.html"
+        ScriptsFolder = "Scripts/"
+        if ScriptsFolder in Href:
+            RelativeUrl = Href.partition(ScriptsFolder)[2]
+            ConvertedString: str = re.sub(r'(?<!^)(?=[A-Z])', '_', RelativeUrl).lower()  # Convert from PascalCase to snake_case
+            ConvertedString = ConvertedString.replace("/", "_0c")  # Replace the slashes with _0c
+            ConvertedString = ConvertedString.partition(".")[0]  # Remove the extension (.html)
+            Href = f"_{ConvertedString}{Suffix}"
+
+    if Href and not Href.startswith("http"):
+        Href = f"{UrlBase}{Href}"
+
+    return Href
+
+
+def ConvertCodeBlock(Code: str) -> str:
+    """ Convert the text of a code block to a markdown code block """
+    Code = GetSafeText(Code).strip("`")
+    LanguageType = GetLanguageFromCode(Code)
+
+    if LanguageType == "python":
+        # Replace Python 2 print statements with Python 3 print functions
+        Code = re.sub(PY2_TO_PY3_PRINT_PATTERN, r"print(\1)\n", Code).strip()
+
+    return f"\n```{LanguageType}\n{Code}\n```\n"
 
+
+def PatchDocString(DocString: str) -> str:
+    """ Clean up the markdown created by a docstring converter """
+    # There are some (what I guess is) broken <b> tags scattered around in the docstrings. Remove them.
+    DocString = DocString.replace("b>", " ")
+
+    # Replace single backslashes followed by special characters with the character only
+    DocString = re.sub(r'(?<!\\)\\([*_])', r'\1', DocString)
+    # Replace single backslashes followed by letters/numbers with double backslashes
+    DocString = re.sub(r'(?<!\\)\\([a-zA-Z0-9\s])', r'\\\\\1', DocString)
+
+    DocString = DocString.strip()
+
+    # Go through and patch up the generated docstring
+    Lines = []
+    bInCodeBlock = False
+    bPreviousLineWasEmpty = False
+    for Line in DocString.split("\n"):
+        StrippedLine = Line.strip()
+
+        # Keep track of when we're in a code block
+        if StrippedLine.startswith("```"):
+            bInCodeBlock = not bInCodeBlock
+            Lines.append(StrippedLine)
+            continue
+
+        # Make sure headers are never indentend
+            # continue
+
+        # Don't allow any more than 1 empty lines in a row
+        if bPreviousLineWasEmpty and not StrippedLine:
+            continue
+        bPreviousLineWasEmpty = not StrippedLine
+        if not StrippedLine:
+            Lines.append(StrippedLine)
+            continue
+
+        # Bullet points can be indented, other lines should not be
+        if StrippedLine.startswith("-") or bInCodeBlock:
+            Lines.append(Line)
+        else:
+            Lines.append(StrippedLine)
+
+    DocString = "\n".join(Lines)
+
+    return DocString
+
+
+class DocstringConverter():
+    """ Base class for the converters that creates markdown docstrings from the HTML documentation """
+    Name = ""
+
+    def __init__(self, UrlBase: str, bParamNiceName = True, bUseCache = True, CacheSettings: str = ""):
+        """
+        ### Parameters:
+            - UrlBase: Base for any relative urls
+            - bParamNiceName: Remove the 'p' prefix from parameter names
+            - bUseCache: Re-use the result for HTML that has already been converted, see `markdown_cache`
+            - CacheSettings: Any other settings that affect the result
+        """
         self.UrlBase = UrlBase  # Base for any relative url's found
         self.bParamNiceName = bParamNiceName
+        self.Cache = markdown_cache.GetMarkdownCache() if bUseCache else None
+        self._CacheSettings = (self.Name, str(bParamNiceName), CacheSettings)
 
-    def ConvertDocString(self, DescriptionHtml: Tag | NavigableString):
-        DocString = self.convert(str(DescriptionHtml))
-
-        # There are some (what I guess is) broken <b> tags scattered around in the docstrings. Remove them.
-        DocString = DocString.replace("b>", " ")
-
-        # Replace single backslashes followed by special characters with the character only
-        DocString = re.sub(r'(?<!\\)\\([*_])', r'\1', DocString)
-        # Replace single backslashes followed by letters/numbers with double backslashes
-        DocString = re.sub(r'(?<!\\)\\([a-zA-Z0-9\s])', r'\\\\\1', DocString)
-
-        DocString = DocString.strip()
-
-        # Go through and patch up the generated docstring
-        Lines = []
-        bInCodeBlock = False
-        bPreviousLineWasEmpty = False
-        for Line in DocString.split("\n"):
-            StrippedLine = Line.strip()
-
-            # Keep track of when we're in a code block
-            if StrippedLine.startswith("```"):
-                bInCodeBlock = not bInCodeBlock
-                Lines.append(StrippedLine)
-                continue
-
-            # Make sure headers are never indentend
-                # continue
-
-            # Don't allow any more than 1 empty lines in a row
-            if bPreviousLineWasEmpty and not StrippedLine:
-                continue
-            bPreviousLineWasEmpty = not StrippedLine
-            if not StrippedLine:
-                Lines.append(StrippedLine)
-                continue
-
-            # Bullet points can be indented, other lines should not be
-            if StrippedLine.startswith("-") or bInCodeBlock:
-                Lines.append(Line)
-            else:
-                Lines.append(StrippedLine)
+    def ConvertDocString(self, DescriptionHtml: Tag) -> str:
+        if self.Cache is None:
+            return PatchDocString(self.ConvertToMarkdown(DescriptionHtml))
+
+        Html = str(DescriptionHtml)
 
-        DocString = "\n".join(Lines)
+        # The base url is only used to resolve links, fragments without any are shared between documentation versions
+        UrlBase = self.UrlBase if "href" in Html else ""
+
+        Key = self.Cache.GetKey(Html, UrlBase, *self._CacheSettings)
+        DocString = self.Cache.Get(Key)
+        if DocString is None:
+            DocString = PatchDocString(self.ConvertToMarkdown(DescriptionHtml))
+            self.Cache.Set(Key, DocString)
 
         return DocString
 
+    def ConvertToMarkdown(self, Element: Tag) -> str:
+        """ Convert the element to markdown, before it's patched up by `PatchDocString` """
+        raise NotImplementedError()
+
+
+class DocstringMarkdownConverter(DocstringConverter, markdownify.MarkdownConverter):
+    Name = EDocstringConverter.Markdownify
+
+    def __init__(self, UrlBase: str, bParamNiceName = True, bUseCache = True, **options):
+        """
+        ### Parameters:
+            - UrlBase: Base for any relative urls
+            - bParamNiceName: Remove the 'p' prefix from parameter names
+            - bUseCache: Re-use the result for HTML that has already been converted, see `markdown_cache`
+        """
+        markdownify.MarkdownConverter.__init__(self, **options)
+        DocstringConverter.__init__(self, UrlBase, bParamNiceName, bUseCache, repr(sorted(self.options.items())))
+
+    def ConvertToMarkdown(self, Element: Tag) -> str:
+        return self.convert(str(Element))
+
     def convert_a(self, el: Tag, text, convert_as_inline):
         """ Make sure all <a> tags have a full URL. """
         Href = el.get("href")
-
-        # Example URLs are broken in the 2024 docs. Resolve them manually.
-        SampleUrlPrefix = "ms-its:MotionBuilder_SDK_Samples.chm::"
-        if Href.startswith(SampleUrlPrefix):
-            # From: ms-its:MotionBuilder_SDK_Samples.chm::/Scripts/BasicOperations/FBSystemEvents.html
-            # To: _basic_operations_0c_f_b_system_events_8py-example.html
-            Suffix = "_8py-example.html"
-            ScriptsFolder = "Scripts/"
-            if ScriptsFolder in Href:
-                RelativeUrl = Href.partition(ScriptsFolder)[2]
-                ConvertedString: str = re.sub(r'(?<!^)(?=[A-Z])', '_', RelativeUrl).lower()  # Convert from PascalCase to snake_case
-                ConvertedString = ConvertedString.replace("/", "_0c")  # Replace the slashes with _0c
-                ConvertedString = ConvertedString.partition(".")[0]  # Remove the extension (.html)
-                Href = f"_{ConvertedString}{Suffix}"
-
-        if Href and not Href.startswith("http"):
-            el["href"] = f"{self.UrlBase}{Href}"
-
+        if Href:
+            el["href"] = ResolveUrl(Href, self.UrlBase)
         return super().convert_a(el, text, convert_as_inline)
 
     def convert_p(self, el, text, convert_as_inline):
@@ -304,14 +543,297 @@ class DocstringMarkdownConverter(markdownify.MarkdownConverter):
         for Child in el.find_all('div', class_='ttc'):
             Child.decompose()
 
-        Code = GetSafeText(el.get_text()).strip("`")
-        LanguageType = GetLanguageFromCode(Code)
+        return ConvertCodeBlock(el.get_text())
+
+
+class DoxygenDocstringConverter(DocstringConverter):
+    """
+    Converts the Doxygen HTML in the documentation to markdown in a single pass over the already parsed elements.
+
+    Gives the same result as `DocstringMarkdownConverter` (with markdownify 0.11) for the HTML in the documentation,
+    but without parsing the HTML again for each docstring, <dt> tag and parameter table cell.
+    Elements are converted in one of two modes, the same way as `DocstringMarkdownConverter` does:
+        - The docstring mode, with the overrides in `DocstringMarkdownConverter`, e.g. <p> tags only adds one new line.
+        - The plain mode, with markdownify's default conversions. Used for <dt> tags and parameter table cells,
+          which `DocstringMarkdownConverter` converts by calling `markdownify.markdownify`.
+
+    Use `CompareDocstringConverters` to check that the converters gives the same result, `tests/test_docstring_converters.py`
+    checks it for a sample page. The conversion rules are copied from markdownify 0.11, so run the tests when markdownify is updated.
+    """
+    Name = EDocstringConverter.Doxygen
+
+    def ConvertToMarkdown(self, Element: Tag) -> str:
+        return self._ConvertRoot(Element, bPlain = False)
+
+    def _ConvertRoot(self, Element: Tag, bPlain: bool) -> str:
+        """ Convert an element the same way as if its HTML was parsed into a new document and converted """
+        return self._ConvertElement(Element, [Element], 0, [], False, bPlain)
+
+    def _ConvertElement(self, Element: Tag, Siblings: list, Index: int, Parents: list[tuple[Tag, list, int]],
+                        bInline: bool, bPlain: bool) -> str:
+        """
+        ### Parameters:
+            - Element: The element to convert
+            - Siblings: The children of the element's parent (see `_GetChildren`), including the element itself
+            - Index: The element's index in `Siblings`
+            - Parents: The element's parents as tuple(Parent, Siblings, Index), the closest parent last
+            - bInline: If the element is inside of an element that can't contain new lines, e.g. a table cell
+            - bPlain: Use markdownify's default conversions instead of the ones in `DocstringMarkdownConverter`
+        """
+        Name = Element.name
+        if not bPlain:
+            # These only use the element's text or HTML, so there is no need to convert the children
+            if Name == "pre" or (Name == "div" and ClassNames.CodeBlock in Element.get("class", ())):
+                return self._ConvertCodeBlock(Element)
+            if Name == "dt":
+                return f"### {self._ConvertRoot(Element, bPlain = True)}:\n"
+            if Name == "table" and ClassNames.ParameterTalble in Element.get("class", ()):
+                return self._ConvertParameterTable(Element)
+
+        bChildrenInline = bInline or Name == "td" or Name == "th" or HEADING_PATTERN.match(Name) is not None
+        Children = _GetChildren(Element)
+        GrandParentName = Parents[-1][0].name if Parents else "[document]"
+
+        Parents.append((Element, Siblings, Index))
+        Text = ""
+        for ChildIndex, Child in enumerate(Children):
+            if isinstance(Child, NavigableString):
+                if not isinstance(Child, (Comment, Doctype)):
+                    NextSibling = Children[ChildIndex + 1] if ChildIndex + 1 < len(Children) else None
+                    Text += _ConvertText(Child, Name, GrandParentName, NextSibling)
+            else:
+                Text += self._ConvertElement(Child, Children, ChildIndex, Parents, bChildrenInline, bPlain)
+        Parents.pop()
+
+        ParentName = Parents[-1][0].name if Parents else "[document]"
+
+        if Name == "a":
+            Href = Element.get("href")
+            if Href:
+                Href = ResolveUrl(Href, self.UrlBase)
+            return _ConvertLink(Text, Href, Element.get("title"))
+
+        if Name == "p":
+            if not bPlain:
+                return Text.strip() + "\n"
+            if bInline:
+                return Text
+            return f"{Text}\n\n" if Text else ""
+
+        if Name == "b":
+            return _ConvertInline(Text, "**") if bPlain else Text
+
+        if Name == "strong":
+            return _ConvertInline(Text, "**")
+
+        if Name == "em" or Name == "i":
+            return _ConvertInline(Text, "*")
+
+        if Name == "code" or Name == "kbd" or Name == "samp":
+            if ParentName == "pre":
+                return Text
+            return _ConvertInline(Text, "`")
 
-        if LanguageType == "python":
-            # Replace Python 2 print statements with Python 3 print functions
-            Code = re.sub(PY2_TO_PY3_PRINT_PATTERN, r"print(\1)\n", Code).strip()
+        if Name == "del" or Name == "s":
+            return _ConvertInline(Text, "~~")
 
-        return f"\n```{LanguageType}\n{Code}\n```\n"
+        if Name == "sub" or Name == "sup":
+            return _ConvertInline(Text, "")
+
+        if Name == "dd":
+            return Text if bPlain else Text.strip("\n")
+
+        if Name == "table":
+            return f"\n\n{Text}\n" if bPlain else Text
+
+        if Name == "td" or Name == "th":
+            return f" {Text} |"
+
+        if Name == "tr":
+            return self._ConvertTableRow(Element, Text, Siblings, Index, Parents)
+
+        if Name == "ul" or Name == "ol":
+            bBeforeParagraph = Index + 1 < len(Siblings) and Siblings[Index + 1].name not in ("ul", "ol")
+            if any(Parent.name == "li" for Parent, _, _ in Parents):
+                return "\n" + LINE_BEGINNING_PATTERN.sub("\t", Text).rstrip() if Text else "\n"
+            return Text + ("\n" if bBeforeParagraph else "")
+
+        if Name == "li":
+            if ParentName == "ol":
+                Start = Parents[-1][0].get("start")
+                Bullet = f"{(int(Start) if Start else 1) + Index}."
+            else:
+                Depth = sum(1 for Parent, _, _ in Parents if Parent.name == "ul") - 1
+                Bullet = "*+-"[Depth % 3]
+            return f"{Bullet} {Text.strip()}\n"
+
+        if Name == "pre":
+            return f"\n```\n{Text}\n```\n" if Text else ""
+
+        if Name == "br":
+            return "" if bInline else "  \n"
+
+        if Name == "hr":
+            return "\n\n---\n\n"
+
+        if Name == "img":
+            Alt = Element.attrs.get("alt", None) or ""
+            if bInline:
+                return Alt
+            Source = Element.attrs.get("src", None) or ""
+            Title = Element.attrs.get("title", None) or ""
+            TitlePart = ' "%s"' % Title.replace('"', r'\"') if Title else ""
+            return f"![{Alt}]({Source}{TitlePart})"
+
+        if Name == "blockquote":
+            if bInline:
+                return Text
+            return "\n" + (LINE_BEGINNING_PATTERN.sub("> ", Text) + "\n\n") if Text else ""
+
+        HeadingMatch = HEADING_LEVEL_PATTERN.match(Name)
+        if HeadingMatch:
+            if bInline:
+                return Text
+            Level = int(HeadingMatch.group(1))
+            Text = Text.rstrip()
+            if Level <= 2:
+                return f"{Text}\n{('=' if Level == 1 else '-') * len(Text)}\n\n" if Text else ""
+            return f"{'#' * Level} {Text}\n\n"
+
+        return Text
+
+    def _ConvertCodeBlock(self, Element: Tag) -> str:
+        return ConvertCodeBlock("".join(_GetCodeText(Element)))
+
+    def _ConvertParameterTable(self, Element: Tag) -> str:
+        ParameterLines = []
+        Row: Tag
+        for Row in Element.find_all("tr"):
+            Text = ""
+
+            Cell: Tag
+            for Index, Cell in enumerate(Row.find_all("td")):
+                if Index == 0 and ClassNames.ParameterName in Cell.get("class", ()):
+                    ParameterName = GetSafeText(Cell.get_text())
+                    if self.bParamNiceName:
+                        ParameterName = GetParameterNiceName(ParameterName)
+                    Text = f"    - {ParameterName}: "
+                else:
+                    Text += self._ConvertRoot(Cell, bPlain = True).strip(string.whitespace + "|")
+
+            ParameterLines.append(Text)
+
+        return "\n".join(ParameterLines)
+
+    def _ConvertTableRow(self, Element: Tag, Text: str, Siblings: list, Index: int, Parents: list[tuple[Tag, list, int]]) -> str:
+        Cells = Element.find_all(["td", "th"])
+        bIsFirstRow = Index == 0
+        Overline = ""
+        Underline = ""
+        if bIsFirstRow and all(Cell.name == "th" for Cell in Cells):
+            # First row and is a header, add a header underline
+            Underline = "| " + " | ".join(["---"] * len(Cells)) + " |\n"
+        elif bIsFirstRow and Parents:
+            Parent, _, ParentIndex = Parents[-1]
+            # First row of the table (or of the first <tbody>), add an empty header above it
+            if Parent.name == "table" or (Parent.name == "tbody" and ParentIndex == 0):
+                Overline = "| " + " | ".join([""] * len(Cells)) + " |\n"
+                Overline += "| " + " | ".join(["---"] * len(Cells)) + " |\n"
+
+        return f"{Overline}|{Text}\n{Underline}"
+
+
+def _GetChildren(Element: Tag) -> list:
+    """
+    Get the children of an element.
+    Whitespace-only text next to list/table elements are skipped the same way as markdownify does it.
+    """
+    if Element.name not in NESTED_ELEMENTS:
+        return Element.contents
+
+    Children = list(Element.contents)
+    Index = 0
+    while Index < len(Children):
+        Child = Children[Index]
+        if isinstance(Child, NavigableString) and not Child.strip():
+            Previous = Children[Index - 1] if Index > 0 else None
+            Next = Children[Index + 1] if Index + 1 < len(Children) else None
+            if Previous is None or Next is None or Previous.name in NESTED_ELEMENTS or Next.name in NESTED_ELEMENTS:
+                # markdownify removes them while iterating over the children, which also skips the next child
+                del Children[Index]
+        Index += 1
+
+    return Children
+
+
+def _GetCodeText(Element: Tag) -> Iterator[str]:
+    """ Get the text in a code block, excluding tooltips (<div> tags with the class name "ttc") """
+    for Child in _GetChildren(Element):
+        if isinstance(Child, Tag):
+            if not (Child.name == "div" and "ttc" in Child.get("class", ())):
+                yield from _GetCodeText(Child)
+        elif type(Child) in CODE_TEXT_TYPES:
+            yield Child
+
+
+def _ConvertText(Text: str, ParentName: str, GrandParentName: str, NextSibling) -> str:
+    # Whitespace is kept in code blocks
+    if not (ParentName == "pre" or (ParentName == "code" and GrandParentName == "pre")):
+        Text = WHITESPACE_PATTERN.sub(" ", Text)
+
+    if ParentName != "code" and ParentName != "pre":
+        Text = Text.replace("*", r"\*").replace("_", r"\_")
+
+    # Remove trailing whitespace at the end of list items
+    if ParentName == "li" and (NextSibling is None or NextSibling.name in ("ul", "ol")):
+        Text = Text.rstrip()
+
+    return Text
+
+
+def _ConvertInline(Text: str, Markup: str) -> str:
+    """ Wrap the text with the markup, e.g. '**' for bold text. Leading/trailing spaces are moved outside the markup. """
+    Prefix = " " if Text and Text[0] == " " else ""
+    Suffix = " " if Text and Text[-1] == " " else ""
+    Text = Text.strip()
+    if not Text:
+        return ""
+    return f"{Prefix}{Markup}{Text}{Markup}{Suffix}"
+
+
+def _ConvertLink(Text: str, Href: str | None, Title: str | None) -> str:
+    Prefix = " " if Text and Text[0] == " " else ""
+    Suffix = " " if Text and Text[-1] == " " else ""
+    Text = Text.strip()
+    if not Text:
+        return ""
+
+    if Text.replace(r"\_", "_") == Href and not Title:
+        return f"<{Href}>"
+
+    TitlePart = ' "%s"' % Title.replace('"', r'\"') if Title else ""
+    return f"{Prefix}[{Text}]({Href}{TitlePart}){Suffix}" if Href else Text
+
+
+def CompareDocstringConverters(PageHtmlContent: str, BaseURL: str = "") -> list[tuple[str, str, str]]:
+    """
+    Convert all docstrings in a page with both `DocstringMarkdownConverter` and `DoxygenDocstringConverter`.
+
+    ### Returns:
+    A list of tuple(Html, MarkdownifyDocString, DoxygenDocString) for the docstrings where the results are different
+    """
+    Parser = BeautifulSoup(PageHtmlContent, GetParserBackend(), parse_only = PAGE_STRAINER)
+    MarkdownifyConverter = DocstringMarkdownConverter(BaseURL, bUseCache = False)
+    DoxygenConverter = DoxygenDocstringConverter(BaseURL, bUseCache = False)
+
+    Differences = []
+    for Element in Parser.find_all("div", class_ = [ClassNames.TextBlockDescription, ClassNames.Doc]):
+        DocString = DoxygenConverter.ConvertDocString(Element)
+        ExpectedDocString = MarkdownifyConverter.ConvertDocString(Element)
+        if DocString != ExpectedDocString:
+            Differences.append((str(Element), ExpectedDocString, DocString))
+
+    return Differences
 
 
 def GetLanguageFromCode(Code: str):
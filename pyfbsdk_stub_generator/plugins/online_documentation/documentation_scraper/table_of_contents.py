@@ -3,17 +3,32 @@ Web Documentation scraper for the pyfbsdk SDK.
 """
 from __future__ import annotations
 
-from importlib import reload
+import threading
 
-import requests
-import js2py
+from collections import OrderedDict
+from importlib import reload
+from typing import Iterable
 
 from . import documentation_cache as cache
+from . import documentation_bundle as bundle
+from . import cache_backends as backends
+from . import http_client
 from . import documentation_urls as urls
+from . import navtree_parser
 from . import page_parser
+from . import markdown_cache
 
-reload(cache)
+try:
+    import js2py  # Optional, only used as a fallback if the table of contents couldn't be parsed
+except ImportError:
+    js2py = None
+
+reload(http_client)
+reload(navtree_parser)
+reload(bundle)
+reload(backends)
 reload(page_parser)
+# documentation_cache is not reloaded, since it keeps the open bundles & cache backends
 
 
 NameSpaceModuleMap = {
@@ -39,48 +54,239 @@ class TableOfContentItem:
     def GetPageUrl(self):
         return urls.GetPythonPageContentsUrl(self.RelativeUrl, self.Version)
 
-    def ParsePage(self):
-        Url = self.GetPageUrl()
-
+    def GetContentUrl(self):
+        """ Get the url of the page without the hash, multiple items may share the same content url """
         # Strip the hash from the url, to avoid caching the same page multiple times
-        if "#" in Url:
-            Url = Url.partition("#")[0]
+        return self.GetPageUrl().partition("#")[0]
+
+    def GetPageContent(self) -> str:
+        return cache.GetUrlContent(self.GetContentUrl(), self.bUseCache)
+
+    def GetBaseUrl(self):
+        """ Get the url that relative urls on the page are relative to """
+        return urls.GetPythonPageContentsUrl("", self.Version)
+
+    def LoadCachedParsedPage(self, PageContent: str) -> page_parser.DocumentationParsedPage | None:
+        """ Get the parsed page from the disk cache, if it was parsed from the same content & parser version """
+        if not self.bUseCache:
+            return None
 
+        ContentHash = cache.GetContentHash(PageContent)
+        CachedPage = cache.GetCachedParsedPage(self.GetContentUrl(), ContentHash, page_parser.GetParserVersion())
+        if CachedPage is None:
+            return None
+
+        return page_parser.DocumentationParsedPage.FromDict(self.Name, CachedPage)
+
+    def SaveParsedPage(self, PageContent: str, ParsedPage: page_parser.DocumentationParsedPage):
+        """ Store the parsed page in the disk cache """
         if self.bUseCache:
-            PageContent = cache.CachedGetRequest(Url)
-        else:
-            PageContent = requests.get(Url, timeout=10).text
+            ContentHash = cache.GetContentHash(PageContent)
+            cache.CacheParsedPage(self.GetContentUrl(), ContentHash, page_parser.GetParserVersion(), ParsedPage.ToDict())
+
+    def ParsePage(self, PageContent: str | None = None):
+        """
+        Parse the page
 
-        BaseURL = urls.GetPythonPageContentsUrl("", self.Version)
+        ### Parameters:
+            - PageContent: The HTML content of the page, if None it'll be downloaded
+        """
+        if PageContent is None:
+            PageContent = self.GetPageContent()
 
-        return page_parser.ParsePage(self.Name, PageContent, BaseURL)
+        ParsedPage = self.LoadCachedParsedPage(PageContent)
+        if ParsedPage is None:
+            ParsedPage = page_parser.ParsePage(self.Name, PageContent, self.GetBaseUrl())
+            self.SaveParsedPage(PageContent, ParsedPage)
+
+        return ParsedPage
 
 
 class Documentation():
-    def __init__(self, Namespace: str, Version: int, bUseCache = False) -> None:
+    def __init__(self, Namespace: str, Version: int, bUseCache = False, MaxCachedPages: int | None = 256) -> None:
+        """
+        ### Parameters:
+            - Namespace: The documentation namespace, e.g. 'pyfbsdk'
+            - Version: The MotionBuilder version
+            - bUseCache: Cache the downloaded pages on disk
+            - MaxCachedPages: Max number of parsed pages to keep in memory, the least recently used pages are dropped first. 
+                              None means no limit. Prefetched pages are always kept.
+        """
         self.Namespace = Namespace
         self.Version = Version
+        self.bUseCache = bUseCache
+
+        # Bundles are resolved once per run, so any bundle that has been replaced since the last run is re-opened
+        cache.RefreshBundles()
+
         self.TableOfContents = GetPythonTableOfContents(Namespace, Version, bUseCache)
 
-    def GetParsedPage(self, Name: str):
+        # If multiple items share the same name, the first one is used
+        self.TableOfContentsMap: dict[str, TableOfContentItem] = {}
         for Page in self.TableOfContents:
-            if Page.Name == Name:
-                return Page.ParsePage()
+            self.TableOfContentsMap.setdefault(Page.Name, Page)
+
+        self.PrefetchedPages: dict[str, page_parser.DocumentationParsedPage] = {}
+
+        self.MaxCachedPages = MaxCachedPages
+        self._ParsedPageCache: OrderedDict[str, page_parser.DocumentationParsedPage] = OrderedDict()
+        self._ParsedPageCacheLock = threading.Lock()
+
+        # Converted docstrings are shared between pages, and between runs if the disk cache is used
+        self.MarkdownCache = markdown_cache.GetMarkdownCache()
+        self.MarkdownCache.ResetStatistics()
+        if bUseCache:
+            self.MarkdownCache.Load(cache.GetMarkdownCacheFilepath(), page_parser.GetMarkdownCacheVersion())
+
+    def SaveCaches(self):
+        """ Save any in-memory caches to disk, if the disk cache is used """
+        if self.bUseCache:
+            self.MarkdownCache.Save(cache.GetMarkdownCacheFilepath(), page_parser.GetMarkdownCacheVersion())
 
-        return None
+    def GetTableOfContentItem(self, Name: str) -> TableOfContentItem | None:
+        return self.TableOfContentsMap.get(Name)
+
+    def Prefetch(self, Names: Iterable[str], MaxWorkers: int = 16, ParseWorkers: int | None = 0):
+        """
+        Download the pages for the given names concurrently and parse them, 
+        after this `GetParsedPage` will return the pages directly from memory.
+
+        ### Parameters:
+            - Names: Names of the pages to prefetch, names not found in the table of contents are ignored
+            - MaxWorkers: Max number of pages to download at the same time
+            - ParseWorkers: Number of processes to parse the pages in, see `page_parser.ParsePages`
+        """
+        Items: list[TableOfContentItem] = []
+        for Name in dict.fromkeys(Names):
+            Item = self.TableOfContentsMap.get(Name)
+            if Item and Name not in self.PrefetchedPages:
+                Items.append(Item)
+
+        if not Items:
+            return
+
+        # Multiple items can point to the same page, only download each page once
+        Contents = cache.GetUrlContents([Item.GetContentUrl() for Item in Items], self.bUseCache, MaxWorkers)
+
+        # Pages that are not already parsed in the disk cache
+        CachedPages = {}
+        if self.bUseCache:
+            ContentHashes = {Url: cache.GetContentHash(Content) for Url, Content in Contents.items()}
+            CachedPages = cache.GetCachedParsedPages(ContentHashes, page_parser.GetParserVersion())
+
+        ItemsToParse: list[TableOfContentItem] = []
+        for Item in Items:
+            CachedPage = CachedPages.get(Item.GetContentUrl())
+            if CachedPage is None:
+                ItemsToParse.append(Item)
+            else:
+                self.PrefetchedPages[Item.Name] = page_parser.DocumentationParsedPage.FromDict(Item.Name, CachedPage)
+
+        Pages = [(Item.Name, Contents[Item.GetContentUrl()], Item.GetBaseUrl()) for Item in ItemsToParse]
+        PagesToCache = {}
+        for Item, ParsedPage in zip(ItemsToParse, page_parser.ParsePages(Pages, ParseWorkers)):
+            self.PrefetchedPages[Item.Name] = ParsedPage
+            if self.bUseCache:
+                PagesToCache[Item.GetContentUrl()] = (ContentHashes[Item.GetContentUrl()], ParsedPage.ToDict())
+
+        if PagesToCache:
+            cache.CacheParsedPages(PagesToCache, page_parser.GetParserVersion())
+
+        self.SaveCaches()
+
+    def GetParsedPage(self, Name: str):
+        if Name in self.PrefetchedPages:
+            return self.PrefetchedPages[Name]
+
+        with self._ParsedPageCacheLock:
+            if Name in self._ParsedPageCache:
+                self._ParsedPageCache.move_to_end(Name)
+                return self._ParsedPageCache[Name]
+
+        Page = self.TableOfContentsMap.get(Name)
+        if Page is None:
+            return None
+
+        ParsedPage = Page.ParsePage()
+
+        if self.MaxCachedPages != 0:
+            with self._ParsedPageCacheLock:
+                self._ParsedPageCache[Name] = ParsedPage
+                if self.MaxCachedPages is not None:
+                    while len(self._ParsedPageCache) > self.MaxCachedPages:
+                        self._ParsedPageCache.popitem(last=False)
+
+        return ParsedPage
 
 
 def GetPythonTableOfContents(Namespace: str, Version: int, bUseCache: bool = False) -> list[TableOfContentItem]:
     Url = urls.GetPythonTableOfContentsUrl(Namespace, Version)
-    if bUseCache:
-        Response = cache.CachedGetRequest(Url)
-    else:
-        Response = requests.get(Url, timeout=10).text
+    Response = cache.GetUrlContent(Url, bUseCache)
 
-    ParsedResponse = js2py.eval_js(Response)
+    ParsedResponse = ParseTableOfContentsScript(Response)
 
     return [TableOfContentItem(Data, Version, bUseCache) for Data in ParsedResponse]
 
 
+def ExportDocumentationBundle(Filepath: str, Version: int, Namespaces: Iterable[str] | None = None, bUseCache = False, MaxWorkers: int = 16) -> str:
+    """
+    Download the table of contents & all pages of the documentation into a single bundle file, see `documentation_bundle`
+
+    ### Parameters:
+        - Filepath: The bundle filepath
+        - Version: The MotionBuilder version
+        - Namespaces: The documentation namespaces to include, e.g. ['pyfbsdk']. None includes all namespaces.
+        - bUseCache: Read/write the pages from/to the disk cache
+        - MaxWorkers: Max number of pages to download at the same time
+
+    ### Returns:
+    The filepath
+    """
+    if Namespaces is None:
+        Namespaces = NameSpaceModuleMap.values()
+    Namespaces = list(dict.fromkeys(Namespaces))
+
+    Contents: dict[str, str] = {}
+    PageUrls: dict[str, None] = {}
+    for Namespace in Namespaces:
+        Url = urls.GetPythonTableOfContentsUrl(Namespace, Version)
+        Contents[Url] = cache.GetUrlContent(Url, bUseCache)
+
+        for Data in ParseTableOfContentsScript(Contents[Url]):
+            Item = TableOfContentItem(Data, Version, bUseCache)
+            if Item.RelativeUrl:
+                PageUrls[Item.GetContentUrl()] = None
+
+    Contents.update(cache.GetUrlContents(PageUrls, bUseCache, MaxWorkers))
+
+    return bundle.WriteBundle(Filepath, Version, Namespaces, Contents)
+
+
+def CompareDocstringConvertersOnCachedPages() -> dict[str, list[tuple[str, str, str]]]:
+    """
+    Run `page_parser.CompareDocstringConverters` for all pages in the documentation cache, see `documentation_cache`
+
+    ### Returns:
+    Map of the cached page urls and the differences, only pages with differences are included
+    """
+    Differences = {}
+    for Url in cache.GetCachedUrls():
+        PageDifferences = page_parser.CompareDocstringConverters(cache.GetCachedContent(Url))
+        if PageDifferences:
+            Differences[Url] = PageDifferences
+
+    return Differences
+
+
+def ParseTableOfContentsScript(Script: str) -> list:
+    """ Get the table of contents array from the javascript file """
+    try:
+        return navtree_parser.ParseNavTree(Script)
+    except navtree_parser.NavTreeParseError:
+        if js2py is None:
+            raise
+        return js2py.eval_js(Script)
+
+
 def GetNameSpaceFromModule(ModuleName: str) -> str | None:
     return NameSpaceModuleMap.get(ModuleName)
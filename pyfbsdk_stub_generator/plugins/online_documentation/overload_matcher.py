@@ -0,0 +1,216 @@
+"""
+Matches a function's overloads with the documented members of the same name.
+
+Overloads are first matched with members that have the exact same parameter types, the rest are matched by a score
+of how similar their parameter types are. The greedy matching (highest score first) is used unless a globally
+optimal assignment of the overloads gives a higher total score.
+"""
+from __future__ import annotations
+
+import typing
+import heapq
+
+from collections import defaultdict, deque
+
+# A list of the parameter types for each overload/member
+TypeVector = typing.Sequence[typing.Union[str, None]]
+
+
+def IsTypeDefined(Type: str | None) -> bool:
+    if not Type:
+        return False
+    return Type != "object" and Type != "Any"
+
+
+def GetPerfectMatches(FunctionTypes: typing.Sequence[TypeVector], MemberTypes: typing.Sequence[TypeVector]) -> list[tuple[int, int]]:
+    """
+    Match functions with members that have the exact same parameter types.
+    Each function is matched with the first unmatched member with the same types.
+
+    ### Returns:
+    A list of tuple(FunctionIndex, MemberIndex)
+    """
+    MembersByTypes: dict[tuple, deque[int]] = defaultdict(deque)
+    for MemberIndex, Types in enumerate(MemberTypes):
+        MembersByTypes[tuple(Types)].append(MemberIndex)
+
+    Matches = []
+    for FunctionIndex, Types in enumerate(FunctionTypes):
+        Candidates = MembersByTypes.get(tuple(Types))
+        if Candidates:
+            Matches.append((FunctionIndex, Candidates.popleft()))
+
+    return Matches
+
+
+def GetMatchScore(FunctionTypes: TypeVector, MemberTypes: TypeVector) -> int:
+    """
+    Get a score of how well the parameter types matches, higher is better.
+
+    ### Parameters:
+        - FunctionTypes: The function's parameter types
+        - MemberTypes: The member's parameter types, already validated with `EnsureValidType`
+
+    ### Returns:
+    The score, 0 or lower means that the member is not compatible with the function.
+    """
+    Score = 0
+    if len(FunctionTypes) == len(MemberTypes):
+        Score += 1
+
+    for FunctionType, MemberType in zip(FunctionTypes, MemberTypes):
+        if not MemberType or not FunctionType:
+            continue
+        if FunctionType == MemberType:
+            Score += 1
+        elif MemberType.startswith("list") and FunctionType == "list":
+            Score += 1
+        elif IsTypeDefined(FunctionType):
+            # Member description is not compatible with current function
+            return -1
+
+    return Score
+
+
+def GetGreedyMatches(Scores: dict[tuple[int, int], int]) -> list[tuple[int, int]]:
+    """
+    Match the pairs with the highest score first, pairs with the same score are matched in the order they were added.
+
+    ### Parameters:
+        - Scores: Map of tuple(FunctionIndex, MemberIndex) and their score, only compatible pairs should be included.
+    """
+    Heap = [(-Score, Order, Pair) for Order, (Pair, Score) in enumerate(Scores.items())]
+    heapq.heapify(Heap)
+
+    MatchedFunctions: set[int] = set()
+    MatchedMembers: set[int] = set()
+    Matches = []
+    while Heap:
+        _, _, (FunctionIndex, MemberIndex) = heapq.heappop(Heap)
+        if FunctionIndex in MatchedFunctions or MemberIndex in MatchedMembers:
+            continue
+        MatchedFunctions.add(FunctionIndex)
+        MatchedMembers.add(MemberIndex)
+        Matches.append((FunctionIndex, MemberIndex))
+
+    return Matches
+
+
+def GetOptimalMatches(Scores: dict[tuple[int, int], int]) -> list[tuple[int, int]]:
+    """
+    Find the matching with the highest total score using the Hungarian algorithm.
+
+    ### Parameters:
+        - Scores: Map of tuple(FunctionIndex, MemberIndex) and their score, only compatible pairs should be included.
+    """
+    if not Scores:
+        return []
+
+    Rows = sorted({x[0] for x in Scores})
+    Columns = sorted({x[1] for x in Scores})
+    bTransposed = len(Rows) > len(Columns)
+    if bTransposed:
+        Rows, Columns = Columns, Rows
+
+    def _GetCost(Row: int, Column: int) -> int:
+        Pair = (Column, Row) if bTransposed else (Row, Column)
+        return -Scores.get(Pair, 0)
+
+    # Hungarian algorithm for a rectangular (Rows <= Columns) cost matrix, using 1-based indices
+    RowCount, ColumnCount = len(Rows), len(Columns)
+    Infinity = float("inf")
+    RowPotentials = [0] * (RowCount + 1)
+    ColumnPotentials = [0] * (ColumnCount + 1)
+    ColumnMatches = [0] * (ColumnCount + 1)  # Row matched with each column
+    Way = [0] * (ColumnCount + 1)
+    for Row in range(1, RowCount + 1):
+        ColumnMatches[0] = Row
+        CurrentColumn = 0
+        MinValues = [Infinity] * (ColumnCount + 1)
+        Used = [False] * (ColumnCount + 1)
+        while True:
+            Used[CurrentColumn] = True
+            CurrentRow = ColumnMatches[CurrentColumn]
+            Delta = Infinity
+            NextColumn = 0
+            for Column in range(1, ColumnCount + 1):
+                if Used[Column]:
+                    continue
+                Value = _GetCost(Rows[CurrentRow - 1], Columns[Column - 1]) - RowPotentials[CurrentRow] - ColumnPotentials[Column]
+                if Value < MinValues[Column]:
+                    MinValues[Column] = Value
+                    Way[Column] = CurrentColumn
+                if MinValues[Column] < Delta:
+                    Delta = MinValues[Column]
+                    NextColumn = Column
+
+            for Column in range(ColumnCount + 1):
+                if Used[Column]:
+                    RowPotentials[ColumnMatches[Column]] += Delta
+                    ColumnPotentials[Column] -= Delta
+                else:
+                    MinValues[Column] -= Delta
+
+            CurrentColumn = NextColumn
+            if ColumnMatches[CurrentColumn] == 0:
+                break
+
+        while CurrentColumn:
+            PreviousColumn = Way[CurrentColumn]
+            ColumnMatches[CurrentColumn] = ColumnMatches[PreviousColumn]
+            CurrentColumn = PreviousColumn
+
+    Matches = []
+    for Column in range(1, ColumnCount + 1):
+        if ColumnMatches[Column]:
+            MatchedRow, MatchedColumn = Rows[ColumnMatches[Column] - 1], Columns[Column - 1]
+            Pair = (MatchedColumn, MatchedRow) if bTransposed else (MatchedRow, MatchedColumn)
+            # Pairs that wasn't compatible may be used to fill up the assignment, those are not matches
+            if Pair in Scores:
+                Matches.append(Pair)
+
+    return sorted(Matches)
+
+
+def GetTotalScore(Matches: list[tuple[int, int]], Scores: dict[tuple[int, int], int]) -> int:
+    return sum(Scores[x] for x in Matches)
+
+
+def MatchOverloads(FunctionTypes: typing.Sequence[TypeVector], MemberTypes: typing.Sequence[TypeVector],
+                   ValidatedMemberTypes: typing.Sequence[TypeVector]) -> list[tuple[int, int]]:
+    """
+    Match function overloads with documented members.
+
+    ### Parameters:
+        - FunctionTypes: Parameter types for each function (excluding self)
+        - MemberTypes: Parameter types for each member, as written in the documentation
+        - ValidatedMemberTypes: Same as `MemberTypes`, but validated with `EnsureValidType`
+
+    ### Returns:
+    A list of tuple(FunctionIndex, MemberIndex)
+    """
+    Matches = GetPerfectMatches(FunctionTypes, MemberTypes)
+    MatchedFunctions = {x[0] for x in Matches}
+    MatchedMembers = {x[1] for x in Matches}
+
+    Scores: dict[tuple[int, int], int] = {}
+    for FunctionIndex, Types in enumerate(FunctionTypes):
+        if FunctionIndex in MatchedFunctions:
+            continue
+        for MemberIndex, ValidatedTypes in enumerate(ValidatedMemberTypes):
+            if MemberIndex in MatchedMembers:
+                continue
+            Score = GetMatchScore(Types, ValidatedTypes)
+            if Score > 0:
+                Scores[(FunctionIndex, MemberIndex)] = Score
+
+    ScoreMatches = GetGreedyMatches(Scores)
+
+    # Only use the optimal matches if they are better, to keep the greedy result when they are equally good.
+    # If all compatible pairs were matched, the greedy result is already optimal.
+    if len(Scores) > len(ScoreMatches):
+        OptimalMatches = GetOptimalMatches(Scores)
+        if GetTotalScore(OptimalMatches, Scores) > GetTotalScore(ScoreMatches, Scores):
+            ScoreMatches = OptimalMatches
+
+    return Matches + ScoreMatches
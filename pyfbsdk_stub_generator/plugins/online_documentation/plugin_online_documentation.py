@@ -6,12 +6,17 @@ from types import ModuleType
 from importlib import reload
 
 from .documentation_scraper import table_of_contents
+from . import overload_matcher
+from . import type_normalizer
 
 from .documentation_scraper.page_parser import MemberItem, GetParameterNiceName
-from ..plugin import PluginBaseClass
+from .overload_matcher import IsTypeDefined
+from ..plugin import PluginBaseClass, EStubKind
 from ...module_types import StubClass, StubFunction, StubParameter, StubProperty
 
 reload(table_of_contents)
+reload(overload_matcher)
+reload(type_normalizer)
 
 EVENT_SOURCE_TYPE = "callbackframework.FBEventSource"
 
@@ -60,6 +65,10 @@ TRANSLATION_VALUES = {
 class PluginOnlineDocumentation(PluginBaseClass):
     Threading = False
     Priority = 10  # We preferably want this to run directly after the native generator
+    Reads = frozenset((EStubKind.Enums, EStubKind.Classes))  # Default values are looked up in the enum/class stubs' properties, see `PatchPropertyDefaultValue`
+    PrefetchWorkers = 16  # Number of documentation pages to download at the same time
+    MaxCachedPages = 256  # Number of parsed pages (that were not prefetched) to keep in memory
+    ParseWorkers: int | None = 0  # Number of processes used to parse the prefetched pages, None = one per CPU, 0 = parse in the current process
 
     def __init__(self, Version: int, Module: ModuleType, EnumList: list[StubClass], ClassList: list[StubClass], FunctionGroupList: list[list[StubFunction]]):
         super().__init__(Version, Module, EnumList, ClassList, FunctionGroupList)
@@ -68,7 +77,10 @@ class PluginOnlineDocumentation(PluginBaseClass):
         self.DocNamespace = table_of_contents.GetNameSpaceFromModule(self.ModuleName)
         if self.DocNamespace is None:
             return
-        self.Documentation = table_of_contents.Documentation(self.DocNamespace, Version, self.bDevMode)
+        self.Documentation = table_of_contents.Documentation(self.DocNamespace, Version, self.bDevMode, self.MaxCachedPages)
+
+        # Download all of the class & enum pages up front, so patching only has to read from memory
+        self.Documentation.Prefetch([x.Name for x in EnumList + ClassList], self.PrefetchWorkers, self.ParseWorkers)
 
         # Parse the first documentation page to get the list of all pages
         for FunctionGroup in FunctionGroupList:
@@ -77,12 +89,25 @@ class PluginOnlineDocumentation(PluginBaseClass):
             if self.FunctionPage:
                 break
 
-        # Make a map of all class names and their class object that can be used for patching types etc.
+        # Make a map of all class names and their class object that can be used for patching default values
         self.AllClassesMap = {Class.Name: Class for Class in ClassList + EnumList}
+        self.TypeNormalizer = type_normalizer.TypeNormalizer(self.Inventory.ClassNameSet, TRANSLATION_TYPE, TYPE_IGNORE_PREFIXES)
 
     def ShouldPatch(self) -> bool:
         return self.DocNamespace is not None
 
+    def Finish(self):
+        if self.ShouldPatch():
+            self.Documentation.SaveCaches()
+
+    def GetStatistics(self) -> dict:
+        if not self.ShouldPatch():
+            return {}
+        return {
+            "TypeNormalizer": self.TypeNormalizer.GetStatistics(),
+            "MarkdownCache": self.Documentation.MarkdownCache.GetStatistics()
+        }
+
     # ---------------------------------------------------------------------------------------------
     #                                 Patch Entry Methods
     # ---------------------------------------------------------------------------------------------
@@ -146,81 +171,12 @@ class PluginOnlineDocumentation(PluginBaseClass):
             return
 
         # If we have multiple functions and multiple members, we need to figure out which ones to match
+        FunctionTypes = [[x.Type for x in Function.GetParameters(bExcludeSelf = True)] for Function in Functions]
+        MemberTypes = [[x.Type for x in Member.Parameters] for Member in Members]
+        ValidatedMemberTypes = [[self.EnsureValidType(x.Type) if x.Type else None for x in Member.Parameters] for Member in Members]
 
-        # Make copies of the lists so we can modify them without affecting the original lists
-        FunctionsCopy = Functions.copy()
-        MembersCopy = Members.copy()
-
-        # Find all of the functions that has a perfect match with a member, by the parameter types
-        PerfectMatches: list[tuple[StubFunction, MemberItem]] = []
-        MatchedFunctions: list[StubFunction] = []
-        MatchedDocMembers: list[MemberItem] = []
-        for Function in FunctionsCopy:
-            FunctionParameters = Function.GetParameters(bExcludeSelf = True)
-
-            for Member in MembersCopy:
-                if len(FunctionParameters) != len(Member.Parameters):
-                    continue
-
-                for FunctionParameter, MemberParameter in zip(FunctionParameters, Member.Parameters):
-                    if FunctionParameter.Type != MemberParameter.Type:
-                        break
-                else:
-                    # Make sure neither the function or the member has already been matched with another function or member
-                    if Function in MatchedFunctions or Member in MatchedDocMembers:
-                        continue
-                    PerfectMatches.append((Function, Member))
-
-                    MatchedFunctions.append(Function)
-                    MatchedDocMembers.append(Member)
-
-        for Function, Member in PerfectMatches:
-            self.PatchFunctionWithDocumentation(Function, Member, ParentClass)
-
-            # Remove them from the lists so we don't try to match them again
-            FunctionsCopy.remove(Function)
-            MembersCopy.remove(Member)
-
-        # TODO: Match based on most similar parameter types
-        Scores: list[tuple[StubFunction, MemberItem, int]] = []
-        for Function in FunctionsCopy:
-            FunctionParameters = Function.GetParameters(bExcludeSelf = True)
-            for Member in MembersCopy:
-                Score = 0
-                if len(FunctionParameters) == len(Member.Parameters):
-                    Score += 1
-
-                for FunctionParameter, MemberParameter in zip(FunctionParameters, Member.Parameters):
-                    MemberParameterType = self.EnsureValidType(MemberParameter.Type)
-                    if not MemberParameterType or not FunctionParameter.Type:
-                        continue
-                    if FunctionParameter.Type == MemberParameterType:
-                        Score += 1
-                    elif MemberParameterType.startswith("list") and FunctionParameter.Type == "list":
-                        Score += 1
-                    elif IsTypeDefined(FunctionParameter.Type):
-                        # Member description is not compatible with current function
-                        Score = -1
-                        break
-
-                if Score > 0:
-                    Scores.append((Function, Member, Score))
-
-        # Sort the scores from highest to lowest
-        Scores.sort(key = lambda Score: Score[2], reverse = True)
-        while Scores:
-            Function, Member, Score = Scores.pop(0)
-            if Function in MatchedFunctions or Member in MatchedDocMembers:
-                continue
-
-            self.PatchFunctionWithDocumentation(Function, Member, ParentClass)
-
-            MatchedDocMembers.append(Member)
-            MatchedFunctions.append(Function)
-
-            # Remove them from the lists so we don't try to match them again
-            FunctionsCopy.remove(Function)
-            MembersCopy.remove(Member)
+        for FunctionIndex, MemberIndex in overload_matcher.MatchOverloads(FunctionTypes, MemberTypes, ValidatedMemberTypes):
+            self.PatchFunctionWithDocumentation(Functions[FunctionIndex], Members[MemberIndex], ParentClass)
 
     def PatchFunctionWithDocumentation(self, Function: StubFunction, DocMember: MemberItem, ParentClass: StubClass | None = None):
         Function.DocString = DocMember.DocString
@@ -286,12 +242,12 @@ class PluginOnlineDocumentation(PluginBaseClass):
     def EnsureValidPropertyType(self, Property: StubProperty, Type: str) -> str:
 
         # If it's a class, make sure it's a valid class
-        bIsValidFBClass = Type in self.AllClassesMap
+        bIsValidFBClass = self.Inventory.HasClass(Type)
         if not bIsValidFBClass:
             if Type.startswith("FB"):
                 # In the documentation the "Property" part is missing from the class name
                 PropertyType = f"FBProperty{Type[2:]}"
-                if PropertyType in self.AllClassesMap:
+                if self.Inventory.HasClass(PropertyType):
                     Type = PropertyType
 
         # Convert all Events to EventSource
@@ -321,10 +277,10 @@ class PluginOnlineDocumentation(PluginBaseClass):
         elif DefaultValue == "FBString()":
             DefaultValue = '""'
 
-        if DefaultValue.startswith(("FB", "k")) and DefaultValue not in self.AllClassesMap:
+        if DefaultValue.startswith(("FB", "k")) and not self.Inventory.HasClass(DefaultValue):
             EnumClass = self.AllClassesMap.get(Parameter.Type)
             if EnumClass:
-                if any(x.Name for x in EnumClass.StubProperties if x.Name == DefaultValue):
+                if EnumClass.GetPropertyByName(DefaultValue):
                     DefaultValue = f"{EnumClass.Name}.{DefaultValue}"
 
         Parameter.DefaultValue = DefaultValue
@@ -343,56 +299,11 @@ class PluginOnlineDocumentation(PluginBaseClass):
             return True
 
         # TODO: Must check if type is valid as well
-        if CurrentType.startswith(("E", "FB")) and CurrentType not in self.AllClassesMap:
+        if CurrentType.startswith(("E", "FB")) and not self.Inventory.HasClass(CurrentType):
             return True
 
         return False
 
     def EnsureValidType(self, Type: str) -> str | None:
-        if "<" in Type:
-            Type = Type.replace("<", "[").replace(">", "]").replace(" ", "")
-            Type = Type.replace("FBArrayTemplate", "list")
-
-            # Get content between brackets
-            ListTypesStr = Type[Type.find("[") + 1:Type.find("]")]
-            if ListTypesStr:
-                ValidatedTypes = []
-                ListTypes = ListTypesStr.split(",")
-                for ListType in ListTypes:
-                    ListType = self.EnsureValidType(ListType)
-                    if ListType:
-                        ValidatedTypes.append(ListType)
-                
-                if len(ListTypes) != len(ValidatedTypes):
-                    return None
-                
-                Type = Type.replace(ListTypesStr, ",".join(ValidatedTypes))
-                if Type.endswith("[]"):
-                    Type = Type[:-2]
-
-        if " " in Type:
-            for Prefix in TYPE_IGNORE_PREFIXES:
-                if Type.startswith(Prefix):
-                    Type = Type.rpartition(" ")[2]
-        
-        Type = TRANSLATION_TYPE.get(Type, Type)
+        return self.TypeNormalizer.Normalize(Type)
 
-        # Replace namespace C++ syntax with Python
-        if "::" in Type:
-            Type = Type.replace("::", ".")
-
-        if Type.startswith("FB"):
-            ClassName = Type
-            if "." in Type:
-                ClassName = Type.partition(".")[0]
-            if ClassName not in self.AllClassesMap:
-                # print(f"Type not found: {Type}")
-                return None
-
-        return Type
-
-
-def IsTypeDefined(Type: str | None) -> bool:
-    if not Type:
-        return False
-    return Type != "object" and Type != "Any"
@@ -0,0 +1,98 @@
+"""
+Converts C++ types from the documentation into valid Python types, e.g. `FBArrayTemplate<FBModel*>` -> `list[FBModel]`
+
+The same type strings are used all over the documentation, so each result is memoized.
+"""
+from __future__ import annotations
+
+import threading
+import typing
+
+
+class TypeNormalizer():
+    def __init__(self, ClassNames: typing.Iterable[str], TranslationTypes: dict[str, str], IgnorePrefixes: typing.Iterable[str] = ()):
+        """
+        ### Parameters:
+            - ClassNames: Names of all classes & enums in the module, FB types that isn't one of these are invalid
+            - TranslationTypes: Map of C++ types and their Python type, e.g. {"double": "float"}
+            - IgnorePrefixes: Prefixes that are removed from types, e.g. "unsigned"
+        """
+        self.ClassNames = frozenset(ClassNames)
+        self.TranslationTypes = dict(TranslationTypes)
+        self.IgnorePrefixes = tuple(IgnorePrefixes)
+
+        self.Hits = 0
+        self.Misses = 0
+
+        self._Cache: dict[str, str | None] = {}
+        self._Lock = threading.Lock()
+
+    def Normalize(self, Type: str) -> str | None:
+        """
+        Get the Python type for a type from the documentation
+
+        ### Returns:
+        The Python type, or None if it's not a valid type (e.g. a FB class that doesn't exist in the module)
+        """
+        try:
+            Result = self._Cache[Type]
+        except KeyError:
+            Result = self._Normalize(Type)
+            with self._Lock:
+                self._Cache[Type] = Result
+                self.Misses += 1
+            return Result
+
+        with self._Lock:
+            self.Hits += 1
+        return Result
+
+    def _Normalize(self, Type: str) -> str | None:
+        if "<" in Type:
+            Type = Type.replace("<", "[").replace(">", "]").replace(" ", "")
+            Type = Type.replace("FBArrayTemplate", "list")
+
+            # Get content between brackets
+            ListTypesStr = Type[Type.find("[") + 1:Type.find("]")]
+            if ListTypesStr:
+                ValidatedTypes = []
+                ListTypes = ListTypesStr.split(",")
+                for ListType in ListTypes:
+                    ListType = self.Normalize(ListType)
+                    if ListType:
+                        ValidatedTypes.append(ListType)
+
+                if len(ListTypes) != len(ValidatedTypes):
+                    return None
+
+                Type = Type.replace(ListTypesStr, ",".join(ValidatedTypes))
+                if Type.endswith("[]"):
+                    Type = Type[:-2]
+
+        if " " in Type and Type.startswith(self.IgnorePrefixes):
+            Type = Type.rpartition(" ")[2]
+
+        Type = self.TranslationTypes.get(Type, Type)
+
+        # Replace namespace C++ syntax with Python
+        if "::" in Type:
+            Type = Type.replace("::", ".")
+
+        if Type.startswith("FB"):
+            ClassName = Type
+            if "." in Type:
+                ClassName = Type.partition(".")[0]
+            if ClassName not in self.ClassNames:
+                return None
+
+        return Type
+
+    def GetStatistics(self) -> dict:
+        with self._Lock:
+            Total = self.Hits + self.Misses
+            return {
+                "Hits": self.Hits,
+                "Misses": self.Misses,
+                "HitRate": self.Hits / Total if Total else 0.0,
+                "CachedTypes": len(self._Cache)
+            }
@@ -2,20 +2,62 @@ from __future__ import annotations
 
 import threading
 import logging
+import time
 import os
 
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from types import ModuleType, FunctionType
 
 from ..module_types import StubClass, StubFunction, StubParameter, StubProperty
+from ..native_generator import ModuleInventory, GetModuleInventory
+from ..timing import PluginTiming, GetStubName
+
+
+SHARED_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+_SharedExecutor: ThreadPoolExecutor | None = None
+_SharedExecutorLock = threading.Lock()
+
+
+def GetSharedExecutor() -> ThreadPoolExecutor:
+    """ Get the thread pool shared by all plugins that have `Threading` enabled """
+    global _SharedExecutor  # pylint: disable=global-statement
+    if _SharedExecutor is None:
+        with _SharedExecutorLock:
+            if _SharedExecutor is None:
+                _SharedExecutor = ThreadPoolExecutor(max_workers = SHARED_EXECUTOR_MAX_WORKERS, thread_name_prefix = "StubPatcher")
+    return _SharedExecutor
+
+
+class EStubKind:
+    Enums = "enums"
+    Classes = "classes"
+    Functions = "functions"
+
+    # The order the different kinds are patched in by a plugin
+    PatchOrder = (Enums, Classes, Functions)
+    All = frozenset(PatchOrder)
 
 
 class PluginBaseClass():
     Threading = True
+    MaxWorkers = 8  # Max number of stubs patched at the same time when `Threading` is enabled
+    bStopOnFirstError = True  # Stop patching new stubs as soon as one of them raises an exception
     Priority = 100
 
+    # Used to figure out which plugins can run at the same time, see `plugin_scheduler`.
+    # Reads: Kinds of stubs (EStubKind) the plugin reads from, apart from the ones it's currently patching.
+    #        Only names are never modified, so reading e.g. `ClassMap` keys doesn't count.
+    # Writes: Kinds of stubs the plugin modifies
+    # Dependencies: Plugins that must be completely done before this plugin can start
+    Reads: frozenset[str] = EStubKind.All
+    Writes: frozenset[str] = EStubKind.All
+    Dependencies: tuple[type[PluginBaseClass], ...] = ()
+
     def __init__(self, Version: int, Module: ModuleType, EnumList: list[StubClass], ClassList: list[StubClass], FunctionGroupList: list[list[StubFunction]]) -> None:
         self.Version = Version
         self.ModuleName = Module.__name__
+        self.Inventory: ModuleInventory = GetModuleInventory(Module)  # Shared with the generator, don't modify it
 
         self.EnumList = EnumList
         self.ClassList = ClassList
@@ -28,9 +70,19 @@ class PluginBaseClass():
         self.bDevMode = os.environ.get("PYFBSDK_DEVMODE") == "True"
         self.Exceptions = []
 
+        self.Timing: PluginTiming | None = None  # Set by the generator if the plugin should be timed
+
     def ShouldPatch(self) -> bool:
         return True
 
+    def Finish(self):
+        """ Called once all of the plugin's phases are done, e.g. to save caches """
+        ...
+
+    def GetStatistics(self) -> dict:
+        """ Get JSON compatible statistics about the run, e.g. cache hits. Included in the timing report. """
+        return {}
+
     def PatchClass(self, Class: StubClass):
         ...
 
@@ -41,11 +93,32 @@ class PluginBaseClass():
         ...
 
     def Run(self):
+        for Kind in EStubKind.PatchOrder:
+            self.RunPhase(Kind)
+
+    def RunPhase(self, Kind: str):
+        """ 
+        Patch all stubs of a single kind
+
+        ### Parameters:
+            - Kind: The EStubKind to patch
+        """
         if not self.ShouldPatch():
             return
-        self._PatchEnums(self.EnumList)
-        self._PatchClasses(self.ClassList)
-        self._PatchFunctions(self.FunctionGroupList)
+
+        StartTime = time.perf_counter()
+
+        if Kind == EStubKind.Enums:
+            self._PatchEnums(self.EnumList)
+        elif Kind == EStubKind.Classes:
+            self._PatchClasses(self.ClassList)
+        elif Kind == EStubKind.Functions:
+            self._PatchFunctions(self.FunctionGroupList)
+        else:
+            raise ValueError(f"Unknown stub kind: {Kind}")
+
+        if self.Timing:
+            self.Timing.AddPhaseTime(Kind, time.perf_counter() - StartTime)
 
     def _PatchEnums(self, ClassList: list[StubClass]):
         self._RunPatcher(self.PatchEnum, ClassList)
@@ -57,30 +130,52 @@ class PluginBaseClass():
         self._RunPatcher(self.PatchFunctionGroup, FunctionGroupList)
 
     def _RunPatcher(self, PatchFunction: FunctionType, StubList: list):
+        """
+        Run the patch function on all items in the list.
+        If the plugin has `Threading` enabled, the items are patched in the shared thread pool, with at most `MaxWorkers` items at the same time.
+
+        Exceptions are raised once all running patches are done, if multiple items failed the exception from the first item in the list is raised.
+        """
         StopEvent = threading.Event()
+        Errors: list[tuple[int, Exception]] = []
+        ErrorsLock = threading.Lock()
 
-        def _ThreadedPatcher(self, StubItem):
+        def _PatchStub(Index: int, StubItem):
+            if StopEvent.is_set():
+                return
+            StartTime = time.perf_counter()
             try:
                 PatchFunction(StubItem)
             except Exception as e:
-                self.Exceptions.append(e)
-                StopEvent.set()
+                with ErrorsLock:
+                    Errors.append((Index, e))
+                if self.bStopOnFirstError:
+                    StopEvent.set()
+            finally:
+                if self.Timing:
+                    self.Timing.AddStubTime(GetStubName(StubItem), time.perf_counter() - StartTime)
 
         if self.Threading:
-            Threads = []
-            for x in StubList:
-                Thread = threading.Thread(target=_ThreadedPatcher, args=(x,))
-                Threads.append(Thread)
-                Thread.start()
-            for Thread in Threads:
-                Thread.join()
+            Executor = GetSharedExecutor()
+            Pending = set()
+            for Index, StubItem in enumerate(StubList):
+                if StopEvent.is_set():
+                    break
 
-            if self.Exceptions:
-                raise self.Exceptions[0]
+                # Wait for a running patch to finish before starting a new one
+                if len(Pending) >= max(1, self.MaxWorkers):
+                    _, Pending = wait(Pending, return_when = FIRST_COMPLETED)
 
-            if StopEvent.is_set():
-                for Thread in Threads:
-                    Thread.join()
+                Pending.add(Executor.submit(_PatchStub, Index, StubItem))
+
+            wait(Pending)
         else:
-            for x in StubList:
-                PatchFunction(x)
+            for Index, StubItem in enumerate(StubList):
+                if StopEvent.is_set():
+                    break
+                _PatchStub(Index, StubItem)
+
+        if Errors:
+            Errors.sort(key = lambda x: x[0])
+            self.Exceptions.extend(Error for _, Error in Errors)
+            raise Errors[0][1]
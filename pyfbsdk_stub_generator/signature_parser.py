@@ -0,0 +1,105 @@
+"""
+Parser for the function signatures that Boost.Python writes into the docstrings, e.g:
+```
+ShowToolByName( (str)arg1 [, (object)arg2]) -> object
+SetVector( (FBModel)arg1, (FBVector3d)arg2 [, (FBModelTransformationType)arg3 [, (bool)arg4]]) -> None :
+```
+Functions with overloads have one signature per line.
+
+Parsed signatures are immutable and cached by docstring, since the same docstrings are repeated for a lot of
+functions (e.g. inherited or overridden methods).
+"""
+from __future__ import annotations
+
+import functools
+import re
+
+from dataclasses import dataclass
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<Skip>\s+)
+    |(?P<Type>\([^)]*\))
+    |(?P<Symbol>[\[\],])
+    |(?P<Name>[^\s\[\],()]+)
+""", re.VERBOSE)
+
+
+@dataclass(frozen = True)
+class ParameterSignature:
+    Name: str
+    Type: str
+    bIsOptional: bool
+
+
+@dataclass(frozen = True)
+class FunctionSignature:
+    Parameters: tuple[ParameterSignature, ...]
+    ReturnType: str
+
+
+def Tokenize(ParametersString: str) -> list[tuple[str, str]]:
+    """
+    Split a parameters string, e.g. `(str)arg1 [, (object)arg2]` into tokens
+
+    ### Returns:
+    A list of tuple(TokenType, Text)
+    """
+    Tokens = []
+    for Match in TOKEN_PATTERN.finditer(ParametersString):
+        if Match.lastgroup != "Skip":
+            Tokens.append((Match.lastgroup, Match.group()))
+    return Tokens
+
+
+def ParseParameters(ParametersString: str) -> tuple[ParameterSignature, ...]:
+    """
+    Parse the parameters of a signature, e.g. `(str)arg1 [, (object)arg2 [, (int)arg3]]`.
+    All parameters inside of optional brackets (no matter how deep) are optional.
+    """
+    Parameters = []
+    OptionalDepth = 0
+    Type = None
+    for TokenType, Text in Tokenize(ParametersString):
+        if TokenType == "Type":
+            Type = Text[1:-1]
+        elif TokenType == "Name":
+            Parameters.append(ParameterSignature(Text, Type or "", OptionalDepth > 0))
+            Type = None
+        elif Text == "[":
+            OptionalDepth += 1
+        elif Text == "]":
+            OptionalDepth = max(0, OptionalDepth - 1)
+
+    return tuple(Parameters)
+
+
+def ParseSignature(Signature: str) -> FunctionSignature:
+    """
+    Parse a single signature line, e.g. `ShowToolByName( (str)arg1 [, (object)arg2]) -> object`
+    """
+    Signature = Signature.partition("(")[2]  # Remove function name
+    ParametersString, _, ReturnType = Signature.rpartition("->")
+    ParametersString = ParametersString.rpartition(")")[0]
+
+    return FunctionSignature(ParseParameters(ParametersString), ReturnType.strip(" :").strip())
+
+
+@functools.lru_cache(maxsize = None)
+def ParseDocString(FunctionName: str, DocString: str) -> tuple[FunctionSignature, ...]:
+    """
+    Parse all signatures in a Boost.Python docstring, lines that isn't a signature for the function are ignored.
+
+    ### Parameters:
+        - FunctionName: Name of the function, signature lines must start with it
+        - DocString: The function's docstring
+
+    ### Returns:
+    A tuple with one FunctionSignature per overload
+    """
+    Signatures = []
+    for Line in DocString.split("\n"):
+        if not Line.strip().startswith(FunctionName) or not all(x in Line for x in ("->", "(", ")")):
+            continue
+        Signatures.append(ParseSignature(Line))
+
+    return tuple(Signatures)
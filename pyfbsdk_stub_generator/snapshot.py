@@ -0,0 +1,252 @@
+"""
+Introspection snapshots, used to generate stub files outside of MotionBuilder.
+
+A snapshot contains everything the native generator reads from a module (names, base classes, member types,
+static methods, docstrings & enum values). Loading a snapshot rebuilds a module with the same structure,
+using plain Python classes & functions, that can be passed to the `StubGenerator` instead of the real module.
+
+Usage:
+```
+# Inside of MotionBuilder
+snapshot.ExportSnapshot(pyfbsdk, "C:/pyfbsdk_2025.json.gz", 2025)
+
+# Any Python interpreter
+Module, Version = snapshot.LoadSnapshot("C:/pyfbsdk_2025.json.gz")
+```
+"""
+from __future__ import annotations
+
+import builtins
+import types
+import gzip
+import json
+import sys
+
+from types import ModuleType
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Members that Python creates by itself when a class is created, or that would break the rebuilt classes
+SKIPPED_CLASS_MEMBERS = {"__dict__", "__weakref__", "__init_subclass__", "__class__"}
+
+JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class EMemberKind:
+    Function = "function"
+    Class = "class"
+    Value = "value"
+    EnumValue = "enumvalue"
+    Object = "object"
+
+
+# -------------------------------------------------------------
+#                           Export
+# -------------------------------------------------------------
+
+class _SnapshotWriter():
+    def __init__(self):
+        self.Classes: list[dict] = []
+        self.ClassIndices: dict[int, int] = {}  # id(Class) -> Index in self.Classes
+
+    def GetClassReference(self, Class: type) -> int | str:
+        """ Get a reference to the class, builtin classes are referenced by name, other classes are added to the snapshot """
+        if Class.__module__ == "builtins" and getattr(builtins, Class.__name__, None) is Class:
+            return f"builtins.{Class.__name__}"
+
+        if id(Class) not in self.ClassIndices:
+            self.ClassIndices[id(Class)] = len(self.Classes)
+            ClassData = {"Name": Class.__name__, "Meta": type(Class).__name__}
+            self.Classes.append(ClassData)
+
+            ClassData["Bases"] = [self.GetClassReference(Base) for Base in Class.__bases__]
+            ClassData["Members"] = self.GetMembers(Class, vars(Class), bIsClass = True)
+
+        return self.ClassIndices[id(Class)]
+
+    def GetMembers(self, Owner, OwnMembers, bIsClass: bool) -> dict[str, list]:
+        Members = {}
+        for Name, RawValue in OwnMembers.items():
+            if bIsClass and Name in SKIPPED_CLASS_MEMBERS:
+                continue
+
+            try:
+                Value = getattr(Owner, Name)
+            except AttributeError:
+                continue
+
+            bIsStatic = isinstance(RawValue, staticmethod)
+            Members[Name] = self.GetMember(Value, bIsStatic)
+
+        return Members
+
+    def GetMember(self, Value, bIsStatic = False) -> list:
+        if type(Value).__name__ == "function":
+            return [EMemberKind.Function, Value.__name__, Value.__doc__, bIsStatic]
+
+        if isinstance(Value, type):
+            return [EMemberKind.Class, self.GetClassReference(Value)]
+
+        if type(Value) in JSON_SCALAR_TYPES:
+            return [EMemberKind.Value, Value]
+
+        if isinstance(Value, (list, tuple)) and all(type(x) in JSON_SCALAR_TYPES for x in Value):
+            return [EMemberKind.Value, list(Value), type(Value).__name__]
+
+        # Enum values
+        if isinstance(Value, int):
+            return [EMemberKind.EnumValue, self.GetClassReference(type(Value)), int(Value)]
+
+        bIsBuiltinFunction = isinstance(Value, (types.BuiltinFunctionType, types.BuiltinMethodType))
+        return [EMemberKind.Object, type(Value).__name__, bIsBuiltinFunction]
+
+
+def CreateSnapshot(Module: ModuleType, Version: int) -> dict:
+    """
+    Create a JSON compatible snapshot of the module
+
+    ### Parameters:
+        - Module: The module to create a snapshot of, e.g. pyfbsdk
+        - Version: The MotionBuilder version
+    """
+    Writer = _SnapshotWriter()
+    ModuleMembers = Writer.GetMembers(Module, vars(Module), bIsClass = False)
+
+    return {
+        "FormatVersion": SNAPSHOT_FORMAT_VERSION,
+        "Module": Module.__name__,
+        "Version": Version,
+        "Members": ModuleMembers,
+        "Classes": Writer.Classes
+    }
+
+
+def ExportSnapshot(Module: ModuleType, Filepath: str, Version: int) -> str:
+    """
+    Write a gzip compressed snapshot of the module to disk
+
+    ### Returns:
+    The filepath
+    """
+    Snapshot = CreateSnapshot(Module, Version)
+    with gzip.open(Filepath, "wt", encoding="utf-8") as File:
+        json.dump(Snapshot, File, separators=(",", ":"))
+    return Filepath
+
+
+# -------------------------------------------------------------
+#                           Import
+# -------------------------------------------------------------
+
+def _CreateFunction(Name: str, DocString: str | None):
+    def _SnapshotFunction(*args, **kwargs):
+        raise NotImplementedError(f"'{Name}' is loaded from a snapshot and can't be called")
+
+    _SnapshotFunction.__name__ = Name
+    _SnapshotFunction.__qualname__ = Name
+    _SnapshotFunction.__doc__ = DocString
+    return _SnapshotFunction
+
+
+class _SnapshotReader():
+    def __init__(self, Snapshot: dict):
+        self.Snapshot = Snapshot
+        self.Classes: dict[int, type] = {}
+        self.Metaclasses: dict[str, type] = {"type": type}
+        self.PlaceholderTypes: dict[str, type] = {}
+
+    def GetMetaclass(self, Name: str) -> type:
+        """ Get a metaclass with the same name as the original one, e.g. 'class' for Boost.Python classes """
+        if Name not in self.Metaclasses:
+            self.Metaclasses[Name] = type(Name, (type,), {})
+        return self.Metaclasses[Name]
+
+    def GetPlaceholder(self, TypeName: str, bIsBuiltinFunction: bool):
+        """ Get an object that has a type with the given name """
+        if bIsBuiltinFunction:
+            return len  # Any builtin function will do, only the type is checked
+
+        if TypeName not in self.PlaceholderTypes:
+            def _Call(self, *args, **kwargs):
+                raise NotImplementedError(f"'{TypeName}' is loaded from a snapshot and can't be called")
+            self.PlaceholderTypes[TypeName] = type(TypeName, (), {"__call__": _Call})
+        return self.PlaceholderTypes[TypeName]()
+
+    def ResolveClass(self, Reference: int | str) -> type:
+        if isinstance(Reference, str):
+            return getattr(builtins, Reference.partition(".")[2])
+
+        if Reference not in self.Classes:
+            ClassData = self.Snapshot["Classes"][Reference]
+            Bases = tuple(self.ResolveClass(x) for x in ClassData["Bases"])
+
+            # Classes & enum values can reference the class itself, so they are set after the class has been created
+            Namespace = {}
+            for Name, Member in ClassData["Members"].items():
+                if Member[0] not in (EMemberKind.Class, EMemberKind.EnumValue):
+                    Namespace[Name] = self.CreateMember(Member)
+
+            Metaclass = self.GetMetaclass(ClassData["Meta"])
+            self.Classes[Reference] = Metaclass(ClassData["Name"], Bases, Namespace)
+
+            for Name, Member in ClassData["Members"].items():
+                if Member[0] in (EMemberKind.Class, EMemberKind.EnumValue):
+                    setattr(self.Classes[Reference], Name, self.CreateMember(Member))
+
+        return self.Classes[Reference]
+
+    def CreateMember(self, Member: list):
+        Kind = Member[0]
+        if Kind == EMemberKind.Function:
+            _, Name, DocString, bIsStatic = Member
+            Function = _CreateFunction(Name, DocString)
+            return staticmethod(Function) if bIsStatic else Function
+
+        if Kind == EMemberKind.Class:
+            return self.ResolveClass(Member[1])
+
+        if Kind == EMemberKind.Value:
+            if len(Member) > 2 and Member[2] == "tuple":
+                return tuple(Member[1])
+            return Member[1]
+
+        if Kind == EMemberKind.EnumValue:
+            EnumClass = self.ResolveClass(Member[1])
+            return int.__new__(EnumClass, Member[2])
+
+        if Kind == EMemberKind.Object:
+            return self.GetPlaceholder(Member[1], Member[2])
+
+        raise ValueError(f"Unknown snapshot member kind: {Kind}")
+
+    def CreateModule(self) -> ModuleType:
+        Module = ModuleType(self.Snapshot["Module"])
+        for Name, Member in self.Snapshot["Members"].items():
+            setattr(Module, Name, self.CreateMember(Member))
+        return Module
+
+
+def LoadSnapshot(Filepath: str, bRegisterModule = True) -> tuple[ModuleType, int]:
+    """
+    Load a snapshot created with `ExportSnapshot`
+
+    ### Parameters:
+        - Filepath: The snapshot filepath
+        - bRegisterModule: Add the rebuilt module to `sys.modules` (if the real module isn't already imported),
+                           so plugins that import the module by name can be used.
+
+    ### Returns:
+    tuple(Module, MotionBuilderVersion)
+    """
+    with gzip.open(Filepath, "rt", encoding="utf-8") as File:
+        Snapshot = json.load(File)
+
+    if Snapshot.get("FormatVersion") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {Snapshot.get('FormatVersion')} in '{Filepath}', expected {SNAPSHOT_FORMAT_VERSION}")
+
+    Module = _SnapshotReader(Snapshot).CreateModule()
+
+    if bRegisterModule and Module.__name__ not in sys.modules:
+        sys.modules[Module.__name__] = Module
+
+    return Module, Snapshot["Version"]
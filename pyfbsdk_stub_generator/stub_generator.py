@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing
+import io
 import time
 import sys
 import os
@@ -8,8 +9,6 @@ import os
 from importlib import reload
 from types import FunctionType, ModuleType
 
-import pyfbsdk
-
 bTest = "builtin" in __name__
 if bTest:
     # Reload all stub generator modules
@@ -30,13 +29,19 @@ if bTest:
 from . import plugins
 from .module_types import StubClass, StubFunction, StubParameter, StubProperty
 from . import native_generator
+from . import plugin_scheduler
+from . import timing
 
 reload(plugins)
 reload(native_generator)
+reload(plugin_scheduler)
+reload(timing)
 
 DEFAULT_PLUGINS = plugins.GetDefaultPlugins()
 
 
+FILE_BUFFER_SIZE = 1024 * 1024
+
 TranslationDefaultValues = {
     "FRAMES_30": "FBTimeCode.FRAMES_30"
 }
@@ -60,6 +65,7 @@ class FObjectType:
 
 def GetMotionBuilderVersion():
     """ Get the current version of MotionBuilder """
+    import pyfbsdk  # pylint: disable=import-outside-toplevel
     return int(2000 + pyfbsdk.FBSystem().Version / 1000)
 
 
@@ -67,7 +73,7 @@ def GetMotionBuilderVersion():
 #                       Functions
 # -------------------------------------------------------------
 
-def GetBaseContent(Module: ModuleType):
+def GetBaseContent(Module: ModuleType, Version: int | None = None):
     ModuleName = Module.__name__
     Filepath = os.path.join(os.path.dirname(__file__), "base_content", f"{ModuleName}.pyi")
 
@@ -76,7 +82,7 @@ def GetBaseContent(Module: ModuleType):
         with open(Filepath, 'r', encoding="utf-8") as File:
             Content = File.read().strip() + "\n"
 
-    Content = Content.replace("{MOTIONBUILDER_VERSION}", str(GetMotionBuilderVersion()))
+    Content = Content.replace("{MOTIONBUILDER_VERSION}", str(Version or GetMotionBuilderVersion()))
 
     return Content
 
@@ -84,28 +90,103 @@ def GetBaseContent(Module: ModuleType):
 def SortClasses(Classes: list[StubClass]):
     """ 
     Sort classes based on their parent class
-    If a class has another class as their parent class, it'll be placed later in the list
+    If a class has another class as their parent class, it'll be placed later in the list, after the last of its requirements.
+    The result is the same as moving the classes around in the list one at a time, without the cost of re-indexing the list for each move.
     """
-    ClassNames = [x.Name for x in Classes]
+    ClassIndices = {}
+    for Index, Class in enumerate(Classes):
+        ClassIndices.setdefault(Class.Name, Index)
+
+    # Requirements[i] are the indices of the classes that needs to be defined before class i
+    Requirements: list[list[int]] = []
+    for Index, Class in enumerate(Classes):
+        Requirements.append([x for x in {ClassIndices[Name] for Name in Class.GetRequirements() if Name in ClassIndices} if x != Index])
+
+    bSortable = GetSortableClasses(Classes, Requirements)
+
+    # The classes that are not yet placed, as a linked list. Each class has a label that increases along the list,
+    # so the last requirement of a class can be found without searching through the list.
+    LABEL_GAP = 1 << 32
+    Next = [-1] * len(Classes)
+    Labels = [0] * len(Classes)
+    Head = -1
+    for Index in reversed(range(len(Classes))):
+        if bSortable[Index]:
+            Next[Index] = Head
+            Labels[Index] = Index * LABEL_GAP
+            Head = Index
+
+    bPlaced = [False] * len(Classes)
+    SortedIndices = []
+    while Head != -1:
+        Index = Head
+        Head = Next[Index]
+
+        PendingRequirements = [x for x in Requirements[Index] if not bPlaced[x]]
+        if not PendingRequirements:
+            bPlaced[Index] = True
+            SortedIndices.append(Index)
+            continue
+
+        # Move the class to be after the last of its requirements.
+        # Like the original list based sort, it's placed one step further if possible, after the class that follows the requirement.
+        LastRequirement = max(PendingRequirements, key = Labels.__getitem__)
+        Before = Next[LastRequirement] if Next[LastRequirement] != -1 else LastRequirement
+        After = Next[Before]
+        Next[Before] = Index
+        Next[Index] = After
+
+        if After == -1:
+            Labels[Index] = Labels[Before] + LABEL_GAP
+        elif Labels[After] - Labels[Before] > 1:
+            Labels[Index] = (Labels[Before] + Labels[After]) // 2
+        else:
+            # No room for a label between the two classes, spread out the labels of all classes that are left
+            Label = 0
+            Node = Head
+            while Node != -1:
+                Labels[Node] = Label
+                Label += LABEL_GAP
+                Node = Next[Node]
+
+    Remaining = [Index for Index, bIsSortable in enumerate(bSortable) if not bIsSortable]
+    if Remaining:
+        print(f"Warning: Classes have circular requirements and can't be sorted: {', '.join(Classes[x].Name for x in Remaining)}")
+        SortedIndices += Remaining
+
+    Classes[:] = [Classes[Index] for Index in SortedIndices]
+    return Classes
 
-    i = 0
-    while i < len(Classes):
-        # Check if class has any required classes that needs to be defined before it (aka. parent classes)
-        Requirements = Classes[i].GetRequirements()
-        if Requirements:
-            # Get the required class that has the highest index in the list
-            RequiredIndices = [ClassNames.index(x) for x in Requirements if x in ClassNames]
-            RequiredMaxIndex = max(RequiredIndices) if RequiredIndices else -1
 
-            # If current index is lower than the highest required index, move current index to be just below the required one.
-            if RequiredMaxIndex > i:
-                Classes.insert(RequiredMaxIndex + 1, Classes.pop(i))
-                ClassNames.insert(RequiredMaxIndex + 1, ClassNames.pop(i))
-                i -= 1  # Because we moved current index away, re-itterate over the same index once more.
+def GetSortableClasses(Classes: list[StubClass], Requirements: list[list[int]]) -> list[bool]:
+    """
+    Find the classes that can be sorted, i.e. classes that are not part of (or requires a class in) a circular requirement
 
-        i += 1
+    ### Parameters:
+        - Classes: The classes
+        - Requirements: The indices of the classes that each class requires
 
-    return Classes
+    ### Returns:
+    A list with True for each class that can be sorted
+    """
+    Dependents: list[list[int]] = [[] for _ in Classes]
+    RequirementCount = [len(x) for x in Requirements]
+    for Index, ClassRequirements in enumerate(Requirements):
+        for RequiredIndex in ClassRequirements:
+            Dependents[RequiredIndex].append(Index)
+
+    # Kahn's algorithm, whatever is left once no more classes are ready can't be sorted
+    bSortable = [False] * len(Classes)
+    Ready = [Index for Index, Count in enumerate(RequirementCount) if Count == 0]
+    while Ready:
+        Index = Ready.pop()
+        bSortable[Index] = True
+        for DependentIndex in Dependents[Index]:
+            RequirementCount[DependentIndex] -= 1
+            if RequirementCount[DependentIndex] == 0:
+                Ready.append(DependentIndex)
+
+    return bSortable
 
 
 # ---------------------------------------------------------------------------------
@@ -114,11 +195,19 @@ def SortClasses(Classes: list[StubClass]):
 
 
 class StubGenerator():
-    def __init__(self, Module: ModuleType, Plugins: typing.Iterable[type[plugins.PluginBaseClass]] | None = DEFAULT_PLUGINS):
+    def __init__(self, Module: ModuleType, Plugins: typing.Iterable[type[plugins.PluginBaseClass]] | None = DEFAULT_PLUGINS, MaxPluginWorkers: int = 1, Version: int | None = None):
+        """
+        ### Parameters:
+            - Module: The module to generate the stub for, either the real module or one loaded from a snapshot
+            - Plugins: Plugins used to patch the generated stubs
+            - MaxPluginWorkers: Max number of plugin phases that may run at the same time, 1 (default) runs all plugins one after another
+            - Version: The MotionBuilder version, required when not running inside of MotionBuilder (e.g. when using a snapshot)
+        """
         self.Module = Module
-        self.Version = GetMotionBuilderVersion()
+        self.Version = Version or GetMotionBuilderVersion()
+        self.MaxPluginWorkers = MaxPluginWorkers
 
-        self._AllClassNames = []
+        self.TimingReport = timing.TimingReport()
 
         self.Plugins: list[type[plugins.PluginBaseClass]] = list(Plugins) if Plugins else []
         self.Plugins.sort(key=lambda x: x.Priority)
@@ -129,65 +218,114 @@ class StubGenerator():
 
     def GetAllClassNames(self):
         """ Get the names of all classes avaliable in the pyfbsdk module """
-        if not self._AllClassNames:
-            Functions, Classes, Enums = native_generator.GetModuleContent(self.Module)
-            self._AllClassNames = [x.__name__ for x in Classes + Enums]
-        return self._AllClassNames
+        return native_generator.GetModuleInventory(self.Module).ClassNames
 
-    def GenerateString(self) -> str:
+    def GenerateStubs(self) -> tuple[list[StubClass], list[StubClass], list[list[StubFunction]]]:
         """
-        Returns: The stub file as a string
+        Generate & patch all stubs, the time spent in each step is recorded in `self.TimingReport`
+
+        Returns: tuple(Enums, Classes, FunctionGroups)
         """
+        Report = self.TimingReport
+
         # Get the content
-        Enums, Classes, FunctionGroupList = native_generator.GenerateModuleSubs(self.Module)
+        with Report.Measure("Introspection"):
+            Enums, Classes, FunctionGroupList = native_generator.GenerateModuleSubs(self.Module)
 
         # Run all of the plugins
-        for PluginType in self.Plugins:
-            Plugin = PluginType(self.Version, self.Module, Enums, Classes, FunctionGroupList)
-            Plugin.Run()
+        with Report.Measure("Plugins"):
+            plugin_scheduler.RunPlugins(self.Plugins, (self.Version, self.Module, Enums, Classes, FunctionGroupList), self.MaxPluginWorkers, Report)
 
         # Sort classes after all patches are done and we know their requirements
-        Classes = SortClasses(Classes)
+        with Report.Measure("SortClasses"):
+            Classes = SortClasses(Classes)
 
-        # Flatten the functions list
-        FlatFunctionList = [x for y in FunctionGroupList for x in y]
+        return Enums, Classes, FunctionGroupList
 
-        # Generate a string
-        StubString = GetBaseContent(self.Module)  # Read the custom additions file first
-        StubString += "\n".join([x.GetAsString() for x in Enums])
-        StubString += "\n"
-        StubString += "\n".join([x.GetAsString() for x in Classes])
-        StubString += "\n"
-        StubString += "\n".join([x.GetAsString() for x in FlatFunctionList])
-        StubString += "\n"
+    def Render(self, Writer: typing.TextIO):
+        """
+        Generate the stub file and write it to `Writer` (e.g. an open file) one stub at a time
+        """
+        Enums, Classes, FunctionGroupList = self.GenerateStubs()
 
-        return StubString
+        with self.TimingReport.Measure("Rendering"):
+            # Flatten the functions list
+            FlatFunctionList = [x for y in FunctionGroupList for x in y]
 
+            Writer.write(GetBaseContent(self.Module, self.Version))  # Write the custom additions file first
+            for Stubs in (Enums, Classes, FlatFunctionList):
+                for Index, Stub in enumerate(Stubs):
+                    if Index:
+                        Writer.write("\n")
+                    Stub.Render(Writer)
+                Writer.write("\n")
+
+    def GenerateString(self) -> str:
+        """
+        Returns: The stub file as a string
+
+        The time spent in each step is recorded in `self.TimingReport`
+        """
+        Writer = io.StringIO()
+        self.Render(Writer)
+        return Writer.getvalue()
+
+
+def GetTimingReportFilepath(Filepath: str) -> str:
+    """ Get the filepath of the timing report written next to the stub file """
+    return f"{os.path.splitext(Filepath)[0]}.timings.json"
 
-def GenerateModuleStub(Module: ModuleType, Filepath: str) -> str:
-    StartTime = time.time()
 
-    Generator = StubGenerator(Module)
-    FileContent = Generator.GenerateString()
+def GenerateModuleStubWithTimings(Module: ModuleType, Filepath: str, bWriteTimingReport = False, Version: int | None = None) -> tuple[str, timing.TimingReport]:
+    """
+    Generate a stub file for the module.
+
+    ### Parameters:
+        - Module: The module to generate the stub for
+        - Filepath: The filepath of the stub file
+        - bWriteTimingReport: Print a summary of the timing report, and write it as JSON next to the stub file (see `GetTimingReportFilepath`)
+        - Version: The MotionBuilder version, defaults to the running MotionBuilder's version
+
+    ### Returns:
+    tuple(Filepath, TimingReport)
+    """
+    Generator = StubGenerator(Module, Version = Version)
+    Report = Generator.TimingReport
 
     # Make sure directory exists
     if not os.path.isdir(os.path.dirname(Filepath)):
         os.makedirs(os.path.dirname(Filepath))
 
-    with open(Filepath, "w+", encoding="utf-8") as File:
-        File.write(FileContent)
+    # Stream the stubs into a temporary file, so a failed generation doesn't leave a half written stub file behind
+    TempFilepath = f"{Filepath}.tmp"
+    try:
+        with open(TempFilepath, "w", encoding="utf-8", buffering = FILE_BUFFER_SIZE) as File:
+            Generator.Render(File)
+        os.replace(TempFilepath, Filepath)
+    finally:
+        if os.path.isfile(TempFilepath):
+            os.remove(TempFilepath)
+
+    print(f"Generating {Module.__name__} stub file took: {round(Report.Total, 2)}s.")
+
+    if bWriteTimingReport:
+        print(Report.GetSummary())
+        Report.WriteJson(GetTimingReportFilepath(Filepath))
+
+    return Filepath, Report
 
-    GenerationTime = time.time() - StartTime
-    print(f"Generating pyfbsdk stub file took: {round(GenerationTime, 2)}s.")
 
-    return Filepath
+def GenerateModuleStub(Module: ModuleType, Filepath: str, bWriteTimingReport = False, Version: int | None = None) -> str:
+    return GenerateModuleStubWithTimings(Module, Filepath, bWriteTimingReport, Version)[0]
 
 
-def GeneratePyfbsdkStubFile(Filepath: str):
-    return GenerateModuleStub(pyfbsdk, Filepath)
+def GeneratePyfbsdkStubFile(Filepath: str, bWriteTimingReport = False):
+    import pyfbsdk  # pylint: disable=import-outside-toplevel
+    return GenerateModuleStub(pyfbsdk, Filepath, bWriteTimingReport)
 
 
 if bTest:
+    import pyfbsdk
     ModuleToGenerate = pyfbsdk
     DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "generated-stub-files")
     OutFilepath = os.path.join(DEFAULT_OUTPUT_DIR, f"motionbuilder-{GetMotionBuilderVersion()}", f"{ModuleToGenerate.__name__}.pyi")
@@ -0,0 +1,127 @@
+"""
+Timing instrumentation for the stub generation, used to track down what makes a generation slow.
+"""
+from __future__ import annotations
+
+import threading
+import contextlib
+import heapq
+import json
+import time
+
+DEFAULT_SLOWEST_STUB_COUNT = 10
+
+
+def GetStubName(StubItem) -> str:
+    """ Get a display name for a stub, or a group of function stubs """
+    if isinstance(StubItem, list):
+        return StubItem[0].Name if StubItem else ""
+    return getattr(StubItem, "Name", str(StubItem))
+
+
+class PluginTiming():
+    def __init__(self, Name: str, SlowestStubCount: int = DEFAULT_SLOWEST_STUB_COUNT):
+        self.Name = Name
+        self.SlowestStubCount = SlowestStubCount
+        self.Phases: dict[str, float] = {}
+        self.Statistics: dict = {}  # Set from `PluginBaseClass.GetStatistics()` once the plugin is done
+
+        self._SlowestStubs: list[tuple[float, int, str]] = []  # Min-heap of (Seconds, Index, StubName)
+        self._StubCount = 0
+        self._Lock = threading.Lock()
+
+    @property
+    def Total(self) -> float:
+        return sum(self.Phases.values())
+
+    def AddPhaseTime(self, PhaseName: str, Seconds: float):
+        with self._Lock:
+            self.Phases[PhaseName] = self.Phases.get(PhaseName, 0.0) + Seconds
+
+    def AddStubTime(self, StubName: str, Seconds: float):
+        """ Record how long it took to patch a stub, only the slowest ones are kept """
+        with self._Lock:
+            self._StubCount += 1
+            Item = (Seconds, self._StubCount, StubName)
+            if len(self._SlowestStubs) < self.SlowestStubCount:
+                heapq.heappush(self._SlowestStubs, Item)
+            elif self._SlowestStubs and Seconds > self._SlowestStubs[0][0]:
+                heapq.heapreplace(self._SlowestStubs, Item)
+
+    def GetSlowestStubs(self) -> list[tuple[str, float]]:
+        """ Returns: A list of tuple(StubName, Seconds), slowest first """
+        with self._Lock:
+            return [(Name, Seconds) for Seconds, _, Name in sorted(self._SlowestStubs, reverse = True)]
+
+    def ToDict(self) -> dict:
+        return {
+            "Total": self.Total,
+            "Phases": dict(self.Phases),
+            "PatchedStubs": self._StubCount,
+            "SlowestStubs": [{"Name": Name, "Seconds": Seconds} for Name, Seconds in self.GetSlowestStubs()],
+            "Statistics": self.Statistics
+        }
+
+
+class TimingReport():
+    def __init__(self, SlowestStubCount: int = DEFAULT_SLOWEST_STUB_COUNT):
+        self.SlowestStubCount = SlowestStubCount
+        self.Phases: dict[str, float] = {}
+        self.Plugins: dict[str, PluginTiming] = {}
+        self._Lock = threading.Lock()
+
+    @property
+    def Total(self) -> float:
+        return sum(self.Phases.values())
+
+    @contextlib.contextmanager
+    def Measure(self, PhaseName: str):
+        """ Measure the time it takes to run the code inside of the with statement """
+        StartTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.AddPhaseTime(PhaseName, time.perf_counter() - StartTime)
+
+    def AddPhaseTime(self, PhaseName: str, Seconds: float):
+        with self._Lock:
+            self.Phases[PhaseName] = self.Phases.get(PhaseName, 0.0) + Seconds
+
+    def GetPluginTiming(self, PluginName: str) -> PluginTiming:
+        with self._Lock:
+            if PluginName not in self.Plugins:
+                self.Plugins[PluginName] = PluginTiming(PluginName, self.SlowestStubCount)
+            return self.Plugins[PluginName]
+
+    def ToDict(self) -> dict:
+        return {
+            "Total": self.Total,
+            "Phases": dict(self.Phases),
+            "Plugins": {Name: Timing.ToDict() for Name, Timing in self.Plugins.items()}
+        }
+
+    def WriteJson(self, Filepath: str):
+        with open(Filepath, "w", encoding="utf-8") as File:
+            json.dump(self.ToDict(), File, indent = 4)
+
+    def GetSummary(self) -> str:
+        """ Get a human readable summary of the report """
+        Lines = [f"Total: {self.Total:.2f}s"]
+        for PhaseName, Seconds in self.Phases.items():
+            Lines.append(f"    {PhaseName}: {Seconds:.2f}s")
+        for Name, Timing in self.Plugins.items():
+            Lines.append(f"    {Name}: {Timing.Total:.2f}s")
+            for StubName, Seconds in Timing.GetSlowestStubs()[:3]:
+                Lines.append(f"        {StubName}: {Seconds:.3f}s")
+            for StatisticName, Value in Timing.Statistics.items():
+                Lines.append(f"        {StatisticName}: {FormatStatistic(Value)}")
+        return "\n".join(Lines)
+
+
+def FormatStatistic(Value) -> str:
+    """ Format a plugin statistic for the summary, e.g. {"Hits": 10, "HitRate": 0.5} -> 'Hits: 10, HitRate: 0.50' """
+    if isinstance(Value, dict):
+        return ", ".join(f"{Name}: {FormatStatistic(x)}" for Name, x in Value.items())
+    if isinstance(Value, float):
+        return f"{Value:.2f}"
+    return str(Value)
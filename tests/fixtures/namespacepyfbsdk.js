@@ -0,0 +1,22 @@
+var namespacepyfbsdk =
+[
+    [ "FBAccessMode", "namespacepyfbsdk.html#a4f3c6e0d2a7b1c9e8f5d3b2a1c0e9f8d", [
+      [ "kFBAccessModeNone", "namespacepyfbsdk.html#a4f3c6e0d2a7b1c9e8f5d3b2a1c0e9f8da0b1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e", null ],
+      [ "kFBAccessModeDisk", "namespacepyfbsdk.html#a4f3c6e0d2a7b1c9e8f5d3b2a1c0e9f8da1c2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f", null ],
+      [ "kFBAccessModeMemory", "namespacepyfbsdk.html#a4f3c6e0d2a7b1c9e8f5d3b2a1c0e9f8da2d3e4f5a6b7c8d9e0f1a2b3c4d5e6f7a", null ]
+    ] ],
+    [ "FBActionManager", "classpyfbsdk_1_1_f_b_action_manager.html", "classpyfbsdk_1_1_f_b_action_manager" ],
+    [ "FBAddRegionParam", "namespacepyfbsdk.html#a6dc4b2b0e8a1e7b9b1f0f0b6c1a9d2f1", null ],
+    [ "FBAnimationNode", "classpyfbsdk_1_1_f_b_animation_node.html", "classpyfbsdk_1_1_f_b_animation_node" ],
+    [ "FBApplication", "classpyfbsdk_1_1_f_b_application.html", "classpyfbsdk_1_1_f_b_application" ],
+    [ "FBMatrix", "classpyfbsdk_1_1_f_b_matrix.html", "classpyfbsdk_1_1_f_b_matrix" ],
+    [ "FBModel", "classpyfbsdk_1_1_f_b_model.html", "classpyfbsdk_1_1_f_b_model" ],
+    // Functions only link to an anchor in the namespace page
+    [ "FBGetSelectedModels", "namespacepyfbsdk.html#a0e2d4f6a8c1b3d5f7e9a2c4e6b8d0f1a", null ],
+    [ "FBMatrixInverse", "namespacepyfbsdk.html#a9b8c7d6e5f4a3b2c1d0e9f8a7b6c5d4e", null ],
+    /* Escaped characters */
+    [ "FBPropertyAnimatableVector3d", 'classpyfbsdk_1_1_f_b_property_animatable_vector3d.html', "Vector \"3d\" \x21" ],
+    [ "FBVector3d", "classpyfbsdk_1_1_f_b_vector3d.html", "classpyfbsdk_1_1_f_b_vector3d" ],
+    [ "FBVector4d", "classpyfbsdk_1_1_f_b_vector4d.html", "classpyfbsdk_1_1_f_b_vector4d" ],
+    [ "ShowToolByName", "namespacepyfbsdk.html#a1c3e5a7b9d0f2e4a6c8b0d2f4a6e8c0b", null ],
+];
@@ -0,0 +1,145 @@
+"""
+Tests for the documentation disk cache backends, see `cache_backends` & `documentation_cache`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import tempfile
+import unittest
+import shutil
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from importlib import reload
+from unittest import mock
+
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import cache_backends as backends
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import documentation_cache as cache
+
+
+class BackendTests():
+    """ Tests shared by all backends, `CreateBackend` must be implemented by the subclass """
+    def setUp(self):
+        self.CacheDir = tempfile.mkdtemp()
+        self.Backend: backends.CacheBackend = self.CreateBackend()
+
+    def tearDown(self):
+        self.Backend.Close()
+        shutil.rmtree(self.CacheDir, ignore_errors = True)
+
+    def CreateBackend(self) -> backends.CacheBackend:
+        raise NotImplementedError()
+
+    def test_GetSet(self):
+        Url = "https://help.autodesk.com/cloudhelp/2025/ENU/MOBU-PYTHON-API-REF/classpyfbsdk_1_1_f_b_model.html"
+        self.assertIsNone(self.Backend.Get(backends.ECacheCategory.Pages, Url))
+        self.assertFalse(self.Backend.Has(backends.ECacheCategory.Pages, Url))
+
+        self.Backend.Set(backends.ECacheCategory.Pages, Url, "<html>å</html>")
+        self.assertEqual(self.Backend.Get(backends.ECacheCategory.Pages, Url), "<html>å</html>")
+        self.assertTrue(self.Backend.Has(backends.ECacheCategory.Pages, Url))
+
+        # Categories are separate
+        self.assertIsNone(self.Backend.Get(backends.ECacheCategory.ParsedPages, Url))
+
+        self.Backend.Set(backends.ECacheCategory.Pages, Url, "<html></html>")
+        self.assertEqual(self.Backend.Get(backends.ECacheCategory.Pages, Url), "<html></html>")
+
+    def test_GetSetMany(self):
+        Values = {f"https://example.com/page_{i}.html": f"Page {i}" for i in range(backends.SQLITE_MAX_VARIABLES * 2 + 1)}
+        self.Backend.SetMany(backends.ECacheCategory.Pages, Values)
+
+        Keys = list(Values) + ["https://example.com/missing.html"]
+        self.assertEqual(self.Backend.GetMany(backends.ECacheCategory.Pages, Keys), Values)
+        self.assertEqual(len(self.Backend.GetKeys(backends.ECacheCategory.Pages)), len(Values))
+
+    def test_Close(self):
+        """ The backend can still be used after it's been closed """
+        self.Backend.Set(backends.ECacheCategory.Pages, "Key", "Value")
+        self.Backend.Close()
+        self.assertEqual(self.Backend.Get(backends.ECacheCategory.Pages, "Key"), "Value")
+
+
+class TestFileCacheBackend(BackendTests, unittest.TestCase):
+    def CreateBackend(self):
+        return backends.FileCacheBackend(self.CacheDir)
+
+
+@unittest.skipIf(backends.sqlite3 is None, "The sqlite3 module is not available")
+class TestSqliteCacheBackend(BackendTests, unittest.TestCase):
+    def CreateBackend(self):
+        return backends.SqliteCacheBackend(os.path.join(self.CacheDir, cache.CACHE_DATABASE_FILENAME))
+
+    def test_WriteAheadLog(self):
+        self.Backend.Set(backends.ECacheCategory.Pages, "Key", "Value")
+        Connection = self.Backend._GetConnection()
+        self.assertEqual(Connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_Threads(self):
+        """ Each thread reads & writes with its own connection, while other threads are writing """
+        def Write(Index: int):
+            Values = {f"Key_{Index}_{i}": f"Value {Index} {i}" for i in range(50)}
+            self.Backend.SetMany(backends.ECacheCategory.ParsedPages, Values)
+            self.Backend.Set(backends.ECacheCategory.Pages, f"Key_{Index}", str(Index))
+            return self.Backend.GetMany(backends.ECacheCategory.ParsedPages, Values) == Values
+
+        with ThreadPoolExecutor(max_workers = 8) as Executor:
+            self.assertTrue(all(Executor.map(Write, range(32))))
+        self.assertLessEqual(len(self.Backend._Connections), 8)
+
+        self.assertEqual(len(self.Backend.GetKeys(backends.ECacheCategory.ParsedPages)), 32 * 50)
+        self.assertEqual(self.Backend.Get(backends.ECacheCategory.Pages, "Key_31"), "31")
+
+        # Another process' connection sees the committed values
+        Connection = backends.sqlite3.connect(self.Backend.Filepath)
+        try:
+            Count = Connection.execute("SELECT COUNT(*) FROM Entries").fetchone()[0]
+        finally:
+            Connection.close()
+        self.assertEqual(Count, 32 * 50 + 32)
+
+        self.Backend.Close()
+        self.assertEqual(self.Backend._Connections, [])
+
+
+class TestDocumentationCacheBackends(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        Patchers = (
+            mock.patch.object(tempfile, "tempdir", self.TempDir),
+            mock.patch.dict(os.environ, {cache.CACHE_BACKEND_ENV_VARIABLE: backends.ECacheBackend.Sqlite if backends.sqlite3 else backends.ECacheBackend.Files})
+        )
+        for Patcher in Patchers:
+            Patcher.start()
+            self.addCleanup(Patcher.stop)
+
+    def tearDown(self):
+        cache.CloseBackends()
+        shutil.rmtree(self.TempDir, ignore_errors = True)
+
+    def test_Reload(self):
+        """ Reloading the module keeps the open backend, so it's re-used and can still be closed """
+        Backend = cache.GetBackend()
+        cache.CacheUrl("https://example.com/page.html", "Content")
+
+        reload(cache)
+
+        self.assertIs(cache.GetBackend(), Backend)
+        self.assertEqual(cache.GetCachedContent("https://example.com/page.html"), "Content")
+
+        with mock.patch.object(Backend, "Close", wraps = Backend.Close) as Close:
+            cache.CloseBackends()
+        Close.assert_called_once()
+        self.assertIsNot(cache.GetBackend(), Backend)
+
+    def test_ParsedPages(self):
+        Page = {"Name": "FBModel", "Members": []}
+        cache.CacheParsedPages({"https://example.com/page.html": ("Hash", Page)}, "1")
+
+        self.assertEqual(cache.GetCachedParsedPage("https://example.com/page.html", "Hash", "1"), Page)
+        self.assertIsNone(cache.GetCachedParsedPage("https://example.com/page.html", "OtherHash", "1"))
+        self.assertIsNone(cache.GetCachedParsedPage("https://example.com/page.html", "Hash", "2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
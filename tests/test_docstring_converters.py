@@ -0,0 +1,64 @@
+"""
+Checks that `DoxygenDocstringConverter` gives the same docstrings as `DocstringMarkdownConverter` (markdownify).
+
+The Doxygen converter re-implements markdownify's conversion rules, so this fails if a markdownify update changes them.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import unittest
+import os
+
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import page_parser
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+BASE_URL = "https://help.autodesk.com/cloudhelp/2025/ENU/MOBU-PYTHON-API-REF/"
+
+
+def ReadFixture(Filename: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, Filename), "r", encoding="utf-8") as File:
+        return File.read()
+
+
+class TestDocstringConverters(unittest.TestCase):
+    def setUp(self):
+        self.PageHtml = ReadFixture("doxygen_class_page.html")
+
+    def GetDocumentationElements(self):
+        Parser = BeautifulSoup(self.PageHtml, page_parser.GetParserBackend(), parse_only = page_parser.PAGE_STRAINER)
+        return Parser.find_all("div", class_ = [page_parser.ClassNames.TextBlockDescription, page_parser.ClassNames.Doc])
+
+    def test_Page(self):
+        """ All docstrings in the page are the same with both converters """
+        self.assertEqual(len(self.GetDocumentationElements()), 7)
+
+        Differences = page_parser.CompareDocstringConverters(self.PageHtml, BASE_URL)
+        self.assertEqual(Differences, [], "\n\n".join(f"HTML:\n{Html}\n\nmarkdownify:\n{Expected}\n\ndoxygen:\n{Result}" for Html, Expected, Result in Differences))
+
+    def test_Fragments(self):
+        """ Every element in the docstrings gives the same result with both converters when converted on its own """
+        MarkdownifyConverter = page_parser.DocstringMarkdownConverter(BASE_URL, bUseCache = False)
+        DoxygenConverter = page_parser.DoxygenDocstringConverter(BASE_URL, bUseCache = False)
+
+        for Documentation in self.GetDocumentationElements():
+            for Element in Documentation.find_all(True):
+                with self.subTest(Html = str(Element)[:200]):
+                    self.assertEqual(DoxygenConverter.ConvertDocString(Element), MarkdownifyConverter.ConvertDocString(Element))
+
+    def test_ParsePage(self):
+        """ The parsed page is the same with both converters """
+        Pages = []
+        for ConverterName in (page_parser.EDocstringConverter.Markdownify, page_parser.EDocstringConverter.Doxygen):
+            with mock.patch.dict(os.environ, {page_parser.DOCSTRING_CONVERTER_ENV_VARIABLE: ConverterName}):
+                Pages.append(page_parser.ParsePage("FBModel", self.PageHtml, BASE_URL).ToDict())
+
+        self.assertEqual(Pages[0], Pages[1])
+        self.assertTrue(Pages[0]["DocString"].startswith("Model class."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Tests for the cache of converted docstrings, see `markdown_cache`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import tempfile
+import unittest
+import shutil
+import json
+import os
+
+from bs4 import BeautifulSoup
+
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import markdown_cache
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import page_parser
+
+VERSION = "1"
+
+
+class TestMarkdownCache(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        self.Filepath = os.path.join(self.TempDir, "cache", "markdown_cache.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.TempDir, ignore_errors = True)
+
+    def ReadEntries(self) -> dict[str, str]:
+        with open(self.Filepath, "r", encoding="utf-8") as File:
+            return json.load(File)["Entries"]
+
+    def test_GetKey(self):
+        Key = markdown_cache.MarkdownCache.GetKey("<p>Constructor.</p>", "markdownify", "https://example.com/")
+        self.assertEqual(Key, markdown_cache.MarkdownCache.GetKey("<p>Constructor.</p>", "markdownify", "https://example.com/"))
+        self.assertNotEqual(Key, markdown_cache.MarkdownCache.GetKey("<p>Constructor.</p>", "doxygen", "https://example.com/"))
+        self.assertNotEqual(Key, markdown_cache.MarkdownCache.GetKey("<p>Destructor.</p>", "markdownify", "https://example.com/"))
+
+        # Settings are separated, so they can't be combined in different ways to give the same key
+        self.assertNotEqual(markdown_cache.MarkdownCache.GetKey("", "ab", "c"), markdown_cache.MarkdownCache.GetKey("", "a", "bc"))
+
+    def test_GetSet(self):
+        Cache = markdown_cache.MarkdownCache()
+        self.assertIsNone(Cache.Get("Key"))
+        Cache.Set("Key", "Constructor.")
+        self.assertEqual(Cache.Get("Key"), "Constructor.")
+
+        self.assertEqual(Cache.GetStatistics(), {"Hits": 1, "Misses": 1, "HitRate": 0.5, "Entries": 1})
+
+        Cache.Clear()
+        self.assertIsNone(Cache.Get("Key"))
+        self.assertEqual(Cache.GetStatistics()["Entries"], 0)
+
+    def test_SaveLoad(self):
+        Cache = markdown_cache.MarkdownCache()
+        Cache.Set("A", "Constructor.")
+        Cache.Set("B", "Returns: The model")
+        Cache.Save(self.Filepath, VERSION)
+
+        LoadedCache = markdown_cache.MarkdownCache()
+        self.assertTrue(LoadedCache.Load(self.Filepath, VERSION))
+        self.assertEqual(LoadedCache.Get("A"), "Constructor.")
+        self.assertEqual(LoadedCache.Get("B"), "Returns: The model")
+
+        # Files saved by another version of the converter are ignored
+        self.assertFalse(markdown_cache.MarkdownCache().Load(self.Filepath, "2"))
+        self.assertFalse(markdown_cache.MarkdownCache().Load(os.path.join(self.TempDir, "missing.json"), VERSION))
+
+    def test_LoadInvalidFile(self):
+        os.makedirs(os.path.dirname(self.Filepath))
+        with open(self.Filepath, "w", encoding="utf-8") as File:
+            File.write("{")
+        self.assertFalse(markdown_cache.MarkdownCache().Load(self.Filepath, VERSION))
+
+    def test_Prune(self):
+        """ Entries that were loaded but not used are left out when the cache is saved """
+        Cache = markdown_cache.MarkdownCache()
+        for Key in "ABC":
+            Cache.Set(Key, f"DocString {Key}")
+        Cache.Save(self.Filepath, VERSION)
+
+        Cache = markdown_cache.MarkdownCache()
+        Cache.Load(self.Filepath, VERSION)
+        Cache.Get("A")
+        Cache.Set("D", "DocString D")
+        Cache.Save(self.Filepath, VERSION)
+
+        self.assertEqual(self.ReadEntries(), {"A": "DocString A", "D": "DocString D"})
+
+    def test_SaveUnchanged(self):
+        """ The file is not written again if all loaded entries were used and nothing was added """
+        Cache = markdown_cache.MarkdownCache()
+        Cache.Set("A", "DocString A")
+        Cache.Save(self.Filepath, VERSION)
+
+        Cache = markdown_cache.MarkdownCache()
+        Cache.Load(self.Filepath, VERSION)
+        Cache.Get("A")
+
+        ModifiedTime = os.path.getmtime(self.Filepath) - 10
+        os.utime(self.Filepath, (ModifiedTime, ModifiedTime))
+        Cache.Save(self.Filepath, VERSION)
+        self.assertEqual(os.path.getmtime(self.Filepath), ModifiedTime)
+
+        # Nothing that was loaded was used, so all entries are pruned
+        Cache = markdown_cache.MarkdownCache()
+        Cache.Load(self.Filepath, VERSION)
+        Cache.Save(self.Filepath, VERSION)
+        self.assertEqual(self.ReadEntries(), {})
+        self.assertEqual(os.listdir(os.path.dirname(self.Filepath)), ["markdown_cache.json"])
+
+    def test_SharedBetweenVersions(self):
+        """ Docstrings without links are shared between the documentation of different versions """
+        Cache = markdown_cache.GetMarkdownCache()
+        Cache.Clear()
+        self.addCleanup(Cache.Clear)
+
+        Html = '<div class="memdoc"><p>Constructor.</p></div>'
+        LinkHtml = '<div class="memdoc"><p>See <a href="classpyfbsdk_1_1_f_b_model.html">FBModel</a>.</p></div>'
+        DocStrings = {}
+        for Version in (2025, 2024):
+            Converter = page_parser.DocstringMarkdownConverter(f"https://help.autodesk.com/cloudhelp/{Version}/ENU/", bUseCache = True)
+            for Fragment in (Html, LinkHtml):
+                Element = BeautifulSoup(Fragment, "html.parser").div
+                DocStrings[(Version, Fragment)] = Converter.ConvertDocString(Element)
+
+        self.assertEqual(Cache.GetStatistics()["Hits"], 1)
+        self.assertEqual(DocStrings[(2025, Html)], DocStrings[(2024, Html)])
+        self.assertIn("cloudhelp/2025/", DocStrings[(2025, LinkHtml)])
+        self.assertIn("cloudhelp/2024/", DocStrings[(2024, LinkHtml)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Tests for the stub model classes, see `module_types`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import unittest
+import io
+
+from pyfbsdk_stub_generator import module_types
+from pyfbsdk_stub_generator.module_types import StubBase, StubClass, StubFunction, StubParameter, StubProperty
+
+
+def CreateFunction(Name: str, Parameters: list[tuple[str, str, str | None]], ReturnType: str | None = None) -> StubFunction:
+    """ Create a function, `Parameters` is a list of tuple(Name, Type, DefaultValue) """
+    return StubFunction(None, Name, [StubParameter(None, *Parameter) for Parameter in Parameters], ReturnType)
+
+
+class TestStubModel(unittest.TestCase):
+    def test_Slots(self):
+        """ The stubs use slots instead of a __dict__, since one is created for every parameter of every function """
+        Stubs = (StubFunction(None, "GetName"), StubClass(None, "FBModel"), StubProperty(None, "Name"), StubParameter(None, "Value"))
+        for Stub in Stubs:
+            with self.subTest(Stub = Stub):
+                self.assertFalse(hasattr(Stub, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    Stub.UnknownAttribute = True
+
+        for Class in (StubBase, StubClass, StubFunction, StubProperty, StubParameter):
+            with self.subTest(Class = Class):
+                self.assertIn("__slots__", vars(Class))
+
+    def test_Attributes(self):
+        Property = StubProperty(None, "Translation")
+        self.assertEqual((Property.Name, Property.DocString, Property.Type, Property.SetterType), ("Translation", "", "property", None))
+        Property.Type = "object"
+        self.assertEqual(Property.Type, "Any")
+        Property.Type = "FBPropertyAnimatableVector3d"
+        self.assertEqual(Property.Type, "FBPropertyAnimatableVector3d")
+
+        Parameter = StubParameter(None, "Model", "object")
+        self.assertIsNone(Parameter.Type)
+        Parameter.Type = "FBModel"
+        self.assertEqual(Parameter.Type, "FBModel")
+
+        Function = CreateFunction("GetModel", [], "object")
+        self.assertEqual(Function.ReturnType, "Any")
+        self.assertEqual((Function.bIsMethod, Function.bIsStatic, Function.bIsOverload), (False, False, False))
+
+    def test_Render(self):
+        Class = StubClass(None, "FBModel")
+        Class.AddParent("FBBox")
+        Class.DocString = "Model class."
+
+        Enum = StubClass(None, "ERotationOrder")
+        Enum.AddParent("Enumeration")
+        EnumValue = StubProperty(None, "kFBEulerXYZ")
+        EnumValue.Type = "FBModel.ERotationOrder"
+        Enum.AddProperty(EnumValue)
+        Class.AddEnum(Enum)
+
+        Property = StubProperty(None, "Visibility")
+        Property.Type = "FBPropertyBool"
+        Property.SetterType = "bool"
+        Class.AddProperty(Property)
+
+        Class.AddFunctions([CreateFunction("SetVector", [("arg1", "FBModel", None), ("Vector", "FBVector3d", None), ("Space", "FBModelTransformationType", "FBModelTransformationType.kModelTransformation")])])
+        Create = CreateFunction("Create", [("Name", "str", None)], "FBModel")
+        Class.AddFunctions([Create])
+        Create.bIsStatic = True
+        Create.bIsMethod = False
+
+        Expected = (
+            "class FBModel(FBBox):\n"
+            '    """Model class."""\n'
+            "    class ERotationOrder(Enumeration):\n"
+            "        kFBEulerXYZ:FBModel.ERotationOrder\n"
+            "    @property\n"
+            "    def Visibility(self)->FBPropertyBool:...\n"
+            "    @Visibility.setter\n"
+            "    def Visibility(self, Value: bool):...\n"
+            "    def SetVector(self,Vector:FBVector3d,Space:FBModelTransformationType=FBModelTransformationType.kModelTransformation,/):...\n"
+            "    @staticmethod\n"
+            "    def Create(Name:str,/)->FBModel:..."
+        )
+        self.assertEqual(Class.GetAsString(), Expected)
+
+        Writer = io.StringIO()
+        Class.Render(Writer)
+        self.assertEqual(Writer.getvalue(), Expected)
+
+        self.assertEqual(Class.GetRequirements(), ["FBBox", "FBModelTransformationType"])
+
+    def test_MemberLookups(self):
+        """ Members can be looked up by name, the first member with the name is used """
+        Class = StubClass(None, "FBModel")
+        GetName = [CreateFunction("GetName", [])]
+        Class.AddFunctions(GetName)
+        Class.AddFunctions([CreateFunction("GetName", [])])
+        Class.AddProperty(StubProperty(None, "Name"))
+        Class.AddProperty(StubProperty(None, "Name"))
+
+        self.assertIs(Class.GetFunctionsByName("GetName"), GetName)
+        self.assertTrue(Class.HasFunction("GetName"))
+        self.assertFalse(Class.HasFunction("SetName"))
+        self.assertEqual(Class.GetFunctionsByName("SetName"), [])
+        self.assertIs(Class.GetPropertyByName("Name"), Class.StubProperties[0])
+        self.assertIsNone(Class.GetPropertyByName("Translation"))
+        self.assertTrue(all(x.bIsMethod for x in Class.GetFunctionsFlat()))
+
+    def test_Indent(self):
+        self.assertEqual(module_types.Indent("a\nb"), "    a\n    b")
+
+
+if __name__ == "__main__":
+    unittest.main()
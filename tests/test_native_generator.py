@@ -0,0 +1,99 @@
+"""
+Tests for the module introspection, see `native_generator`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import unittest
+import inspect
+
+from types import ModuleType
+
+from pyfbsdk_stub_generator import native_generator
+
+
+def CreateModule() -> ModuleType:
+    """ Create a module with the same kind of members as pyfbsdk: Boost.Python classes, enums & functions """
+    BoostClassType = type("class", (type,), {})
+    Instance = BoostClassType("instance", (object,), {})
+    Enum = type("enum", (int,), {})
+
+    def FBSystem():
+        ...
+
+    def _FBPrivate():
+        ...
+
+    Module = ModuleType("pyfbsdk")
+    Module.FBComponent = BoostClassType("FBComponent", (Instance,), {})
+    Module.FBModel = BoostClassType("FBModel", (Module.FBComponent,), {})
+    Module.FBColorIndex = type("FBColorIndex", (Enum,), {})
+    Module.FBAttachType = type("FBAttachType", (Enum,), {})
+    Module.FBSystem = FBSystem
+    Module._FBPrivate = _FBPrivate
+    Module.kFBMaxValue = 100
+    return Module
+
+
+class TestModuleInventory(unittest.TestCase):
+    def setUp(self):
+        self.Module = CreateModule()
+
+    def test_Classification(self):
+        Inventory = native_generator.ModuleInventory(self.Module)
+
+        self.assertEqual(Inventory.ModuleName, "pyfbsdk")
+        self.assertEqual([x.__name__ for x in Inventory.Classes], ["FBComponent", "FBModel"])
+        self.assertEqual([x.__name__ for x in Inventory.Enums], ["FBAttachType", "FBColorIndex"])
+        self.assertEqual([x.__name__ for x in Inventory.Functions], ["FBSystem"])
+        self.assertEqual(Inventory.ClassNames, ["FBComponent", "FBModel", "FBAttachType", "FBColorIndex"])
+
+    def test_SameAsGetMembers(self):
+        """ Members are classified the same way as separate `inspect.getmembers` passes for each type """
+        Inventory = native_generator.ModuleInventory(self.Module)
+
+        def GetMembers(Type: str):
+            return [x for _, x in inspect.getmembers(self.Module) if native_generator.GetObjectType(x) == Type]
+
+        self.assertEqual(Inventory.Classes, GetMembers(native_generator.FObjectType.Class))
+        self.assertEqual(Inventory.Enums, GetMembers(native_generator.FObjectType.Enum))
+        self.assertEqual(Inventory.Functions, [x for x in GetMembers(native_generator.FObjectType.Function) if not native_generator.IsPrivate(x)])
+
+    def test_HasClass(self):
+        Inventory = native_generator.ModuleInventory(self.Module)
+        self.assertTrue(Inventory.HasClass("FBModel"))
+        self.assertTrue(Inventory.HasClass("FBColorIndex"))
+        self.assertFalse(Inventory.HasClass("FBColorIndex", bIncludeEnums = False))
+        self.assertTrue(Inventory.HasClass("FBModel", bIncludeEnums = False))
+        self.assertFalse(Inventory.HasClass("FBSystem"))
+
+    def test_Shared(self):
+        """ The inventory is only created once per module, unless it's refreshed """
+        Inventory = native_generator.GetModuleInventory(self.Module)
+        self.assertIs(native_generator.GetModuleInventory(self.Module), Inventory)
+        self.assertIsNot(native_generator.GetModuleInventory(CreateModule()), Inventory)
+
+        self.Module.FBCamera = type(self.Module.FBModel)("FBCamera", (self.Module.FBModel,), {})
+        self.assertFalse(native_generator.GetModuleInventory(self.Module).HasClass("FBCamera"))
+        self.assertTrue(native_generator.GetModuleInventory(self.Module, bRefresh = True).HasClass("FBCamera"))
+
+    def test_GetModuleContent(self):
+        """ Returns copies of the lists, so the shared inventory can't be modified """
+        Functions, Classes, Enums = native_generator.GetModuleContent(self.Module)
+        Classes.clear()
+
+        Inventory = native_generator.GetModuleInventory(self.Module)
+        self.assertEqual(len(Inventory.Classes), 2)
+        self.assertEqual(Functions, Inventory.Functions)
+        self.assertEqual(Enums, Inventory.Enums)
+
+    def test_GenerateModuleSubs(self):
+        Enums, Classes, Functions = native_generator.GenerateModuleSubs(self.Module)
+        self.assertEqual([x.Name for x in Enums], ["FBAttachType", "FBColorIndex"])
+        self.assertEqual([x.Name for x in Classes], ["FBComponent", "FBModel"])
+        self.assertEqual([x.Parents for x in Classes], [[""], ["FBComponent"]])
+        self.assertEqual(len(Functions), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
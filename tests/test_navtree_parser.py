@@ -0,0 +1,74 @@
+"""
+Tests for parsing the Doxygen navtree scripts with the table of contents, see `navtree_parser`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import unittest
+import os
+
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import navtree_parser
+from pyfbsdk_stub_generator.plugins.online_documentation.documentation_scraper import table_of_contents
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def ReadFixture(Filename: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, Filename), "r", encoding="utf-8") as File:
+        return File.read()
+
+
+class TestNavTreeParser(unittest.TestCase):
+    def setUp(self):
+        self.Script = ReadFixture("namespacepyfbsdk.js")
+
+    def test_Parse(self):
+        Items = navtree_parser.ParseNavTree(self.Script)
+
+        self.assertEqual(len(Items), 13)
+        self.assertTrue(all(len(Item) == 3 for Item in Items))
+        self.assertEqual(Items[1], ["FBActionManager", "classpyfbsdk_1_1_f_b_action_manager.html", "classpyfbsdk_1_1_f_b_action_manager"])
+        self.assertEqual(Items[2], ["FBAddRegionParam", "namespacepyfbsdk.html#a6dc4b2b0e8a1e7b9b1f0f0b6c1a9d2f1", None])
+
+        # Nested arrays, e.g. the values of an enum
+        self.assertEqual([x[0] for x in Items[0][2]], ["kFBAccessModeNone", "kFBAccessModeDisk", "kFBAccessModeMemory"])
+
+        # Single quoted strings & escape sequences
+        self.assertEqual(Items[9], ["FBPropertyAnimatableVector3d", "classpyfbsdk_1_1_f_b_property_animatable_vector3d.html", 'Vector "3d" !'])
+
+    @unittest.skipIf(table_of_contents.js2py is None, "js2py is not installed")
+    def test_SameAsJavaScript(self):
+        """ Gives the same result as evaluating the script with js2py, which was used before """
+        Expected = table_of_contents.js2py.eval_js(self.Script).to_list()
+        self.assertEqual(navtree_parser.ParseNavTree(self.Script), Expected)
+
+    def test_Values(self):
+        self.assertEqual(navtree_parser.ParseNavTree("[1, -2.5, 1e3, true, false, undefined, null, [], [[]]]"), [1, -2.5, 1000.0, True, False, None, None, [], [[]]])
+        self.assertEqual(navtree_parser.ParseNavTree("var a = ['\\n\\t', \"\\u00e5\"];"), ["\n\t", "å"])
+
+    def test_Errors(self):
+        for Script in (
+            "",
+            "var a = [",
+            "var a = [1 2]",
+            "var = [1]",
+            "var a = [1]; var b = [2];",
+            "var a = [foo()]",
+            "var a = [\"unterminated]",
+        ):
+            with self.subTest(Script = Script):
+                with self.assertRaises(navtree_parser.NavTreeParseError):
+                    navtree_parser.ParseNavTree(Script)
+
+    def test_TableOfContents(self):
+        """ The table of content items are created from the parsed script """
+        Items = [table_of_contents.TableOfContentItem(Data, 2025) for Data in table_of_contents.ParseTableOfContentsScript(self.Script)]
+
+        Names = [x.Name for x in Items]
+        self.assertEqual(Names[:3], ["FBAccessMode", "FBActionManager", "FBAddRegionParam"])
+        self.assertEqual(Items[6].GetContentUrl(), "https://help.autodesk.com/cloudhelp/2025/ENU/MOBU-PYTHON-API-REF/classpyfbsdk_1_1_f_b_model.html")
+        self.assertEqual(Items[7].GetContentUrl(), "https://help.autodesk.com/cloudhelp/2025/ENU/MOBU-PYTHON-API-REF/namespacepyfbsdk.html")
+
+
+if __name__ == "__main__":
+    unittest.main()
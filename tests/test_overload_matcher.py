@@ -0,0 +1,110 @@
+"""
+Tests for matching function overloads with their documented members, see `overload_matcher`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import itertools
+import unittest
+import random
+
+from pyfbsdk_stub_generator.plugins.online_documentation import overload_matcher
+
+
+def GetScores(FunctionTypes, MemberTypes) -> dict[tuple[int, int], int]:
+    """ The compatible pairs and their score, the same way as `MatchOverloads` """
+    Scores = {}
+    for FunctionIndex, Types in enumerate(FunctionTypes):
+        for MemberIndex, ValidatedTypes in enumerate(MemberTypes):
+            Score = overload_matcher.GetMatchScore(Types, ValidatedTypes)
+            if Score > 0:
+                Scores[(FunctionIndex, MemberIndex)] = Score
+    return Scores
+
+
+def GetBruteForceMaxScore(Scores: dict[tuple[int, int], int], FunctionCount: int, MemberCount: int) -> int:
+    """ The highest total score of any assignment, by trying all of them """
+    BestScore = 0
+    for Members in itertools.permutations(list(range(MemberCount)) + [None] * FunctionCount, FunctionCount):
+        BestScore = max(BestScore, sum(Scores.get((FunctionIndex, MemberIndex), 0) for FunctionIndex, MemberIndex in enumerate(Members)))
+    return BestScore
+
+
+class TestOverloadMatcher(unittest.TestCase):
+    def test_PerfectMatches(self):
+        # FBVector3d.__init__ overloads and the documented constructors
+        FunctionTypes = [[], ["FBVector3d"], ["float", "float", "float"], ["list"]]
+        MemberTypes = [["float", "float", "float"], [], ["list[float]"], ["FBVector3d"]]
+        self.assertEqual(overload_matcher.GetPerfectMatches(FunctionTypes, MemberTypes), [(0, 1), (1, 3), (2, 0)])
+
+    def test_PerfectMatchesDuplicates(self):
+        """ Each function is matched with the first member with the same types that hasn't been matched yet """
+        FunctionTypes = [["float"], ["FBMatrix"], ["float"], ["float"]]
+        MemberTypes = [["float"], ["float"], ["FBMatrix"], ["FBMatrix"]]
+        self.assertEqual(overload_matcher.GetPerfectMatches(FunctionTypes, MemberTypes), [(0, 0), (1, 2), (2, 1)])
+
+    def test_MatchOverloads(self):
+        # The `list` overload is only matched by its score, since the documented type is `list[float]`
+        FunctionTypes = [[], ["FBVector3d"], ["float", "float", "float"], ["list"]]
+        MemberTypes = [["float", "float", "float"], [], ["list[float]"], ["FBVector3d"]]
+        self.assertEqual(overload_matcher.MatchOverloads(FunctionTypes, MemberTypes, MemberTypes), [(0, 1), (1, 3), (2, 0), (3, 2)])
+
+    def test_Operators(self):
+        # FBMatrix.__mul__ overloads, where the documentation doesn't include the types of all parameters
+        FunctionTypes = [["FBMatrix"], ["FBVector4d"], ["float"]]
+        MemberTypes = [["float"], [None], ["FBMatrix"]]
+        self.assertEqual(overload_matcher.MatchOverloads(FunctionTypes, MemberTypes, MemberTypes), [(0, 2), (2, 0), (1, 1)])
+
+    def test_GreedyTieBreaking(self):
+        """ Pairs with the same score are matched in the order they were added """
+        Scores = {(1, 0): 2, (0, 0): 2, (0, 1): 1, (1, 1): 1}
+        self.assertEqual(overload_matcher.GetGreedyMatches(Scores), [(1, 0), (0, 1)])
+
+        Scores = {(0, 1): 1, (0, 0): 1, (1, 0): 1, (1, 1): 1}
+        self.assertEqual(overload_matcher.GetGreedyMatches(Scores), [(0, 1), (1, 0)])
+
+    def test_GreedyKeptWhenOptimal(self):
+        """ The greedy result is used if the optimal assignment isn't better """
+        FunctionTypes = [["object"], ["object"]]
+        MemberTypes = [["FBVector3d"], ["FBVector4d"]]
+        Scores = GetScores(FunctionTypes, MemberTypes)
+        self.assertEqual(len(Scores), 4)
+
+        self.assertEqual(overload_matcher.MatchOverloads(FunctionTypes, MemberTypes, MemberTypes), overload_matcher.GetGreedyMatches(Scores))
+
+    def test_OptimalBetterThanGreedy(self):
+        """ The greedy matching takes the member that the second overload needs, the optimal assignment matches both """
+        # FBMatrix.__init__(FBMatrix) & FBMatrix.__init__(object, object)
+        FunctionTypes = [["FBMatrix"], ["object", "object"]]
+        MemberTypes = [["FBMatrix", "bool"], [None]]
+        Scores = GetScores(FunctionTypes, MemberTypes)
+        self.assertEqual(Scores, {(0, 0): 1, (0, 1): 1, (1, 0): 1})
+
+        GreedyMatches = overload_matcher.GetGreedyMatches(Scores)
+        self.assertEqual(GreedyMatches, [(0, 0)])
+
+        OptimalMatches = overload_matcher.GetOptimalMatches(Scores)
+        self.assertEqual(OptimalMatches, [(0, 1), (1, 0)])
+        self.assertGreater(overload_matcher.GetTotalScore(OptimalMatches, Scores), overload_matcher.GetTotalScore(GreedyMatches, Scores))
+
+        self.assertEqual(overload_matcher.MatchOverloads(FunctionTypes, MemberTypes, MemberTypes), [(0, 1), (1, 0)])
+
+    def test_OptimalMatches(self):
+        """ The optimal assignment has the highest possible total score, compared with trying all assignments """
+        Types = ["float", "int", "FBVector3d", "FBMatrix", "list", "object", None]
+        Random = random.Random(0)
+        for Index in range(300):
+            FunctionTypes = [[Random.choice(Types[:-1]) for _ in range(Random.randint(0, 3))] for _ in range(Random.randint(1, 5))]
+            MemberTypes = [[Random.choice(Types) for _ in range(Random.randint(0, 3))] for _ in range(Random.randint(1, 5))]
+            Scores = GetScores(FunctionTypes, MemberTypes)
+
+            with self.subTest(Index = Index, FunctionTypes = FunctionTypes, MemberTypes = MemberTypes):
+                Matches = overload_matcher.GetOptimalMatches(Scores)
+                self.assertTrue(all(Pair in Scores for Pair in Matches))
+                self.assertEqual(len({x[0] for x in Matches}), len(Matches))
+                self.assertEqual(len({x[1] for x in Matches}), len(Matches))
+                self.assertEqual(overload_matcher.GetTotalScore(Matches, Scores), GetBruteForceMaxScore(Scores, len(FunctionTypes), len(MemberTypes)))
+
+
+if __name__ == "__main__":
+    unittest.main()
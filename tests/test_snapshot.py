@@ -0,0 +1,159 @@
+"""
+Tests for exporting & loading introspection snapshots, see `snapshot`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import tempfile
+import unittest
+import shutil
+import gzip
+import json
+import sys
+import os
+
+from types import ModuleType
+from unittest import mock
+
+from pyfbsdk_stub_generator import snapshot
+from pyfbsdk_stub_generator import stub_generator
+
+VERSION = 2025
+
+
+def CreateFunction(Name: str, DocString: str, bIsStatic = False):
+    """ Create a function the same way as Boost.Python does, with the signatures in the docstring """
+    def _Function(*args):
+        ...
+    _Function.__name__ = Name
+    _Function.__doc__ = DocString
+    return staticmethod(_Function) if bIsStatic else _Function
+
+
+def CreateModule() -> ModuleType:
+    """ Create a module with the same structure as pyfbsdk, with Boost.Python like classes, enums & functions """
+    BoostClassType = type("class", (type,), {})
+    Instance = BoostClassType("instance", (object,), {"__module__": "Boost.Python"})
+    Enum = type("enum", (int,), {"__module__": "Boost.Python", "name": property(lambda self: "")})
+
+    def CreateEnum(Name: str, Values: list[str]):
+        EnumClass = type(Name, (Enum,), {"__module__": "pyfbsdk"})
+        for Index, ValueName in enumerate(Values):
+            setattr(EnumClass, ValueName, int.__new__(EnumClass, Index))
+        return EnumClass
+
+    FBColor = CreateEnum("FBColorIndex", ["kFBColorIndexBackground", "kFBColorIndexForeground"])
+
+    FBComponent = BoostClassType("FBComponent", (Instance,), {
+        "__module__": "pyfbsdk",
+        "__init__": CreateFunction("__init__", "__init__( (object)arg1) -> None"),
+        "GetName": CreateFunction("GetName", "GetName( (FBComponent)arg1) -> str"),
+        "Create": CreateFunction("Create", "Create( (str)arg1) -> FBComponent", bIsStatic = True),
+        "Name": property(lambda self: ""),
+    })
+    FBModel = BoostClassType("FBModel", (FBComponent,), {
+        "__module__": "pyfbsdk",
+        "__init__": CreateFunction("__init__", "__init__( (object)arg1, (str)arg2) -> None\n\n__init__( (object)arg1, (FBModel)arg2) -> None"),
+        "__getitem__": CreateFunction("__getitem__", "__getitem__( (FBModel)arg1, (int)arg2) -> FBModel"),
+        "Translation": property(lambda self: None),
+        "ERotationOrder": CreateEnum("ERotationOrder", ["kFBEulerXYZ", "kFBEulerXZY"]),
+        "Colors": (1, 2.5, "Red"),
+    })
+
+    Module = ModuleType("pyfbsdk")
+    Module.FBColorIndex = FBColor
+    Module.FBComponent = FBComponent
+    Module.FBModel = FBModel
+    Module.FBGetSelectedModels = CreateFunction("FBGetSelectedModels", "FBGetSelectedModels( (FBModelList)arg1 [, (FBModel)arg2=None]) -> None")
+    Module.FBSystem = CreateFunction("FBSystem", "FBSystem() -> FBComponent")
+    Module.kFBMaxValue = 100
+    Module.kFBVersionString = "2025"
+    Module.kFBDefaultColor = FBColor.kFBColorIndexForeground
+    Module.print = print
+    return Module
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.TempDir = tempfile.mkdtemp()
+        self.Filepath = os.path.join(self.TempDir, "pyfbsdk_2025.json.gz")
+        self.Module = CreateModule()
+
+    def tearDown(self):
+        shutil.rmtree(self.TempDir, ignore_errors = True)
+
+    def ExportAndLoad(self) -> tuple[ModuleType, int]:
+        snapshot.ExportSnapshot(self.Module, self.Filepath, VERSION)
+        return snapshot.LoadSnapshot(self.Filepath, bRegisterModule = False)
+
+    def test_RoundTrip(self):
+        Module, Version = self.ExportAndLoad()
+        self.assertEqual(Version, VERSION)
+        self.assertEqual(Module.__name__, "pyfbsdk")
+
+        # Classes keep their names, metaclasses & bases
+        self.assertEqual(type(Module.FBModel).__name__, "class")
+        self.assertEqual(Module.FBModel.__bases__, (Module.FBComponent,))
+        self.assertEqual(Module.FBComponent.__bases__[0].__name__, "instance")
+        self.assertEqual(type(Module.FBColorIndex).__name__, "type")
+        self.assertEqual(Module.FBColorIndex.__bases__[0].__name__, "enum")
+
+        # Functions keep their names, docstrings & if they are static
+        self.assertEqual(Module.FBModel.__init__.__doc__, self.Module.FBModel.__init__.__doc__)
+        self.assertEqual(Module.FBGetSelectedModels.__name__, "FBGetSelectedModels")
+        self.assertIsInstance(vars(Module.FBComponent)["Create"], staticmethod)
+        self.assertNotIsInstance(vars(Module.FBComponent)["GetName"], staticmethod)
+        with self.assertRaises(NotImplementedError):
+            Module.FBSystem()
+
+        # Enums values are instances of the enum, including nested enums
+        self.assertIsInstance(Module.FBColorIndex.kFBColorIndexForeground, Module.FBColorIndex)
+        self.assertEqual(int(Module.FBColorIndex.kFBColorIndexForeground), 1)
+        self.assertIsInstance(Module.FBModel.ERotationOrder.kFBEulerXZY, Module.FBModel.ERotationOrder)
+        self.assertIs(type(Module.kFBDefaultColor), Module.FBColorIndex)
+
+        # Values & other objects
+        self.assertEqual(Module.kFBMaxValue, 100)
+        self.assertEqual(Module.kFBVersionString, "2025")
+        self.assertEqual(Module.FBModel.Colors, (1, 2.5, "Red"))
+        self.assertEqual(type(vars(Module.FBModel)["Translation"]).__name__, "property")
+        self.assertEqual(type(Module.print).__name__, "builtin_function_or_method")
+
+    def test_SameStubFile(self):
+        """ The stub file generated from the loaded snapshot is the same as for the module it was created from """
+        Module, Version = self.ExportAndLoad()
+
+        Expected = stub_generator.StubGenerator(self.Module, Plugins = None, Version = VERSION).GenerateString()
+        Result = stub_generator.StubGenerator(Module, Plugins = None, Version = Version).GenerateString()
+
+        self.assertIn("class FBModel(FBComponent):", Expected)
+        self.assertEqual(Result, Expected)
+
+    def test_RegisterModule(self):
+        snapshot.ExportSnapshot(self.Module, self.Filepath, VERSION)
+
+        with mock.patch.dict(sys.modules):
+            sys.modules.pop("pyfbsdk", None)
+            Module, _ = snapshot.LoadSnapshot(self.Filepath)
+            self.assertIs(sys.modules["pyfbsdk"], Module)
+
+            # An already imported module is not replaced
+            OtherModule, _ = snapshot.LoadSnapshot(self.Filepath)
+            self.assertIs(sys.modules["pyfbsdk"], Module)
+            self.assertIsNot(OtherModule, Module)
+
+    def test_FormatVersion(self):
+        snapshot.ExportSnapshot(self.Module, self.Filepath, VERSION)
+        with gzip.open(self.Filepath, "rt", encoding="utf-8") as File:
+            Data = json.load(File)
+
+        Data["FormatVersion"] = snapshot.SNAPSHOT_FORMAT_VERSION + 1
+        with gzip.open(self.Filepath, "wt", encoding="utf-8") as File:
+            json.dump(Data, File)
+
+        with self.assertRaises(ValueError):
+            snapshot.LoadSnapshot(self.Filepath, bRegisterModule = False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for sorting the classes so they are defined after the classes they require, see `stub_generator.SortClasses`.
+Run with: python -m pytest tests
+"""
+from __future__ import annotations
+
+import contextlib
+import unittest
+import random
+import io
+
+from pyfbsdk_stub_generator import stub_generator
+from pyfbsdk_stub_generator.module_types import StubClass
+
+
+def CreateClass(Name: str, Parents: list[str]) -> StubClass:
+    Class = StubClass(None, Name)
+    for Parent in Parents:
+        Class.AddParent(Parent)
+    return Class
+
+
+def CreateHierarchy(Random: random.Random, Count: int) -> list[StubClass]:
+    """ Create classes in alphabetical order, with parents that are often defined after the class itself """
+    Names = [f"FBClass{Index:05}" for Index in range(Count)]
+    Parents: dict[str, list[str]] = {}
+    for Index in Random.sample(range(Count), Count):
+        Candidates = list(Parents)
+        ClassParents = []
+        if Candidates and Random.random() < 0.8:
+            ClassParents = Random.sample(Candidates, min(len(Candidates), Random.choice((1, 1, 1, 2))))
+        if Random.random() < 0.2:
+            ClassParents.append("Enumeration")  # Defined outside of the sorted classes
+        Parents[Names[Index]] = ClassParents
+
+    return [CreateClass(Name, Parents[Name]) for Name in Names]
+
+
+def ListSortClasses(Classes: list[StubClass]) -> list[StubClass]:
+    """ The list based sort that `SortClasses` replaced, it gives the order that should be kept """
+    ClassNames = [x.Name for x in Classes]
+
+    i = 0
+    while i < len(Classes):
+        Requirements = Classes[i].GetRequirements()
+        if Requirements:
+            RequiredIndices = [ClassNames.index(x) for x in Requirements if x in ClassNames]
+            RequiredMaxIndex = max(RequiredIndices) if RequiredIndices else -1
+
+            if RequiredMaxIndex > i:
+                Classes.insert(RequiredMaxIndex + 1, Classes.pop(i))
+                ClassNames.insert(RequiredMaxIndex + 1, ClassNames.pop(i))
+                i -= 1
+
+        i += 1
+
+    return Classes
+
+
+class TestSortClasses(unittest.TestCase):
+    def assertRequirementsFirst(self, Classes: list[StubClass]):
+        Defined = set()
+        AllNames = {x.Name for x in Classes}
+        for Class in Classes:
+            for Requirement in Class.GetRequirements():
+                if Requirement in AllNames:
+                    self.assertIn(Requirement, Defined, f"{Class.Name} is defined before {Requirement}")
+            Defined.add(Class.Name)
+
+    def test_Sort(self):
+        Classes = [
+            CreateClass("FBAnimationNode", ["FBComponent"]),
+            CreateClass("FBBox", ["FBAnimationNode"]),
+            CreateClass("FBComponent", ["FBPlug"]),
+            CreateClass("FBModel", ["FBBox"]),
+            CreateClass("FBPlug", [""]),
+        ]
+        Names = [x.Name for x in stub_generator.SortClasses(Classes)]
+        self.assertEqual(Names, ["FBPlug", "FBComponent", "FBAnimationNode", "FBBox", "FBModel"])
+
+    def test_SameOrderAsListSort(self):
+        """ Gives the exact same order as the list based sort it replaced """
+        Random = random.Random(0)
+        for Index in range(200):
+            Classes = CreateHierarchy(Random, Random.randint(1, 60))
+            with self.subTest(Index = Index):
+                Expected = [x.Name for x in ListSortClasses(list(Classes))]
+                Result = stub_generator.SortClasses(list(Classes))
+                self.assertEqual([x.Name for x in Result], Expected)
+                self.assertRequirementsFirst(Result)
+
+    def test_LargeHierarchy(self):
+        Classes = CreateHierarchy(random.Random(1), 5000)
+        Result = stub_generator.SortClasses(list(Classes))
+        self.assertEqual(len(Result), len(Classes))
+        self.assertRequirementsFirst(Result)
+
+    def test_Cycles(self):
+        """ Classes with circular requirements are placed last, with a warning, instead of sorting forever """
+        Classes = [
+            CreateClass("A", ["B"]),
+            CreateClass("B", ["A"]),
+            CreateClass("C", ["D"]),
+            CreateClass("D", []),
+            CreateClass("E", ["A"]),
+        ]
+
+        Output = io.StringIO()
+        with contextlib.redirect_stdout(Output):
+            Names = [x.Name for x in stub_generator.SortClasses(Classes)]
+
+        self.assertEqual(Names, ["D", "C", "A", "B", "E"])
+        self.assertIn("Warning:", Output.getvalue())
+        self.assertIn("A, B, E", Output.getvalue())
+
+    def test_SelfRequirement(self):
+        """ A class that requires itself (e.g. a method that returns the class) is not a cycle """
+        Classes = [CreateClass("FBModel", ["FBModel", "FBComponent"]), CreateClass("FBComponent", [])]
+        Output = io.StringIO()
+        with contextlib.redirect_stdout(Output):
+            Names = [x.Name for x in stub_generator.SortClasses(Classes)]
+
+        self.assertEqual(Names, ["FBComponent", "FBModel"])
+        self.assertEqual(Output.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()